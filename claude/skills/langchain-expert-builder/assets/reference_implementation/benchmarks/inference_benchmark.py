@@ -0,0 +1,265 @@
+"""
+Throughput/latency benchmarks for the expert framework, driven by FakeChatModel.
+
+PATTERN DEMONSTRATED: Provider-free, reproducible performance measurement
+
+Three benchmarks, each run at every requested concurrency level:
+- perform_inference: Wall time, throughput and per-request latency percentiles for a batch of
+  `concurrency` requests against a fake model with a fixed latency profile
+- invoke_expert overhead: Per-task cost of ainvoke_expert() on top of the raw inference call
+  (JSON debug logging, tool execution, context appends), measured with a zero-latency model
+- TransformCodeValidator.validate: Cost of validating one generated transform
+
+Results are written as JSON so runs can be diffed between releases.
+
+Usage (from the reference_implementation directory):
+    python -m benchmarks.inference_benchmark --output benchmark_results.json
+    python -m benchmarks.inference_benchmark --concurrency 1 10 100 --latency-ms 20
+"""
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+import json
+import logging
+import platform
+import statistics
+import time
+from typing import Any, Dict, List
+
+import langchain_core
+from langchain_core.messages import HumanMessage
+
+from core.experts import Expert, ainvoke_expert
+from core.inference import InferenceRequest, aperform_inference
+from core.telemetry import InferenceObservation, MetricsSink
+from json_transformer_expert.fakes import get_fake_transform_expert
+from json_transformer_expert.models import TransformCode
+from json_transformer_expert.task_def import TransformTask
+from json_transformer_expert.validators import TransformCodeValidator
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY_LEVELS = [1, 10, 100, 1000]
+DEFAULT_LATENCY_MS = 50.0  # Fake model latency; small enough that a full run takes seconds
+VALIDATION_ITERATIONS = 200
+
+SOURCE_JSON = json.dumps({
+    "user": {"id": 42, "email": "ada@example.com", "name": {"first": "Ada", "last": "Lovelace"}},
+    "event": {"type": "login", "timestamp": "2024-01-01T00:00:00Z", "success": True}
+})
+TARGET_SCHEMA = "user.id, user.email, user.name.first, user.name.last, event.type, event.timestamp, event.success"
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    One benchmark measurement.
+
+    Attributes:
+        benchmark: Benchmark name
+        concurrency: Number of requests/tasks in flight together (1 for single-threaded benchmarks)
+        operations: Number of operations measured
+        wall_seconds: Total elapsed time
+        throughput_per_second: operations / wall_seconds
+        latency_p50_ms / latency_p99_ms / latency_mean_ms: Per-operation latency
+        extra: Benchmark-specific values
+    """
+    benchmark: str
+    concurrency: int
+    operations: int
+    wall_seconds: float
+    throughput_per_second: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    latency_mean_ms: float
+    extra: Dict[str, Any]
+
+
+async def benchmark_perform_inference(concurrency: int, latency_ms: float) -> BenchmarkResult:
+    """Run one batch of `concurrency` requests through aperform_inference()."""
+    expert = _make_expert(latency_ms)
+    recorder = _LatencyRecorder()
+    expert.inference_config.metrics = recorder
+    requests = [
+        InferenceRequest(task_id=str(index), context=_make_task(index, expert).context)
+        for index in range(concurrency)
+    ]
+
+    start = time.perf_counter()
+    results = await aperform_inference(expert.llm, requests, expert.inference_config)
+    wall_seconds = time.perf_counter() - start
+
+    return _to_result(
+        "perform_inference", concurrency, recorder.latencies, wall_seconds,
+        extra={
+            "fake_latency_ms": latency_ms,
+            "failures": sum(1 for result in results if not result.succeeded),
+            "overhead_vs_fake_latency_ms": round(wall_seconds * 1000 - latency_ms, 3)
+        }
+    )
+
+
+async def benchmark_invoke_expert_overhead(concurrency: int) -> BenchmarkResult:
+    """
+    Per-task cost of ainvoke_expert() beyond the raw inference call.
+
+    Uses a zero-latency model so the measurement is all framework work: the same requests are
+    sent once through aperform_inference() and once through ainvoke_expert(), and the
+    difference is the overhead.
+    """
+    expert = _make_expert(latency_ms=0.0)
+
+    raw_requests = [
+        InferenceRequest(task_id=str(index), context=_make_task(index, expert).context)
+        for index in range(concurrency)
+    ]
+    start = time.perf_counter()
+    await aperform_inference(expert.llm, raw_requests, expert.inference_config)
+    raw_seconds = time.perf_counter() - start
+
+    tasks = [_make_task(index, expert) for index in range(concurrency)]
+    latencies = []
+
+    async def timed(task: TransformTask):
+        start = time.perf_counter()
+        await ainvoke_expert(expert, task)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[timed(task) for task in tasks])
+    expert_seconds = time.perf_counter() - start
+
+    return _to_result(
+        "invoke_expert_overhead", concurrency, latencies, expert_seconds,
+        extra={
+            "raw_inference_seconds": round(raw_seconds, 6),
+            "overhead_per_task_ms": round((expert_seconds - raw_seconds) * 1000 / concurrency, 4)
+        }
+    )
+
+
+def benchmark_validation(transform_code: TransformCode, iterations: int = VALIDATION_ITERATIONS) -> BenchmarkResult:
+    """Time TransformCodeValidator.validate() on a representative generated transform."""
+    latencies = []
+    passed = True
+    start = time.perf_counter()
+    for _ in range(iterations):
+        iteration_start = time.perf_counter()
+        passed = TransformCodeValidator(SOURCE_JSON, transform_code).validate().passed and passed
+        latencies.append(time.perf_counter() - iteration_start)
+    wall_seconds = time.perf_counter() - start
+
+    return _to_result("transform_code_validation", 1, latencies, wall_seconds, extra={"passed": passed})
+
+
+async def run_benchmarks(concurrency_levels: List[int], latency_ms: float) -> Dict[str, Any]:
+    """
+    Run every benchmark at every concurrency level.
+
+    Returns:
+        JSON-serializable report with run metadata and one entry per measurement
+    """
+    results: List[BenchmarkResult] = []
+    for concurrency in concurrency_levels:
+        logger.info(f"Benchmarking at concurrency {concurrency}")
+        results.append(await benchmark_perform_inference(concurrency, latency_ms))
+        results.append(await benchmark_invoke_expert_overhead(concurrency))
+
+    # Generate the transform under test the same way the pipeline would
+    expert = _make_expert(latency_ms=0.0)
+    task = await ainvoke_expert(expert, _make_task(0, expert))
+    results.append(benchmark_validation(task.transform_code))
+
+    return {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "langchain_core": langchain_core.__version__,
+            "concurrency_levels": concurrency_levels,
+            "fake_latency_ms": latency_ms
+        },
+        "results": [asdict(result) for result in results]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the expert framework against a fake LLM")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY_LEVELS)
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Keep per-stage validation/inference logs out of the benchmark output (and its timings)
+    logging.getLogger("core").setLevel(logging.WARNING)
+    logging.getLogger("json_transformer_expert").setLevel(logging.WARNING)
+    report = asyncio.run(run_benchmarks(args.concurrency, args.latency_ms))
+
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+
+    for result in report["results"]:
+        logger.info(
+            f"{result['benchmark']:<28} c={result['concurrency']:<5} "
+            f"{result['throughput_per_second']:>10.1f} ops/s  p50={result['latency_p50_ms']:.2f}ms  "
+            f"p99={result['latency_p99_ms']:.2f}ms"
+        )
+    logger.info(f"Wrote results to {args.output}")
+
+
+class _LatencyRecorder(MetricsSink):
+    # Exact per-request latencies (the in-memory sink only keeps bucketed histograms)
+    def __init__(self):
+        self.latencies: List[float] = []
+
+    def record_inference(self, observation: InferenceObservation):
+        self.latencies.append(observation.queue_wait_seconds + observation.service_seconds)
+
+
+def _make_expert(latency_ms: float) -> Expert:
+    # Constant latency (sigma 0, no throttling) so runs are comparable across releases
+    return get_fake_transform_expert(latency_median_seconds=latency_ms / 1000, latency_sigma=0.0, seed=0)
+
+
+def _make_task(index: int, expert: Expert) -> TransformTask:
+    mappings = [
+        {"source_path": path, "target_path": path, "rationale": "Same field"}
+        for path in TARGET_SCHEMA.split(", ")
+    ]
+    return TransformTask(
+        task_id=str(index),
+        context=[
+            expert.system_prompt_factory(SOURCE_JSON, TARGET_SCHEMA, mappings),
+            HumanMessage(content=f"Generate the transform (request {index})")
+        ],
+        source_json=SOURCE_JSON,
+        target_schema=TARGET_SCHEMA,
+        mappings=mappings
+    )
+
+
+def _to_result(
+    benchmark: str,
+    concurrency: int,
+    latencies: List[float],
+    wall_seconds: float,
+    extra: Dict[str, Any]
+) -> BenchmarkResult:
+    ordered = sorted(latencies)
+    return BenchmarkResult(
+        benchmark=benchmark,
+        concurrency=concurrency,
+        operations=len(ordered),
+        wall_seconds=round(wall_seconds, 6),
+        throughput_per_second=round(len(ordered) / wall_seconds, 3) if wall_seconds else 0.0,
+        latency_p50_ms=round(ordered[len(ordered) // 2] * 1000, 4),
+        latency_p99_ms=round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 4),
+        latency_mean_ms=round(statistics.fmean(ordered) * 1000, 4),
+        extra=extra
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,94 @@ This package provides the foundational abstractions:
 - Expert: LLM + prompt factory + tools
 - Task: Work item + conversation context
 - ToolBundle: Structured output tools
-- Inference: Async batch inference
+- Inference: Async batch inference (async-native + background-loop sync wrapper)
+- InferenceScheduler: Bounded-concurrency, priority-ordered admission for LLM calls
+- AdaptiveConcurrencyController: AIMD in-flight window driven by throttling and latency
+- ResponseCache: Content-addressed LLM response cache (memory LRU + SQLite)
+- InflightDeduplicator: Single-flight collapsing of concurrent identical requests
+- InferenceCoalescer: Micro-batching extension point for backends with a real batch API (adds latency otherwise)
+- HedgingPolicy: Budgeted hedged requests for tail-latency reduction
+- LLMRouter: Health-weighted load balancing across equivalent model endpoints
+- CascadeExpert: Cheapest-first model tiers, escalating only on validation failure
+- Pipeline: Multi-phase Expert DAGs where each item advances as soon as its upstream phase is done
+- BoundedQueue: Backpressure queue with depth and wait-time stats (used by Pipeline.astream())
+- Best-of-N: Parallel samples of one Task, first valid answer wins and the rest are cancelled
+- CheckpointStore: Append-only Task checkpoints with batched fsync, and resume after a crash
+- TaskRepository: SQLite Task store indexed by phase/status/validation, with leases for workers
+- PromptCacheStyle / build_system_message: Provider prompt-prefix cache markers
+- MetricsSink: Pluggable inference telemetry (in-memory, Prometheus, JSONL backends)
+- RateLimiter: Token-per-minute / request-per-minute pacing for LLM calls
+- Cassette: Record/replay of provider responses for network-free regression runs
+- FakeChatModel: Deterministic local chat model for load-testing the inference layer
+- StreamingGuard: Streamed responses with early abort on invalid partial tool calls
 - ValidationReport: Validation result accumulation
 """
 
-from core.experts import Expert, ExpertInvocationError, invoke_expert
-from core.tasks import Task
+from core.experts import (
+    Expert,
+    ExpertInvocationError,
+    ExpertInvocationOutcome,
+    ainvoke_expert,
+    ainvoke_experts,
+    ainvoke_experts_as_completed,
+    ainvoke_expert_with_validation,
+    ainvoke_experts_with_validation,
+    invoke_expert,
+    invoke_expert_with_validation,
+    invoke_experts,
+    invoke_experts_with_validation,
+)
+from core.tasks import Task, context_from_json
+from core.task_repository import TaskRepository, TaskStatus
 from core.tools import ToolBundle
-from core.inference import InferenceRequest, InferenceResult, perform_inference
+from core.inference import (
+    InferenceConfig,
+    InferenceRequest,
+    InferenceResult,
+    InferenceTimeoutError,
+    aperform_inference,
+    aperform_inference_as_completed,
+    perform_inference,
+    run_on_background_loop,
+)
+from core.adaptive_concurrency import AdaptiveConcurrencyController, is_throttling_error, is_transient_error
+from core.caching import ResponseCache, compute_request_key
+from core.backpressure import BoundedQueue
+from core.best_of_n import BestOfNOutcome, ainvoke_best_of_n, invoke_best_of_n
+from core.cascade import (
+    CascadeExpert,
+    CascadeOutcome,
+    ainvoke_cascade,
+    ainvoke_cascades,
+    invoke_cascade,
+)
+from core.checkpointing import CheckpointStore, ResumePlan
+from core.cassette import Cassette, CassetteMissError, CassetteMode
+from core.coalescing import InferenceCoalescer
+from core.deduplication import InflightDeduplicator
+from core.fake_llm import FakeChatModel
+from core.hedging import HedgingPolicy
+from core.routing import LLMRouter, RouterBackend
+from core.pipeline import Pipeline, PipelineDependencyError, PipelineItemResult, PipelinePhase
+from core.prompt_caching import PromptCacheMetrics, PromptCacheStyle, build_system_message
+from core.rate_limiting import RateLimiter, TokenBucket, estimate_tokens
+from core.scheduling import (
+    PRIORITY_BACKFILL,
+    PRIORITY_DEFAULT,
+    PRIORITY_INTERACTIVE,
+    InferenceScheduler,
+)
+from core.streaming import PartialToolCallCheck, StreamAbortedError, StreamingGuard
+from core.telemetry import (
+    CompositeMetricsSink,
+    InferenceObservation,
+    InMemoryMetricsSink,
+    JsonlMetricsSink,
+    MetricLabels,
+    MetricsSink,
+    PrometheusMetricsSink,
+    ToolCallObservation,
+)
 from core.validation_report import ValidationReport
 
 __all__ = [
@@ -20,14 +100,97 @@ __all__ = [
     "Expert",
     "ExpertInvocationError",
     "invoke_expert",
+    "ainvoke_expert",
+    "ExpertInvocationOutcome",
+    "invoke_experts",
+    "ainvoke_experts",
+    "ainvoke_experts_as_completed",
+    "invoke_expert_with_validation",
+    "ainvoke_expert_with_validation",
+    "invoke_experts_with_validation",
+    "ainvoke_experts_with_validation",
     # Task abstractions
     "Task",
+    "context_from_json",
+    "TaskRepository",
+    "TaskStatus",
     # Tool abstractions
     "ToolBundle",
     # Inference
+    "InferenceConfig",
     "InferenceRequest",
     "InferenceResult",
+    "InferenceTimeoutError",
     "perform_inference",
+    "aperform_inference",
+    "aperform_inference_as_completed",
+    "run_on_background_loop",
+    # Scheduling
+    "InferenceScheduler",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_DEFAULT",
+    "PRIORITY_BACKFILL",
+    # Adaptive concurrency
+    "AdaptiveConcurrencyController",
+    "is_throttling_error",
+    "is_transient_error",
+    # Response caching
+    "ResponseCache",
+    "compute_request_key",
+    # Deduplication
+    "InflightDeduplicator",
+    # Coalescing
+    "InferenceCoalescer",
+    # Hedging
+    "HedgingPolicy",
+    # Routing
+    "LLMRouter",
+    "RouterBackend",
+    # Model cascades
+    "CascadeExpert",
+    "CascadeOutcome",
+    "invoke_cascade",
+    "ainvoke_cascade",
+    "ainvoke_cascades",
+    # Pipelines
+    "Pipeline",
+    "PipelinePhase",
+    "PipelineItemResult",
+    "PipelineDependencyError",
+    "BoundedQueue",
+    # Best-of-N racing
+    "BestOfNOutcome",
+    "invoke_best_of_n",
+    "ainvoke_best_of_n",
+    # Checkpoint/resume
+    "CheckpointStore",
+    "ResumePlan",
+    # Prompt-prefix caching
+    "PromptCacheStyle",
+    "PromptCacheMetrics",
+    "build_system_message",
+    # Rate limiting
+    "RateLimiter",
+    "TokenBucket",
+    "estimate_tokens",
+    # Streaming
+    "StreamingGuard",
+    "StreamAbortedError",
+    "PartialToolCallCheck",
+    # Telemetry
+    "MetricsSink",
+    "MetricLabels",
+    "InferenceObservation",
+    "ToolCallObservation",
+    "InMemoryMetricsSink",
+    "PrometheusMetricsSink",
+    "JsonlMetricsSink",
+    "CompositeMetricsSink",
+    # Testing
+    "FakeChatModel",
+    "Cassette",
+    "CassetteMode",
+    "CassetteMissError",
     # Validation
     "ValidationReport",
 ]
@@ -0,0 +1,185 @@
+"""
+Adaptive (AIMD) concurrency control for LLM inference.
+
+PATTERN DEMONSTRATED: Congestion control driven by provider throttling signals
+
+A static max_in_flight has to be hand-tuned per model and region, and is wrong as soon as
+quota or load changes. botocore's `adaptive` retry mode only slows down individual retries;
+it never shrinks the fan-out that aperform_inference() creates. The
+AdaptiveConcurrencyController learns the window the same way TCP does:
+
+- Additive increase: Every healthy response grows the window by increase_step / window,
+  i.e. by roughly increase_step per full window of successes
+- Multiplicative decrease: A throttle (ThrottlingException surfacing, a response that needed
+  retries, or a latency spike well above the baseline) cuts the window by decrease_factor
+- Cooldown: At most one cut per cooldown period, so one burst of throttles from the same
+  window doesn't collapse the limit to the floor
+
+Plug a controller into an InferenceScheduler; the scheduler's effective limit becomes
+min(max_in_flight, controller.limit).
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError, HTTPClientError
+from langchain_core.messages import BaseMessage
+
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "ThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "SlowDown",
+}
+SERVER_ERROR_CODES = {
+    "InternalServerException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "ModelTimeoutException",
+}
+# Provider SDK exception names (e.g. APITimeoutError, APIConnectionError, InternalServerError)
+# that mean the call failed on the way to or inside the provider, not because of the request
+TRANSIENT_ERROR_NAME_MARKERS = ("Timeout", "Connection", "InternalServer", "ServiceUnavailable", "Overloaded")
+LATENCY_EWMA_ALPHA = 0.1  # Weight of the newest sample; ~10-sample memory keeps the baseline stable
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Decide whether an exception from an LLM call means the provider is throttling us.
+
+    Covers botocore ClientErrors (Bedrock), provider SDK exceptions named like
+    RateLimitError, and LangChain wrappers that only preserve the original error text.
+    """
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+    error_name = type(error).__name__
+    if "Throttl" in error_name or "RateLimit" in error_name:
+        return True
+
+    return any(code in str(error) for code in THROTTLING_ERROR_CODES)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Decide whether an exception from an LLM call is the endpoint's fault and worth retrying
+    elsewhere: throttling, timeouts, connection failures and 5xx responses.
+
+    Everything else (a context that is too long, validation errors, other 4xx) would fail the
+    same way on any endpoint.
+    """
+    if is_throttling_error(error):
+        return True
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError,
+                          BotocoreConnectionError, HTTPClientError)):
+        return True
+
+    if isinstance(error, ClientError):
+        status_code = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        return status_code >= 500 or error.response.get("Error", {}).get("Code") in SERVER_ERROR_CODES
+
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+
+    return any(marker in type(error).__name__ for marker in TRANSIENT_ERROR_NAME_MARKERS)
+
+
+def get_retry_attempts(response: BaseMessage) -> int:
+    """
+    Get the number of retries the provider SDK performed to produce a response.
+
+    Bedrock responses carry botocore's ResponseMetadata, including RetryAttempts. Retries on a
+    successful call almost always mean we were throttled and recovered.
+
+    Returns:
+        Retry count, or 0 if the provider doesn't report it
+    """
+    response_metadata = getattr(response, "response_metadata", None) or {}
+    return response_metadata.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD controller that learns how many LLM calls can be in flight at once.
+
+    Usage:
+        controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=256)
+        scheduler = InferenceScheduler(max_in_flight=256, concurrency_controller=controller)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        cooldown_seconds: float = 5.0
+    ):
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.cooldown_seconds = cooldown_seconds
+        self._window = float(initial_limit)
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        return self._baseline_latency
+
+    def on_success(self, latency_seconds: float, retry_attempts: int = 0):
+        """
+        Record a completed call.
+
+        Args:
+            latency_seconds: Service time of the call
+            retry_attempts: Retries the SDK needed (see get_retry_attempts())
+        """
+        if retry_attempts > 0:
+            self._decrease(f"response needed {retry_attempts} retries")
+            return
+
+        if self._baseline_latency is None:
+            self._baseline_latency = latency_seconds
+        elif latency_seconds > self._baseline_latency * self.latency_spike_factor:
+            self._decrease(f"latency {latency_seconds:.2f}s vs baseline {self._baseline_latency:.2f}s")
+            # Still fold the sample in: if service time has shifted for good (longer prompts, a
+            # slower phase), the baseline catches up and the cuts stop instead of driving the
+            # window to min_limit
+            self._baseline_latency += LATENCY_EWMA_ALPHA * (latency_seconds - self._baseline_latency)
+            return
+        else:
+            self._baseline_latency += LATENCY_EWMA_ALPHA * (latency_seconds - self._baseline_latency)
+
+        self._window = min(float(self.max_limit), self._window + self.increase_step / self._window)
+
+    def on_throttle(self):
+        """Record a call that failed because the provider throttled it."""
+        self._decrease("throttled by provider")
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        if self._last_decrease is not None and now - self._last_decrease < self.cooldown_seconds:
+            return
+
+        self._last_decrease = now
+        self._window = max(float(self.min_limit), self._window * self.decrease_factor)
+        logger.info(f"Reducing inference concurrency to {self.limit} ({reason})")
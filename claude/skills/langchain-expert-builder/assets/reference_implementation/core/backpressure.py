@@ -0,0 +1,85 @@
+"""
+Bounded, instrumented queues for connecting pipeline stages.
+
+PATTERN DEMONSTRATED: Backpressure through bounded buffers
+
+When stages of a streaming workflow run at different speeds, an unbounded hand-off (a list or
+an unbounded asyncio.Queue) absorbs the difference in memory: if transforms are slower than
+mappings, every finished MappingTask (full context and source JSON included) piles up. A
+BoundedQueue has a fixed capacity, so a producer that gets ahead blocks in put() until the
+consumer catches up, and memory stays flat however long the run is.
+
+KEY CONCEPTS:
+- Depth: Current and peak number of buffered items
+- Put wait: Time producers spent blocked on a full queue. High values mean the downstream stage
+  is the bottleneck (backpressure is being applied)
+- Get wait: Time consumers spent waiting on an empty queue. High values mean the upstream
+  stage is the bottleneck (the downstream stage is starved)
+
+Usage:
+    queue = BoundedQueue("transform", maxsize=100)
+    await queue.put(task)        # Blocks while 100 items are waiting
+    task = await queue.get()
+    logger.info(queue.to_json())
+"""
+import asyncio
+import time
+from typing import Any, Dict, Generic, TypeVar
+
+
+T = TypeVar('T')
+
+
+class BoundedQueue(Generic[T]):
+    """
+    asyncio.Queue with a required capacity and depth/wait-time statistics.
+
+    Attributes:
+        name: Label for stats
+        maxsize: Capacity; put() blocks while the queue is full
+    """
+
+    def __init__(self, name: str, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("BoundedQueue needs a capacity of at least 1")
+        self.name = name
+        self.maxsize = maxsize
+        self.puts = 0
+        self.max_depth = 0
+        self.put_wait_seconds = 0.0
+        self.max_put_wait_seconds = 0.0
+        self.get_wait_seconds = 0.0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, item: T):
+        start = time.monotonic()
+        await self._queue.put(item)
+        waited = time.monotonic() - start
+        self.puts += 1
+        self.put_wait_seconds += waited
+        self.max_put_wait_seconds = max(self.max_put_wait_seconds, waited)
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    async def get(self) -> T:
+        start = time.monotonic()
+        item = await self._queue.get()
+        self.get_wait_seconds += time.monotonic() - start
+        return item
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize queue statistics for logging/debugging."""
+        return {
+            "name": self.name,
+            "maxsize": self.maxsize,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "puts": self.puts,
+            "put_wait_seconds": round(self.put_wait_seconds, 4),
+            "mean_put_wait_seconds": round(self.put_wait_seconds / self.puts, 6) if self.puts else None,
+            "max_put_wait_seconds": round(self.max_put_wait_seconds, 4),
+            "get_wait_seconds": round(self.get_wait_seconds, 4)
+        }
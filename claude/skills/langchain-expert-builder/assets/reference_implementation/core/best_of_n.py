@@ -0,0 +1,184 @@
+"""
+Best-of-N racing: sample a Task N times in parallel and keep the first answer that validates.
+
+PATTERN DEMONSTRATED: Speculative parallel sampling with first-valid-wins cancellation
+
+When an Expert's output fails validation a fair share of the time, the usual fix is to retry
+after the failure, paying one full LLM round trip per attempt. Racing launches N independent
+samples of the same Task up front and validates each the moment it arrives
+(aperform_inference_as_completed()). The first sample that passes is written back to the
+Task and every sample still in flight is cancelled, so wall-clock time to a valid answer is
+roughly that of the fastest valid sample rather than a chain of sequential retries.
+
+KEY CONCEPTS:
+- Samples are copies of the Task (own task_id and context list), so a rejected sample never
+  touches the original Task
+- Response cache and in-flight deduplication are bypassed for the samples; both would
+  otherwise collapse N identical requests into one answer
+- Cost is bounded by n: at most n calls are made, and cancelled calls stop billing output
+  tokens when the connection closes
+- If no sample validates, the first sample that produced a work item is kept, with its
+  report, so callers can inspect it or start a self-correction loop from it
+
+WHEN TO USE:
+- Expert sampled at temperature > 0 (at temperature 0 every sample is the same answer)
+- Validation failure rate is high enough that sequential retries dominate latency
+- Spare rate-limit headroom exists; racing multiplies request volume by up to n
+
+Usage:
+    outcome = await ainvoke_best_of_n(transform_expert, task, TransformTaskValidator(), n=3)
+    if outcome.succeeded:
+        logger.info(f"Valid transform after {outcome.samples_completed} of {outcome.samples_launched} samples")
+"""
+from dataclasses import dataclass, replace
+import logging
+from typing import Any, Dict, Optional
+
+from core.base_validator import BaseValidator
+from core.experts import Expert, ainvoke_experts_as_completed
+from core.inference import run_on_background_loop
+from core.scheduling import PRIORITY_DEFAULT
+from core.tasks import Task
+from core.validation_report import ValidationReport
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BestOfNOutcome:
+    """
+    Result of racing N samples of one Task.
+
+    Attributes:
+        task: The original Task (updated with the kept sample's work item and context, if any)
+        samples_launched: Number of samples started
+        samples_completed: Number of samples that finished before the race ended
+        validation_report: The kept sample's validation report (None if every sample errored)
+        error: The last sample error, if no sample produced a work item
+    """
+    task: Task
+    samples_launched: int
+    samples_completed: int
+    validation_report: Optional[ValidationReport] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.validation_report is not None and self.validation_report.passed
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for logging/debugging."""
+        return {
+            "task_id": self.task.task_id,
+            "succeeded": self.succeeded,
+            "samples_launched": self.samples_launched,
+            "samples_completed": self.samples_completed,
+            "validation_report": self.validation_report.to_json() if self.validation_report else None,
+            "error": repr(self.error) if self.error else None
+        }
+
+
+def invoke_best_of_n(
+    expert: Expert,
+    task: Task,
+    validator: BaseValidator,
+    n: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> BestOfNOutcome:
+    """
+    Race n samples of a Task (synchronous wrapper around ainvoke_best_of_n()).
+
+    Args:
+        expert: The Expert to sample
+        task: The Task to perform (updated in place with the kept sample)
+        validator: Decides whether a sample's work item is acceptable
+        n: Number of parallel samples
+        priority: Scheduling priority for every sample
+
+    Returns:
+        BestOfNOutcome describing the race
+    """
+    return run_on_background_loop(ainvoke_best_of_n(expert, task, validator, n, priority))
+
+
+async def ainvoke_best_of_n(
+    expert: Expert,
+    task: Task,
+    validator: BaseValidator,
+    n: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> BestOfNOutcome:
+    """
+    Race n samples of a Task and keep the first one whose work item passes the validator.
+
+    Samples go through the Expert's usual scheduler, rate limiter, timeout and hedging, so the
+    extra load is paced like any other traffic. Samples still in flight when a winner is found
+    are cancelled.
+
+    Args:
+        expert: The Expert to sample
+        task: The Task to perform (updated in place with the kept sample)
+        validator: Decides whether a sample's work item is acceptable
+        n: Number of parallel samples
+        priority: Scheduling priority for every sample
+
+    Returns:
+        BestOfNOutcome describing the race
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    # Identical requests would otherwise be served from the cache or collapsed into one call.
+    # Only the kept sample is checkpointed, under the original Task's ID
+    sampling_expert = replace(
+        expert,
+        inference_config=replace(expert.inference_config, cache=None, deduplicator=None),
+        checkpoints=None
+    )
+    samples = [
+        replace(task, task_id=f"{task.task_id}/sample-{index}", context=list(task.context))
+        for index in range(n)
+    ]
+
+    outcome = BestOfNOutcome(task=task, samples_launched=n, samples_completed=0)
+    fallback: Optional[Task] = None
+
+    outcomes = ainvoke_experts_as_completed(sampling_expert, samples, priority)
+    try:
+        async for sample_outcome in outcomes:
+            outcome.samples_completed += 1
+            if not sample_outcome.succeeded:
+                outcome.error = sample_outcome.error
+                continue
+
+            sample = sample_outcome.task
+            report = validator.validate(sample.get_work_item(), sample)
+            if report.passed:
+                _adopt_sample(task, sample)
+                outcome.validation_report = report
+                if expert.checkpoints is not None:
+                    expert.checkpoints.record(task, report)
+                outcome.error = None
+                logger.debug(f"Task {task.task_id} won by {sample.task_id} after {outcome.samples_completed} sample(s)")
+                return outcome
+
+            if fallback is None:
+                fallback = sample
+                outcome.validation_report = report
+    finally:
+        # Cancels every sample still in flight
+        await outcomes.aclose()
+
+    if fallback is not None:
+        _adopt_sample(task, fallback)
+        outcome.error = None
+        if expert.checkpoints is not None:
+            expert.checkpoints.record(task, outcome.validation_report)
+    logger.info(f"No valid sample for task {task.task_id} out of {n}")
+    return outcome
+
+
+def _adopt_sample(task: Task, sample: Task):
+    task.context[:] = sample.context
+    task.set_work_item(sample.get_work_item())
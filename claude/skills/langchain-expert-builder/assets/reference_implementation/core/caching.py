@@ -0,0 +1,265 @@
+"""
+Content-addressed caching of LLM responses.
+
+PATTERN DEMONSTRATED: Opt-in, per-Expert response cache keyed by request content
+
+Deterministic experts (temperature 0) produce the same answer for the same input, yet
+pipelines routinely re-send identical contexts after restarts or when re-running a dataset.
+ResponseCache stores responses under a stable hash of everything that determines the answer:
+
+- The serialized conversation context
+- The model configuration (model ID, temperature, max tokens, ...)
+- The tools bound to the model
+
+KEY CONCEPTS:
+- Two tiers: an in-memory LRU for hot entries, and an optional SQLite file that survives restarts
+- Eviction: max_entries (memory), max_disk_entries (disk, least-recently-used first), ttl_seconds (both)
+- Opt-in per Expert via InferenceConfig.cache; creative (temperature 1) experts should leave it
+  unset, since caching would collapse their intentionally varied outputs to a single answer
+- Only successful responses are cached; errors are always retried. A response the caller rejects
+  (e.g. the Expert finds no usable tool call in it) is evicted, so retries reach the LLM again
+
+DESIGN CHOICE: Key on LangChain's llm_string
+- Rationale: BaseChatModel._get_llm_string() is what LangChain's own cache uses to capture the
+  model configuration plus invocation kwargs (which is where bind_tools() puts the tool schemas)
+- Trade-off: Relies on a LangChain-internal method; other Runnables fall back to their own
+  get_llm_string() if they define one, else their name
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+from langchain_core.runnables import Runnable, RunnableBinding
+
+
+logger = logging.getLogger(__name__)
+
+# Message fields that vary between otherwise-identical runs (provider request IDs, latency
+# metrics, token counts) and must not affect the cache key
+VOLATILE_MESSAGE_FIELDS = {"id", "response_metadata", "usage_metadata"}
+DISK_PRUNE_INTERVAL = 100  # Writes between disk eviction passes; amortizes the cost of the pruning queries
+
+
+def compute_request_key(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    context: List[BaseMessage]
+) -> str:
+    """
+    Compute a stable content hash identifying an LLM request.
+
+    Two requests get the same key exactly when they send the same conversation to the same
+    model configuration with the same bound tools.
+
+    Args:
+        llm: The LangChain Runnable the request will be sent to
+        context: The conversation that will be sent
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    key_material = {
+        "llm": describe_llm(llm),
+        "context": [message.model_dump(exclude=VOLATILE_MESSAGE_FIELDS) for message in context]
+    }
+    serialized = json.dumps(key_material, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def describe_llm(llm: Runnable) -> str:
+    """
+    Describe the model configuration that determines an LLM's answers (the cache-key half of
+    compute_request_key()).
+
+    Runnables that wrap other models (e.g. core.routing.LLMRouter) can provide their own
+    description by defining get_llm_string().
+
+    Args:
+        llm: The LangChain Runnable requests are sent to
+
+    Returns:
+        LangChain's llm_string for chat models (including bound kwargs such as tools), otherwise
+        the wrapper's get_llm_string() or the Runnable's name
+    """
+    if isinstance(llm, RunnableBinding):
+        if isinstance(llm.bound, BaseChatModel):
+            return llm.bound._get_llm_string(**llm.kwargs)
+        return f"{describe_llm(llm.bound)}---{json.dumps(llm.kwargs, sort_keys=True, default=str)}"
+    if isinstance(llm, BaseChatModel):
+        return llm._get_llm_string()
+    if hasattr(llm, "get_llm_string"):
+        return llm.get_llm_string()
+    return llm.get_name()
+
+
+def serialize_message(message: BaseMessage) -> str:
+    return json.dumps(messages_to_dict([message])[0])
+
+
+def deserialize_message(payload: str) -> BaseMessage:
+    return messages_from_dict([json.loads(payload)])[0]
+
+
+class ResponseCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache of LLM responses.
+
+    Usage:
+        cache = ResponseCache(max_entries=2048, disk_path="cache/transform_expert.sqlite", ttl_seconds=7 * 86400)
+        expert = Expert(..., inference_config=InferenceConfig(cache=cache))
+
+    Thread-safe: the same cache may be used from the background inference loop and other threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        disk_path: Optional[str] = None,
+        max_disk_entries: Optional[int] = 100_000,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self.max_disk_entries = max_disk_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[float, BaseMessage]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+
+        if disk_path is not None:
+            self._connection = sqlite3.connect(disk_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, last_access REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+            self._connection.commit()
+
+    def get(self, key: str) -> Optional[BaseMessage]:
+        """
+        Look up a cached response.
+
+        Returns:
+            A copy of the cached response (safe to append to a Task's context), or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            response = self._get_from_memory(key, now)
+            if response is None:
+                disk_entry = self._get_from_disk(key, now)
+                if disk_entry is not None:
+                    stored_at, response = disk_entry
+                    self._put_in_memory(key, response, stored_at)
+
+            if response is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return response.model_copy(deep=True)
+
+    def put(self, key: str, response: BaseMessage):
+        """Store a response in both tiers, evicting as needed."""
+        now = time.time()
+        response = response.model_copy(deep=True)
+        with self._lock:
+            self._put_in_memory(key, response, now)
+            self._put_on_disk(key, response, now)
+
+    def evict(self, key: str):
+        """Remove a response from both tiers (e.g. one its caller rejected)."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize cache statistics for logging/debugging."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "disk_path": self.disk_path
+        }
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _get_from_memory(self, key: str, now: float) -> Optional[BaseMessage]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if self._is_expired(stored_at, now):
+            del self._memory[key]
+            return None
+
+        self._memory.move_to_end(key)
+        return response
+
+    def _put_in_memory(self, key: str, response: BaseMessage, stored_at: float):
+        self._memory[key] = (stored_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _get_from_disk(self, key: str, now: float) -> Optional[Tuple[float, BaseMessage]]:
+        if self._connection is None:
+            return None
+
+        row = self._connection.execute(
+            "SELECT stored_at, payload FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        stored_at, payload = row
+        if self._is_expired(stored_at, now):
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+            return None
+
+        self._connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        self._connection.commit()
+        return stored_at, deserialize_message(payload)
+
+    def _put_on_disk(self, key: str, response: BaseMessage, now: float):
+        if self._connection is None:
+            return
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, stored_at, last_access, payload) VALUES (?, ?, ?, ?)",
+            (key, now, now, serialize_message(response))
+        )
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= DISK_PRUNE_INTERVAL:
+            self._prune_disk(now)
+        self._connection.commit()
+
+    def _prune_disk(self, now: float):
+        self._writes_since_prune = 0
+        if self.ttl_seconds is not None:
+            self._connection.execute("DELETE FROM responses WHERE stored_at < ?", (now - self.ttl_seconds,))
+        if self.max_disk_entries is not None:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,)
+            )
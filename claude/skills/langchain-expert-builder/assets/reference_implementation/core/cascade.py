@@ -0,0 +1,206 @@
+"""
+Model cascades: answer with the cheapest model whose output passes validation.
+
+PATTERN DEMONSTRATED: Validation-gated escalation across model tiers
+
+Most tasks in a phase are easy enough for a small, fast model; a few need a large one. Sending
+everything to the large model pays its latency and price on every task. A CascadeExpert holds
+an ordered list of Experts (cheapest first) plus a BaseValidator. Each task goes to the first
+tier; only when that tier errors or its output fails validation is the task escalated to the
+next tier. Median latency and cost track the cheap model, while hard cases still reach the
+strong one.
+
+KEY CONCEPTS:
+- Tiers are full Experts, so each keeps its own LLM, rate limiter, scheduler, cache and metric
+  labels; they must share the same tool bundle so any tier can produce the task's work item
+- The validator is the escalation signal: BaseValidator.validate(work_item, task)
+- Task snapshot: A failed tier's AIMessage/ToolMessage and its work item are rolled back before
+  escalating, so the next tier sees exactly the Task the first tier saw, and an erroring last
+  tier never leaves a rejected tier's work item behind
+- The final tier's output is kept even if it fails validation, together with its report, so
+  callers can inspect it or start a self-correction loop from it
+- Checkpointing: Tiers run without their CheckpointStore; the serving tier's store records the
+  kept answer once, with its validation report, so an unvalidated cheap-tier answer is never
+  recorded as complete
+
+DESIGN CHOICE: Escalate on validation, not on model confidence
+- Rationale: The validator already encodes what "good enough" means for the phase, and is
+  cheap relative to an LLM call; model self-reported confidence is poorly calibrated
+- Trade-off: An escalated task pays the cheap tier's latency on top of the strong tier's
+
+Usage:
+    cascade = CascadeExpert(
+        tiers=[haiku_transform_expert, sonnet_transform_expert],
+        validator=TransformTaskValidator()
+    )
+    outcome = await ainvoke_cascade(cascade, task)
+    logger.info(f"Served by tier {outcome.tier} after {outcome.attempts} attempt(s)")
+"""
+import asyncio
+from dataclasses import dataclass, field, fields, replace
+import logging
+from typing import Any, Dict, List, Optional
+
+from core.base_validator import BaseValidator
+from core.experts import Expert, ainvoke_expert
+from core.inference import run_on_background_loop
+from core.scheduling import PRIORITY_DEFAULT
+from core.tasks import Task
+from core.validation_report import ValidationReport
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CascadeExpert:
+    """
+    An ordered list of interchangeable Experts, tried cheapest first, gated by a validator.
+
+    Attributes:
+        tiers: Experts in escalation order (cheapest/fastest first)
+        validator: Decides whether a tier's work item is good enough to stop escalating
+        served_by_tier: Number of tasks whose final answer came from each tier
+        escalations: Number of times a task was passed on to the next tier
+    """
+    tiers: List[Expert]
+    validator: BaseValidator
+    served_by_tier: List[int] = field(init=False)
+    escalations: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if not self.tiers:
+            raise ValueError("CascadeExpert needs at least one tier")
+        self.served_by_tier = [0] * len(self.tiers)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize cascade statistics for logging/debugging."""
+        return {
+            "tiers": len(self.tiers),
+            "served_by_tier": self.served_by_tier,
+            "escalations": self.escalations
+        }
+
+
+@dataclass
+class CascadeOutcome:
+    """
+    Result of running one Task through a CascadeExpert.
+
+    Attributes:
+        task: The Task (mutated in place with the serving tier's work item and context)
+        tier: Index of the tier whose answer was kept
+        attempts: Number of tiers tried
+        validation_report: The kept answer's validation report (None if the last tier errored)
+        error: The last tier's exception, if it raised one
+    """
+    task: Task
+    tier: int
+    attempts: int
+    validation_report: Optional[ValidationReport] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.validation_report is not None and self.validation_report.passed
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for logging/debugging."""
+        return {
+            "task_id": self.task.task_id,
+            "succeeded": self.succeeded,
+            "tier": self.tier,
+            "attempts": self.attempts,
+            "validation_report": self.validation_report.to_json() if self.validation_report else None,
+            "error": repr(self.error) if self.error else None
+        }
+
+
+def invoke_cascade(cascade: CascadeExpert, task: Task, priority: int = PRIORITY_DEFAULT) -> CascadeOutcome:
+    """
+    Run a Task through a CascadeExpert (synchronous wrapper around ainvoke_cascade()).
+
+    Args:
+        cascade: The CascadeExpert to invoke
+        task: The Task to perform (will be mutated)
+        priority: Scheduling priority passed to every tier
+
+    Returns:
+        CascadeOutcome describing which tier answered and whether the answer validated
+    """
+    return run_on_background_loop(ainvoke_cascade(cascade, task, priority))
+
+
+async def ainvoke_cascade(cascade: CascadeExpert, task: Task, priority: int = PRIORITY_DEFAULT) -> CascadeOutcome:
+    """
+    Run a Task through a CascadeExpert, escalating until a tier's output passes validation.
+
+    Each tier is invoked with ainvoke_expert(). If it raises, or its work item fails
+    cascade.validator, the Task (context and work item) is restored to what it was before that
+    tier and the next tier is tried. The last tier's answer is kept whatever its validation result.
+
+    With Expert.checkpoints set on the serving tier, the kept answer is checkpointed once with
+    its validation report.
+
+    Args:
+        cascade: The CascadeExpert to invoke
+        task: The Task to perform (will be mutated)
+        priority: Scheduling priority passed to every tier
+
+    Returns:
+        CascadeOutcome describing which tier answered and whether the answer validated
+    """
+    snapshot = replace(task, context=list(task.context))
+    last_tier = len(cascade.tiers) - 1
+
+    for tier, expert in enumerate(cascade.tiers):
+        report: Optional[ValidationReport] = None
+        error: Optional[Exception] = None
+        try:
+            # Checkpointed below, once the answer has been validated
+            await ainvoke_expert(replace(expert, checkpoints=None), task, priority)
+            report = cascade.validator.validate(task.get_work_item(), task)
+        except Exception as e:
+            error = e
+
+        if (error is None and report.passed) or tier == last_tier:
+            cascade.served_by_tier[tier] += 1
+            if expert.checkpoints is not None and error is None:
+                expert.checkpoints.record(task, report)
+            return CascadeOutcome(task=task, tier=tier, attempts=tier + 1, validation_report=report, error=error)
+
+        reason = repr(error) if error is not None else "validation failed"
+        logger.info(f"Escalating task {task.task_id} from cascade tier {tier} to {tier + 1}: {reason}")
+        cascade.escalations += 1
+        _restore(task, snapshot)
+
+
+async def ainvoke_cascades(
+    cascade: CascadeExpert,
+    tasks: List[Task],
+    priority: int = PRIORITY_DEFAULT
+) -> List[CascadeOutcome]:
+    """
+    Run many Tasks through a CascadeExpert concurrently.
+
+    Each Task escalates independently, so easy Tasks finish on the first tier while hard ones
+    move on; concurrency is governed by each tier's own InferenceConfig.
+
+    Args:
+        cascade: The CascadeExpert to invoke
+        tasks: The Tasks to perform (mutated in place)
+        priority: Scheduling priority passed to every tier
+
+    Returns:
+        One CascadeOutcome per Task, in the same order as the input
+    """
+    return list(await asyncio.gather(*[ainvoke_cascade(cascade, task, priority) for task in tasks]))
+
+
+def _restore(task: Task, snapshot: Task):
+    # Field by field, so the caller's Task object (and its context list) stays the same
+    for task_field in fields(task):
+        if task_field.name == "context":
+            task.context[:] = snapshot.context
+        else:
+            setattr(task, task_field.name, getattr(snapshot, task_field.name))
@@ -0,0 +1,240 @@
+"""
+Record/replay of LLM responses for regression runs and benchmarks.
+
+PATTERN DEMONSTRATED: Network-free replays of a real run ("VCR cassettes")
+
+Regression runs of a whole pipeline against the real provider take tens of minutes and never
+return quite the same answers twice. A Cassette records every provider response, keyed by
+request hash, to an append-only JSONL file (gzip-compressed if the path ends in ".gz"). Later
+runs replay those responses with zero network calls.
+
+KEY CONCEPTS:
+- Keys come from core.caching.compute_request_key(), so a replay only matches a request with
+  the same context, model configuration and bound tools
+- Several recordings per key are replayed in recorded order (and then cycled), so
+  temperature-1 Experts still see varied answers to identical requests
+- Recorded latency can be simulated on replay (optionally scaled) so scheduler, rate-limiter
+  and hedging behaviour can be benchmarked; or skipped for the fastest possible regression runs
+- The cassette sits below the scheduler, rate limiter, timeout and hedging in the call chain,
+  so all of those behave as they would against the provider
+- Crash tolerance: a recording cut off by a crash (a torn line, or a truncated gzip stream) is
+  skipped on load and everything before it is replayed; recording more into the cassette
+  first repairs its end so new recordings stay readable
+
+MODES:
+- RECORD: Start a fresh cassette (overwriting any existing file) and record every response
+- REPLAY: Never call the provider; a request with no recording raises CassetteMissError
+- REPLAY_OR_RECORD: Replay when a recording exists, otherwise call the provider and record it
+
+Usage:
+    cassette = Cassette("cassettes/transform_regression.jsonl.gz", mode=CassetteMode.REPLAY)
+    expert = Expert(..., inference_config=InferenceConfig(cassette=cassette))
+"""
+import asyncio
+from enum import Enum
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+
+from core.caching import compute_request_key, deserialize_message, serialize_message
+
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMode(Enum):
+    RECORD = "record"
+    REPLAY = "replay"
+    REPLAY_OR_RECORD = "replay_or_record"
+
+
+class CassetteMissError(Exception):
+    """Raised in REPLAY mode when a request has no recorded response."""
+    pass
+
+
+class Cassette:
+    """
+    Records provider responses to, and replays them from, a JSONL file.
+
+    Thread-safe: the same cassette may be used from the background inference loop and other threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: CassetteMode = CassetteMode.REPLAY_OR_RECORD,
+        simulate_latency: bool = False,
+        latency_scale: float = 1.0
+    ):
+        """
+        Args:
+            path: Cassette file; gzip-compressed if it ends in ".gz"
+            mode: Record, replay, or replay-with-fallback-to-record
+            simulate_latency: Sleep for each response's recorded latency when replaying it
+            latency_scale: Multiplier applied to simulated latencies (e.g. 0.1 for 10x faster)
+        """
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+        self.replays = 0
+        self.recordings = 0
+        self._entries: Dict[str, List[Tuple[float, str]]] = {}  # key -> [(latency, payload)]
+        self._replay_positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._file = None  # Opened on first recording
+        self._torn = False  # A crash cut off the end of the file
+
+        if os.path.exists(path):
+            if mode == CassetteMode.RECORD:
+                os.remove(path)
+            else:
+                self._load()
+
+    @property
+    def recorded_keys(self) -> int:
+        return len(self._entries)
+
+    async def ainvoke(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        context: List[BaseMessage]
+    ) -> BaseMessage:
+        """
+        Return a replayed response for this request, or call the LLM (recording the response).
+
+        Args:
+            llm: The LangChain Runnable the request is addressed to
+            context: The conversation to send
+
+        Returns:
+            The LLM's (or the recording's) response
+
+        Raises:
+            CassetteMissError: In REPLAY mode, if there is no recording for this request
+        """
+        key = compute_request_key(llm, context)
+
+        if self.mode != CassetteMode.RECORD:
+            recording = self._next_recording(key)
+            if recording is not None:
+                latency, payload = recording
+                if self.simulate_latency:
+                    await asyncio.sleep(latency * self.latency_scale)
+                return deserialize_message(payload)
+            if self.mode == CassetteMode.REPLAY:
+                raise CassetteMissError(f"No recorded response for request {key[:12]} in {self.path}")
+
+        start = time.monotonic()
+        response = await llm.ainvoke(context)
+        self._record(key, time.monotonic() - start, response)
+        return response
+
+    def to_json(self) -> Dict[str, object]:
+        """Serialize cassette statistics for logging/debugging."""
+        return {
+            "path": self.path,
+            "mode": self.mode.value,
+            "recorded_keys": self.recorded_keys,
+            "replays": self.replays,
+            "recordings": self.recordings
+        }
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _next_recording(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            recordings = self._entries.get(key)
+            if not recordings:
+                return None
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            self.replays += 1
+            return recordings[position % len(recordings)]
+
+    def _record(self, key: str, latency: float, response: BaseMessage):
+        payload = serialize_message(response)
+        line = json.dumps({"key": key, "latency_seconds": round(latency, 4), "response": json.loads(payload)})
+        with self._lock:
+            if self._file is None:
+                self._file = self._open_for_append()
+            self._entries.setdefault(key, []).append((latency, payload))
+            self.recordings += 1
+            self._file.write(line + "\n")
+            self._file.flush()  # Keep everything recorded so far if the run dies part-way
+
+    def _load(self):
+        try:
+            with self._open("rt") as cassette_file:
+                for line_number, line in enumerate(cassette_file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Expected for a recording cut off by a crash mid-write
+                        logger.warning(f"Skipping unreadable recording at {self.path}:{line_number}")
+                        self._torn = True
+                        continue
+                    self._entries.setdefault(entry["key"], []).append(
+                        (entry["latency_seconds"], json.dumps(entry["response"]))
+                    )
+        except (EOFError, gzip.BadGzipFile):
+            # Expected for a gzip stream cut off by a crash; the recordings read so far are intact
+            logger.warning(f"Skipping the truncated end of {self.path}")
+            self._torn = True
+        logger.info(f"Loaded {self.recorded_keys} recorded request(s) from {self.path}")
+
+    def _open_for_append(self):
+        if not os.path.exists(self.path):
+            return self._open("at")
+
+        if self.path.endswith(".gz"):
+            if self._torn:
+                # Members appended after a truncated one can't be read; rewrite the intact recordings
+                self._rewrite()
+            return self._open("at")
+
+        cassette_file = self._open("at")
+        if _ends_mid_line(self.path):
+            # End the cut-off line so the next recording starts on its own line
+            cassette_file.write("\n")
+        return cassette_file
+
+    def _rewrite(self):
+        temporary_path = self.path + ".tmp"
+        with gzip.open(temporary_path, "wt", encoding="utf-8") as cassette_file:
+            for key, recordings in self._entries.items():
+                for latency, payload in recordings:
+                    cassette_file.write(json.dumps({
+                        "key": key, "latency_seconds": latency, "response": json.loads(payload)
+                    }) + "\n")
+        os.replace(temporary_path, self.path)
+        self._torn = False
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+
+def _ends_mid_line(path: str) -> bool:
+    with open(path, "rb") as cassette_file:
+        cassette_file.seek(0, os.SEEK_END)
+        if cassette_file.tell() == 0:
+            return False
+        cassette_file.seek(-1, os.SEEK_END)
+        return cassette_file.read(1) != b"\n"
@@ -0,0 +1,256 @@
+"""
+Crash-safe checkpointing of Task state for long Expert batch runs.
+
+PATTERN DEMONSTRATED: Append-only checkpoint log with batched fsync, and resume from it
+
+A Task's work item and conversation live only in memory, so a 50k-task run that dies at 80%
+loses every paid inference it made. With a CheckpointStore on the Expert, each successful
+invocation appends the Task's to_json() to a JSONL log. A restarted run hands its freshly built
+Tasks to resume(): Tasks whose latest checkpoint is complete are returned as finished (with
+their work items) and skipped; Tasks with a partial checkpoint (e.g. a failed validation
+attempt) are rebuilt with Task.from_json() and pick up from their saved conversation.
+
+KEY CONCEPTS:
+- Append-only: A record is never rewritten; the latest record per task_id wins on load. A
+  record cut off by a crash is skipped, and reopening the store ends that line so later
+  records aren't appended onto it
+- Complete: The Task had a work item and either no validator ran or its report passed
+- Durability is split in two: every record is written and flushed to the OS immediately (it
+  survives the process crashing), and a background thread fsyncs the file every
+  fsync_interval_seconds or fsync_batch_size records (it survives the machine crashing). The
+  inference hot path never waits on the disk
+- Opt-in per Expert: set Expert.checkpoints; invoke_expert(), invoke_experts() and the
+  validation loops record automatically
+- Task types must implement Task.from_json() to be resumed
+
+DESIGN CHOICE: JSONL log rather than a database
+- Rationale: Appends are the cheapest durable write and the file is easy to inspect
+- Trade-off: The log keeps every record, so a Task retried several times is stored several
+  times; load() keeps only the latest per task_id in memory
+
+Usage:
+    store = CheckpointStore("checkpoints/transform_run.jsonl")
+    expert = Expert(..., checkpoints=store)
+
+    plan = store.resume(build_tasks())           # After a crash: skip finished work
+    outcomes = invoke_experts_with_validation(expert, plan.pending, validator)
+    results = plan.completed + [outcome.task for outcome in outcomes]
+    store.close()
+"""
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from core.tasks import Task
+from core.validation_report import ValidationReport
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FSYNC_INTERVAL_SECONDS = 1.0  # Most wall-clock time a record waits to reach the disk
+DEFAULT_FSYNC_BATCH_SIZE = 500        # fsync early once this many records are waiting
+
+
+@dataclass
+class ResumePlan:
+    """
+    Tasks of a restarted run, split by their checkpoint state.
+
+    Attributes:
+        completed: Tasks rebuilt from a complete checkpoint; they don't need to be invoked again
+        pending: Tasks still to invoke, in input order; partially done ones are rebuilt from
+            their checkpoint, the rest are the Tasks that were passed in
+        rehydrated: How many of the pending Tasks were rebuilt from a partial checkpoint
+    """
+    completed: List[Task] = field(default_factory=list)
+    pending: List[Task] = field(default_factory=list)
+    rehydrated: int = 0
+
+    def to_json(self) -> Dict[str, int]:
+        """Serialize a summary for logging/debugging."""
+        return {
+            "completed": len(self.completed),
+            "pending": len(self.pending),
+            "rehydrated": self.rehydrated
+        }
+
+
+class CheckpointStore:
+    """
+    Append-only JSONL log of Task checkpoints with batched fsync.
+
+    Thread-safe: the same store may be used from the background inference loop and other threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync_interval_seconds: float = DEFAULT_FSYNC_INTERVAL_SECONDS,
+        fsync_batch_size: int = DEFAULT_FSYNC_BATCH_SIZE
+    ):
+        """
+        Args:
+            path: Checkpoint file; appended to if it already exists
+            fsync_interval_seconds: Most time between a record being written and fsynced
+            fsync_batch_size: fsync as soon as this many records are waiting
+        """
+        if fsync_batch_size < 1:
+            raise ValueError("fsync_batch_size must be at least 1")
+        self.path = path
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.fsync_batch_size = fsync_batch_size
+        self.records = 0
+        self.fsyncs = 0
+        self._unsynced = 0
+        self._closed = False
+        self._lock = threading.Lock()       # Guards writes to the file
+        self._sync_lock = threading.Lock()  # Serializes fsync and close
+        self._wake = threading.Event()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        if _ends_mid_line(path):
+            # A crash cut the last record off; end it so the next record starts on its own line
+            self._file.write("\n")
+            self._file.flush()
+        self._syncer = threading.Thread(target=self._sync_loop, name="checkpoint-fsync", daemon=True)
+        self._syncer.start()
+
+    def record(self, task: Task, validation_report: Optional[ValidationReport] = None):
+        """
+        Append a checkpoint of the Task's current state.
+
+        Args:
+            task: The Task to checkpoint
+            validation_report: Report for the Task's current work item, if a validator ran
+        """
+        completed = task.get_work_item() is not None and (validation_report is None or validation_report.passed)
+        line = json.dumps({
+            "task_id": task.task_id,
+            "completed": completed,
+            "validation_report": validation_report.to_json() if validation_report else None,
+            "task": task.to_json()
+        })
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Checkpoint store {self.path} is closed")
+            self._file.write(line + "\n")
+            self._file.flush()  # Survives the process dying; the fsync makes it survive the machine
+            self.records += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch_size:
+                self._wake.set()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the latest checkpoint record of every Task in the file.
+
+        Returns:
+            Records ({"task_id", "completed", "validation_report", "task"}) keyed by task_id
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return latest
+
+        with open(self.path, encoding="utf-8") as checkpoint_file:
+            for line_number, line in enumerate(checkpoint_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Expected for a record cut off by a crash mid-write
+                    logger.warning(f"Skipping unreadable checkpoint record at {self.path}:{line_number}")
+                    continue
+                latest[record["task_id"]] = record
+        return latest
+
+    def completed_ids(self) -> Set[str]:
+        """IDs of the Tasks whose latest checkpoint is complete."""
+        return {task_id for task_id, record in self.load().items() if record["completed"]}
+
+    def resume(self, tasks: Iterable[Task]) -> ResumePlan:
+        """
+        Split a run's Tasks into finished ones and ones still to invoke, using the checkpoints.
+
+        Each checkpointed Task is rebuilt with type(task).from_json(), so its work item and
+        conversation are restored.
+
+        Args:
+            tasks: The run's Tasks, freshly built from its inputs (same task_ids as before)
+
+        Returns:
+            ResumePlan with the completed and pending Tasks
+        """
+        records = self.load()
+        plan = ResumePlan()
+        for task in tasks:
+            record = records.get(task.task_id)
+            if record is None:
+                plan.pending.append(task)
+                continue
+            rehydrated = type(task).from_json(record["task"])
+            if record["completed"]:
+                plan.completed.append(rehydrated)
+            else:
+                plan.pending.append(rehydrated)
+                plan.rehydrated += 1
+
+        logger.info(f"Resuming from {self.path}: {plan.to_json()}")
+        return plan
+
+    def sync(self):
+        """Flush and fsync every record written so far."""
+        with self._sync_lock:
+            with self._lock:
+                if self._closed or self._unsynced == 0:
+                    return
+                self._file.flush()
+                self._unsynced = 0
+            # Outside the write lock, so records keep being appended while the disk catches up
+            os.fsync(self._file.fileno())
+            self.fsyncs += 1
+
+    def close(self):
+        """Fsync outstanding records, stop the background syncer and close the file."""
+        self.sync()
+        with self._sync_lock:
+            with self._lock:
+                if self._closed:
+                    return
+                self._closed = True
+                self._file.close()
+        self._wake.set()
+        self._syncer.join()
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize checkpoint statistics for logging/debugging."""
+        return {
+            "path": self.path,
+            "records": self.records,
+            "fsyncs": self.fsyncs,
+            "unsynced": self._unsynced
+        }
+
+    def _sync_loop(self):
+        while not self._closed:
+            self._wake.wait(self.fsync_interval_seconds)
+            self._wake.clear()
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Failed to fsync checkpoint store {self.path}: {e!r}")
+
+
+def _ends_mid_line(path: str) -> bool:
+    with open(path, "rb") as checkpoint_file:
+        checkpoint_file.seek(0, os.SEEK_END)
+        if checkpoint_file.tell() == 0:
+            return False
+        checkpoint_file.seek(-1, os.SEEK_END)
+        return checkpoint_file.read(1) != b"\n"
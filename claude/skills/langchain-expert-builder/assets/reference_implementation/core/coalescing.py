@@ -0,0 +1,176 @@
+"""
+Micro-batching of concurrent single-task Expert invocations.
+
+PATTERN DEMONSTRATED: Request coalescing (a.k.a. micro-batching) in front of a batch API
+
+Services that handle one user request at a time call invoke_expert() with one Task. An
+InferenceCoalescer holds each single-task request for a short window (max_wait_seconds, a few
+milliseconds) or until max_batch_size requests have gathered, submits them as one
+aperform_inference() batch, and routes each result back to the caller that asked for it.
+
+IMPORTANT: This is an extension point, not an optimization, and no Expert uses it.
+aperform_inference() is a gather of independent provider calls, each of which still takes its
+own scheduler slot, rate-limiter reservation and round trip, so a coalesced batch saves no work;
+every request simply waits up to max_wait_seconds longer. It only pays off in front of a backend
+that really does amortize work per batch (e.g. a provider batch endpoint or a self-hosted server
+with batched decoding): subclass InferenceCoalescer, override perform_batch() with that
+backend's batch call, and have the service's request handlers submit() to it.
+
+KEY CONCEPTS:
+- Bounded delay: A request waits at most max_wait_seconds before its batch is sent; a full
+  batch is sent immediately
+- Per-request failures stay per request: each caller gets its own InferenceResult, error or not
+- Batches are kept apart per event loop, LLM and InferenceConfig
+
+DESIGN CHOICE: A standalone component rather than an Expert or InferenceConfig option
+- Rationale: With the inference layer in this package coalescing only adds latency, so it
+  must not be one flag away on the Expert invocation path
+- Trade-off: A service using it builds InferenceRequests and applies results itself
+
+Usage:
+    class ProviderBatchCoalescer(InferenceCoalescer):
+        async def perform_batch(self, llm, requests, config):
+            ...  # One call to the backend's batch API, one InferenceResult per request
+
+    coalescer = ProviderBatchCoalescer(max_batch_size=32, max_wait_seconds=0.005)
+    result = await coalescer.submit(expert.llm, task.to_inference_task(), expert.inference_config)
+"""
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+
+from core.inference import InferenceConfig, InferenceRequest, InferenceResult, aperform_inference
+
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceCoalescer:
+    """
+    Collects concurrent single requests into aperform_inference() batches.
+
+    Batches are kept apart per event loop, LLM and InferenceConfig, so one coalescer can safely
+    be shared, although one per Expert is typical.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_seconds: float = 0.005):
+        """
+        Args:
+            max_batch_size: Send a batch as soon as it holds this many requests
+            max_wait_seconds: Longest a request waits for others to join its batch
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.batches = 0
+        self.requests = 0
+        self._pending: Dict[Tuple[int, int, int], _PendingBatch] = {}
+        self._running: Set[asyncio.Task] = set()  # Strong references so batches aren't garbage collected
+
+    async def submit(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        request: InferenceRequest,
+        config: InferenceConfig
+    ) -> InferenceResult:
+        """
+        Add a request to the current batch and wait for its result.
+
+        Args:
+            llm: LangChain Runnable the request is addressed to
+            request: The request to perform
+            config: Controls applied to the batch (scheduling, rate limiting, etc.)
+
+        Returns:
+            This request's InferenceResult
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), id(llm), id(config))
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(llm=llm, config=config)
+            batch.timer = loop.call_later(self.max_wait_seconds, self._flush, key)
+            self._pending[key] = batch
+
+        future = loop.create_future()
+        batch.requests.append(request)
+        batch.futures.append(future)
+        if len(batch.requests) >= self.max_batch_size:
+            self._flush(key)
+
+        # If this caller is cancelled its request still runs with the batch; the result is dropped
+        return await future
+
+    async def perform_batch(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        requests: List[InferenceRequest],
+        config: InferenceConfig
+    ) -> List[InferenceResult]:
+        """
+        Send one coalesced batch; override with a backend's real batch call.
+
+        Args:
+            llm: LangChain Runnable the batch is addressed to
+            requests: The batch's requests
+            config: Controls applied to the batch
+
+        Returns:
+            One InferenceResult per request, in the same order
+        """
+        return await aperform_inference(llm, requests, config)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize coalescing statistics for logging/debugging."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_seconds": self.max_wait_seconds,
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch_size": round(self.requests / self.batches, 2) if self.batches else None
+        }
+
+    def _flush(self, key: Tuple[int, int, int]):
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return  # Already sent because it filled up
+        batch.timer.cancel()
+        self.batches += 1
+        self.requests += len(batch.requests)
+        logger.debug(f"Submitting coalesced batch of {len(batch.requests)} request(s)")
+
+        running = asyncio.ensure_future(self._run(batch))
+        self._running.add(running)
+        running.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: "_PendingBatch"):
+        try:
+            results = await self.perform_batch(batch.llm, batch.requests, batch.config)
+        except BaseException as e:
+            for future in batch.futures:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
+
+
+@dataclass
+class _PendingBatch:
+    llm: Runnable[LanguageModelInput, BaseMessage]
+    config: InferenceConfig
+    requests: List[InferenceRequest] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
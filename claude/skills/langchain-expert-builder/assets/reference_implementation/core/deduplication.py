@@ -0,0 +1,96 @@
+"""
+Single-flight deduplication of concurrent, identical LLM requests.
+
+PATTERN DEMONSTRATED: Collapsing duplicate in-flight work
+
+When many documents share a shape and prompt, several workers often send the exact same
+context at the same moment. A ResponseCache can't help there, because none of the calls has
+finished yet. InflightDeduplicator lets the first caller (the leader) make the upstream call
+while every identical caller that arrives before it finishes waits on that same call.
+
+KEY CONCEPTS:
+- Keys come from core.caching.compute_request_key(), so "identical" means the same context,
+  model configuration and bound tools
+- Every waiter receives its own deep copy of the response, so appending it to one Task's
+  context can't affect another Task
+- Errors are shared too: if the upstream call fails, every waiter sees the failure
+- Cancellation is reference-counted: one waiter giving up doesn't cancel the shared call,
+  but the call is cancelled once every waiter has given up
+
+Complements ResponseCache: the deduplicator collapses requests that overlap in time, the
+cache serves requests that arrive after the first one finished.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict
+
+from langchain_core.messages import BaseMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+class InflightDeduplicator:
+    """
+    Collapses concurrent requests with the same key into one upstream call.
+
+    Usage:
+        deduplicator = InflightDeduplicator()
+        response = await deduplicator.run(request_key, lambda: llm.ainvoke(context))
+
+    Like InferenceScheduler, a deduplicator is bound to the event loop it is first used on.
+    """
+
+    def __init__(self):
+        self.collapsed_requests = 0  # Requests served by another caller's upstream call
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._waiter_counts: Dict[str, int] = {}
+
+    @property
+    def inflight_keys(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[BaseMessage]]) -> BaseMessage:
+        """
+        Return the response for `key`, making the upstream call only if none is already in flight.
+
+        Args:
+            key: Request identity (see compute_request_key())
+            call: Zero-argument callable that performs the upstream call; only invoked by the leader
+
+        Returns:
+            The response (a private copy for every caller except the leader)
+        """
+        shared_call = self._inflight.get(key)
+        is_leader = shared_call is None
+        if is_leader:
+            shared_call = asyncio.ensure_future(call())
+            self._inflight[key] = shared_call
+            self._waiter_counts[key] = 0
+            shared_call.add_done_callback(lambda future: self._forget(key, future))
+        else:
+            self.collapsed_requests += 1
+            logger.debug(f"Collapsed duplicate in-flight request {key[:12]}")
+
+        self._waiter_counts[key] += 1
+        try:
+            # Shield so that one waiter being cancelled doesn't cancel the call for everyone else
+            response = await asyncio.shield(shared_call)
+        except asyncio.CancelledError:
+            self._abandon(key, shared_call)
+            raise
+        finally:
+            if key in self._waiter_counts and self._inflight.get(key) is shared_call:
+                self._waiter_counts[key] -= 1
+
+        return response if is_leader else response.model_copy(deep=True)
+
+    def _abandon(self, key: str, shared_call: asyncio.Future):
+        # The finally block in run() hasn't decremented yet, so 1 means we're the last waiter
+        if self._waiter_counts.get(key) == 1 and not shared_call.done():
+            shared_call.cancel()
+
+    def _forget(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            del self._waiter_counts[key]
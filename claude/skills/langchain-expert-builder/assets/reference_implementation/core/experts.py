@@ -8,19 +8,32 @@ An Expert encapsulates:
 
 This module is framework-agnostic and can be used with any LangChain-compatible LLM provider.
 """
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field, replace
 import json
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from botocore.config import Config
 from langchain_core.language_models import LanguageModelInput
-from langchain_core.messages import AIMessage, BaseMessage, SystemMessage, ToolMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import Runnable
+from pydantic import ValidationError
 
+from core.base_validator import BaseValidator
+from core.checkpointing import CheckpointStore
 from core.tools import ToolBundle
 from core.tasks import Task
-from core.inference import perform_inference
+from core.inference import (
+    InferenceConfig,
+    InferenceResult,
+    aperform_inference,
+    aperform_inference_as_completed,
+    run_on_background_loop,
+)
+from core.scheduling import PRIORITY_DEFAULT
+from core.telemetry import ToolCallObservation, resolve_labels
+from core.validation_report import ValidationReport
 
 
 logger = logging.getLogger(__name__)
@@ -45,10 +58,15 @@ class Expert:
         llm: LangChain Runnable (typically an LLM with tools bound via bind_tools())
         system_prompt_factory: Function that generates SystemMessage based on task input
         tools: ToolBundle containing the structured output tool(s)
+        inference_config: Controls applied to this Expert's inference calls (scheduling, etc.)
+        checkpoints: Records each Task after every successful invocation so a crashed run
+            can be resumed (None = no checkpointing)
     """
     llm: Runnable[LanguageModelInput, BaseMessage]
     system_prompt_factory: Callable[[Dict[str, Any]], SystemMessage]
     tools: ToolBundle
+    inference_config: InferenceConfig = field(default_factory=InferenceConfig)
+    checkpoints: Optional[CheckpointStore] = None
 
 
 class ExpertInvocationError(Exception):
@@ -56,10 +74,65 @@ class ExpertInvocationError(Exception):
     pass
 
 
-def invoke_expert(expert: Expert, task: Task) -> Task:
+@dataclass
+class ExpertInvocationOutcome:
+    """
+    Per-task outcome of a bulk Expert invocation.
+
+    Attributes:
+        task: The Task that was invoked (mutated in place on success)
+        error: The exception raised while processing this task, or None on success
+        attempts: Number of invocations made (more than 1 only for validation retry loops)
+        validation_report: Report for the final work item, if a validator was applied
+    """
+    task: Task
+    error: Optional[Exception] = None
+    attempts: int = 1
+    validation_report: Optional[ValidationReport] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and (self.validation_report is None or self.validation_report.passed)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for logging/debugging."""
+        return {
+            "task_id": self.task.task_id,
+            "succeeded": self.succeeded,
+            "error": repr(self.error) if self.error else None,
+            "attempts": self.attempts,
+            "validation_report": self.validation_report.to_json() if self.validation_report else None
+        }
+
+
+def invoke_expert(expert: Expert, task: Task, priority: int = PRIORITY_DEFAULT) -> Task:
     """
     Invoke an Expert on a Task, updating the Task with the LLM's structured output.
 
+    Synchronous wrapper around ainvoke_expert(). The invocation runs on the shared background
+    event loop (see core.inference.run_on_background_loop), so repeated calls reuse one loop
+    and one connection pool rather than creating a new event loop per call.
+
+    Args:
+        expert: The Expert to invoke
+        task: The Task to perform (will be mutated)
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        The updated Task (same object, mutated)
+
+    Raises:
+        ExpertInvocationError: If LLM doesn't produce a tool call
+        Exception: Whatever the LLM call itself raised (e.g. InferenceTimeoutError)
+    """
+    return run_on_background_loop(ainvoke_expert(expert, task, priority))
+
+
+async def ainvoke_expert(expert: Expert, task: Task, priority: int = PRIORITY_DEFAULT) -> Task:
+    """
+    Invoke an Expert on a Task on the caller's event loop, updating the Task with the LLM's
+    structured output.
+
     This function orchestrates the full Expert invocation lifecycle:
     1. Convert Task to InferenceRequest (wraps conversation context)
     2. Perform LLM inference (async batch-ready)
@@ -71,36 +144,312 @@ def invoke_expert(expert: Expert, task: Task) -> Task:
     Args:
         expert: The Expert to invoke
         task: The Task to perform (will be mutated)
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
 
     Returns:
         The updated Task (same object, mutated)
 
     Raises:
         ExpertInvocationError: If LLM doesn't produce a tool call
+        Exception: Whatever the LLM call itself raised (e.g. InferenceTimeoutError)
     """
     logger.debug(f"Initial Task: {json.dumps(task.to_json(), indent=4)}")
 
     # Step 1: Convert task to inference request
-    inference_task = task.to_inference_task()
+    inference_task = task.to_inference_task(priority)
 
     # Step 2: Perform inference (forces tool call via bind_tools())
-    inference_result = perform_inference(expert.llm, [inference_task])[0]
+    inference_result = (await aperform_inference(expert.llm, [inference_task], expert.inference_config))[0]
     logger.debug(f"Inference Result: {json.dumps(inference_result.to_json(), indent=4)}")
 
+    # Steps 3-6: Validate the tool call, execute it, and update the Task
+    _apply_inference_result(expert, task, inference_result)
+
+    logger.debug(f"Updated Task: {json.dumps(task.to_json(), indent=4)}")
+
+    return task
+
+
+def invoke_experts(
+    expert: Expert,
+    tasks: List[Task],
+    priority: int = PRIORITY_DEFAULT
+) -> List[ExpertInvocationOutcome]:
+    """
+    Invoke an Expert on many Tasks through a single inference batch (synchronous wrapper).
+
+    See ainvoke_experts() for details.
+
+    Args:
+        expert: The Expert to invoke
+        tasks: The Tasks to perform (successful ones are mutated in place)
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        One ExpertInvocationOutcome per Task, in the same order as the input
+    """
+    return run_on_background_loop(ainvoke_experts(expert, tasks, priority))
+
+
+async def ainvoke_experts(
+    expert: Expert,
+    tasks: List[Task],
+    priority: int = PRIORITY_DEFAULT
+) -> List[ExpertInvocationOutcome]:
+    """
+    Invoke an Expert on many Tasks through a single inference batch.
+
+    All Tasks are converted to InferenceRequests and sent through one aperform_inference() call,
+    so the LLM round trips run concurrently rather than one after another. Each result is then
+    processed exactly as ainvoke_expert() would (tool-call check, tool execution, context update).
+
+    A failure for one Task (the LLM call erroring or timing out, no tool call, or the tool
+    rejecting the LLM's arguments) is captured in that Task's outcome and does not affect the
+    other Tasks.
+
+    Args:
+        expert: The Expert to invoke
+        tasks: The Tasks to perform (successful ones are mutated in place)
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        One ExpertInvocationOutcome per Task, in the same order as the input
+    """
+    inference_requests = [task.to_inference_task(priority) for task in tasks]
+    inference_results = await aperform_inference(expert.llm, inference_requests, expert.inference_config)
+
+    return [
+        _to_outcome(expert, task, inference_result)
+        for task, inference_result in zip(tasks, inference_results)
+    ]
+
+
+async def ainvoke_experts_as_completed(
+    expert: Expert,
+    tasks: List[Task],
+    priority: int = PRIORITY_DEFAULT
+) -> AsyncIterator[ExpertInvocationOutcome]:
+    """
+    Invoke an Expert on many Tasks, yielding each Task's outcome as soon as it is ready.
+
+    Streaming counterpart of ainvoke_experts(): each result is processed (tool-call check, tool
+    execution, context update) and yielded the moment its inference finishes, so callers can
+    validate it or hand it to the next phase without waiting for the rest of the batch.
+
+    Args:
+        expert: The Expert to invoke
+        tasks: The Tasks to perform (successful ones are mutated in place); task_ids must be
+            unique, since they match results back to Tasks
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Yields:
+        One ExpertInvocationOutcome per Task, in completion order
+
+    Raises:
+        ValueError: If two Tasks share a task_id
+    """
+    tasks_by_id = {task.task_id: task for task in tasks}
+    if len(tasks_by_id) != len(tasks):
+        raise ValueError("ainvoke_experts_as_completed() needs a unique task_id per Task")
+    inference_requests = [task.to_inference_task(priority) for task in tasks]
+
+    inference_results = aperform_inference_as_completed(expert.llm, inference_requests, expert.inference_config)
+    try:
+        async for inference_result in inference_results:
+            yield _to_outcome(expert, tasks_by_id[inference_result.task_id], inference_result)
+    finally:
+        await inference_results.aclose()
+
+
+def invoke_expert_with_validation(
+    expert: Expert,
+    task: Task,
+    validator: BaseValidator,
+    max_attempts: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> ExpertInvocationOutcome:
+    """
+    Invoke an Expert with a validation-driven self-correction loop (synchronous wrapper).
+
+    See ainvoke_expert_with_validation() for details.
+
+    Args:
+        expert: The Expert to invoke
+        task: The Task to perform (will be mutated)
+        validator: Checks each work item; its report entries become the retry feedback
+        max_attempts: Maximum number of invocations, including the first
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        ExpertInvocationOutcome with the attempt count and the final validation report
+    """
+    return run_on_background_loop(ainvoke_expert_with_validation(expert, task, validator, max_attempts, priority))
+
+
+async def ainvoke_expert_with_validation(
+    expert: Expert,
+    task: Task,
+    validator: BaseValidator,
+    max_attempts: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> ExpertInvocationOutcome:
+    """
+    Invoke an Expert, validate its work item, and feed failures back until it passes.
+
+    After each invocation the validator checks the work item. On failure, the report entries
+    are appended to Task.context as a HumanMessage asking for a corrected tool call, and the
+    Expert is invoked again on the extended conversation, so the LLM revises its previous
+    attempt rather than starting over. A response the Expert rejects (no tool call, or tool
+    arguments that fail the tool's schema) is rolled back and the error is fed back the same
+    way; any other failure (timeout, provider error) is retried from the same context. Retries
+    bypass the response cache and deduplicator so they always reach the LLM.
+
+    With Expert.checkpoints set, the Task is checkpointed after each validated attempt (with its
+    report and any feedback already appended), so a resumed run continues the correction loop.
+
+    Args:
+        expert: The Expert to invoke
+        task: The Task to perform (will be mutated)
+        validator: Checks each work item; its report entries become the retry feedback
+        max_attempts: Maximum number of invocations, including the first
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        ExpertInvocationOutcome with the attempt count and the final validation report; the Task
+        keeps the last attempt's work item even if it never passed
+    """
+    outcome = ExpertInvocationOutcome(task=task, attempts=0)
+    # Checkpoint each attempt once, after validation, so an unvalidated work item is never
+    # recorded as complete
+    invoking_expert = expert if expert.checkpoints is None else replace(expert, checkpoints=None)
+    # A retry must reach the LLM rather than be answered with a copy of the rejected response
+    retrying_expert = replace(
+        invoking_expert,
+        inference_config=replace(expert.inference_config, cache=None, deduplicator=None)
+    )
+
+    while outcome.attempts < max_attempts:
+        outcome.attempts += 1
+        snapshot = list(task.context)
+        try:
+            await ainvoke_expert(invoking_expert if outcome.attempts == 1 else retrying_expert, task, priority)
+        except Exception as e:
+            logger.warning(f"Attempt {outcome.attempts} failed for task {task.task_id}: {e!r}")
+            task.context[:] = snapshot
+            outcome.error = e
+            if _is_rejected_response(e) and outcome.attempts < max_attempts:
+                task.context.append(_build_error_feedback(task, e))
+            continue
+
+        outcome.error = None
+        outcome.validation_report = validator.validate(task.get_work_item(), task)
+        if outcome.validation_report.passed:
+            break
+
+        logger.info(f"Validation failed for task {task.task_id} on attempt {outcome.attempts}")
+        feedback = _build_validation_feedback(task, outcome.validation_report)
+        if outcome.attempts < max_attempts:
+            task.context.append(feedback)
+            _checkpoint(expert, task, outcome.validation_report)
+        elif expert.checkpoints is not None:
+            # Checkpoint the context the next attempt would start from, so a resumed run
+            # continues the correction loop
+            task.context.append(feedback)
+            try:
+                _checkpoint(expert, task, outcome.validation_report)
+            finally:
+                task.context.pop()
+
+    if outcome.succeeded:
+        _checkpoint(expert, task, outcome.validation_report)
+    return outcome
+
+
+def invoke_experts_with_validation(
+    expert: Expert,
+    tasks: List[Task],
+    validator: BaseValidator,
+    max_attempts: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> List[ExpertInvocationOutcome]:
+    """
+    Run validation self-correction loops for many Tasks concurrently (synchronous wrapper).
+
+    See ainvoke_experts_with_validation() for details.
+    """
+    return run_on_background_loop(ainvoke_experts_with_validation(expert, tasks, validator, max_attempts, priority))
+
+
+async def ainvoke_experts_with_validation(
+    expert: Expert,
+    tasks: List[Task],
+    validator: BaseValidator,
+    max_attempts: int = 3,
+    priority: int = PRIORITY_DEFAULT
+) -> List[ExpertInvocationOutcome]:
+    """
+    Run validation self-correction loops for many Tasks concurrently.
+
+    Each Task runs its own ainvoke_expert_with_validation() loop: a Task that passes finishes
+    immediately, and a Task that fails is resubmitted as soon as its own feedback is appended,
+    without waiting for the rest of the batch's attempt to finish. Retries from different Tasks
+    still share the Expert's scheduler and rate limiter.
+
+    Args:
+        expert: The Expert to invoke
+        tasks: The Tasks to perform (mutated in place)
+        validator: Checks each work item; its report entries become the retry feedback
+        max_attempts: Maximum number of invocations per Task, including the first
+        priority: Scheduling priority if the Expert has a scheduler (lower is served first)
+
+    Returns:
+        One ExpertInvocationOutcome per Task, in the same order as the input
+    """
+    return list(await asyncio.gather(*[
+        ainvoke_expert_with_validation(expert, task, validator, max_attempts, priority)
+        for task in tasks
+    ]))
+
+
+def _to_outcome(expert: Expert, task: Task, inference_result: InferenceResult) -> ExpertInvocationOutcome:
+    try:
+        _apply_inference_result(expert, task, inference_result)
+        return ExpertInvocationOutcome(task=task)
+    except Exception as e:
+        logger.warning(f"Expert invocation failed for task {task.task_id}: {e}")
+        return ExpertInvocationOutcome(task=task, error=e)
+
+
+def _apply_inference_result(expert: Expert, task: Task, inference_result: InferenceResult):
+    # Surface failures captured by the inference engine (errors, timeouts) as this task's exception
+    if inference_result.error is not None:
+        raise inference_result.error
+
+    try:
+        _process_response(expert, task, inference_result.response)
+    except Exception as e:
+        _record_tool_call(expert, task, error=e)
+        _evict_cached_response(expert, inference_result)
+        raise
+    _record_tool_call(expert, task)
+    _checkpoint(expert, task)
+
+
+def _process_response(expert: Expert, task: Task, response: BaseMessage):
     # Step 3: Validate tool call exists
-    if not isinstance(inference_result.response, AIMessage) or not inference_result.response.tool_calls:
+    if not isinstance(response, AIMessage) or not response.tool_calls:
         raise ExpertInvocationError(
             f"The LLM did not create a tool call for the task. "
-            f"Final LLM message: {inference_result.response.content}"
+            f"Final LLM message: {response.content}"
         )
 
     # Step 4: Append LLM response to context
-    task.context.append(inference_result.response)
+    task.context.append(response)
 
     # Step 5: Execute tool with LLM arguments
     # Use last tool call if LLM produced multiple (allows for "thinking" tool calls)
-    tool_call = inference_result.response.tool_calls[-1]
-    result = expert.tools.task_tool(tool_call["args"])
+    tool_call = response.tool_calls[-1]
+    result = expert.tools.task_tool.invoke(tool_call["args"])
     task.set_work_item(result)
 
     # Step 6: Append tool execution to context
@@ -112,6 +461,54 @@ def invoke_expert(expert: Expert, task: Task) -> Task:
         )
     )
 
-    logger.debug(f"Updated Task: {json.dumps(task.to_json(), indent=4)}")
 
-    return task
+def _build_validation_feedback(task: Task, report: ValidationReport) -> HumanMessage:
+    entries = "\n".join(report.report_entries)
+    return HumanMessage(
+        content=(
+            f"Your {task.get_tool_name()} output failed validation:\n"
+            f"<validation_report>\n{entries}\n</validation_report>\n"
+            f"Fix the problems above and call {task.get_tool_name()} again with the corrected arguments."
+        )
+    )
+
+
+def _is_rejected_response(error: Exception) -> bool:
+    # The LLM answered, but not with a usable tool call; unlike a timeout, repeating the
+    # request unchanged would most likely get the same answer
+    return isinstance(error, (ExpertInvocationError, ValidationError))
+
+
+def _build_error_feedback(task: Task, error: Exception) -> HumanMessage:
+    return HumanMessage(
+        content=(
+            f"Your previous response could not be used:\n"
+            f"<error>\n{error}\n</error>\n"
+            f"Call {task.get_tool_name()} with arguments that match its schema."
+        )
+    )
+
+
+def _record_tool_call(expert: Expert, task: Task, error: Optional[Exception] = None):
+    metrics = expert.inference_config.metrics
+    if metrics is None:
+        return
+
+    metrics.record_tool_call(ToolCallObservation(
+        labels=resolve_labels(expert.inference_config.metric_labels, expert.llm),
+        task_id=task.task_id,
+        succeeded=error is None,
+        error_type=type(error).__name__ if error is not None else None
+    ))
+
+
+def _evict_cached_response(expert: Expert, inference_result: InferenceResult):
+    # A rejected response must not be served again, or every retry of the task would fail the same way
+    cache = expert.inference_config.cache
+    if cache is not None and inference_result.cache_key is not None:
+        cache.evict(inference_result.cache_key)
+
+
+def _checkpoint(expert: Expert, task: Task, validation_report: Optional[ValidationReport] = None):
+    if expert.checkpoints is not None:
+        expert.checkpoints.record(task, validation_report)
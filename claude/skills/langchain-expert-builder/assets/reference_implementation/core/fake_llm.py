@@ -0,0 +1,259 @@
+"""
+Deterministic local stand-in for a tool-calling chat model.
+
+PATTERN DEMONSTRATED: Load-testing the inference layer without a provider
+
+Every concurrency, caching and scheduling change to the inference layer needs to be measured,
+but measuring against Bedrock is slow, costs money, and is never the same twice.
+FakeChatModel is a real LangChain chat model (so bind_tools(), ainvoke(), cache keys and
+usage_metadata all behave as they do in production) that:
+
+- Answers with an AIMessage carrying a tool call for whichever bound tool it has an
+  argument factory for
+- Sleeps for a latency sampled from a log-normal body plus an optional slow tail
+- Raises botocore ThrottlingExceptions at a configurable rate
+- Reports token usage in usage_metadata (input estimated from the context, output from the
+  size of the tool arguments)
+- Streams (astream()) the tool-call arguments in small chunks spread over the sampled latency,
+  so early-abort logic (core.streaming) can be measured too
+
+KEY CONCEPTS:
+- Deterministic: Every random draw comes from a generator seeded by (seed, request content,
+  attempt number), so a run is reproducible regardless of the order concurrent calls land in
+- Tool argument factories: Callables (context, rng) -> args dict, registered per tool name;
+  see json_transformer_expert/fakes.py for the reference implementation's factories
+- time_scale: Multiplies every sampled latency, e.g. 0.01 to replay a realistic latency profile
+  100x faster in benchmarks
+
+Usage:
+    llm = FakeChatModel(
+        tool_args_factories={"GenerateTransformCode": fake_transform_code_args},
+        latency_median_seconds=4.0,
+        throttle_rate=0.02,
+        seed=7
+    ).bind_tools(tool_bundle.to_list())
+"""
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+from core.rate_limiting import CHARS_PER_TOKEN, estimate_tokens
+
+
+logger = logging.getLogger(__name__)
+
+ToolArgsFactory = Callable[[List[BaseMessage], random.Random], Dict[str, Any]]
+
+THROTTLE_LATENCY_SECONDS = 0.05  # Throttled calls are rejected quickly, without generating anything
+TOOL_CALL_OVERHEAD_TOKENS = 20  # Tool-use block framing the provider counts as output
+STREAM_CHUNK_CHARS = 64  # Tool-argument characters per streamed chunk
+DEFAULT_MAX_TRACKED_REQUESTS = 100_000  # Attempt counters kept (LRU) for the per-attempt seeds
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Seeded fake chat model with configurable latency, throttling and tool-call responses.
+
+    Attributes:
+        tool_args_factories: Tool name -> factory producing that tool's call arguments
+        model_id: Reported model ID (shows up in telemetry labels and cache keys)
+        seed: Base seed for every random draw
+        latency_median_seconds: Median of the log-normal latency body
+        latency_sigma: Log-space standard deviation of the latency body (0 = constant latency)
+        tail_probability: Chance that a call lands in the slow tail instead
+        tail_latency_seconds: Latency of a slow-tail call
+        throttle_rate: Chance that a call raises a ThrottlingException
+        time_scale: Multiplier applied to every sampled latency
+        max_tracked_requests: Distinct requests whose attempt counts are remembered; the least
+            recently seen are forgotten (their next call counts as a first attempt again)
+    """
+    tool_args_factories: Dict[str, ToolArgsFactory]
+    model_id: str = "fake-chat-model"
+    seed: int = 0
+    latency_median_seconds: float = 2.0
+    latency_sigma: float = 0.5
+    tail_probability: float = 0.0
+    tail_latency_seconds: float = 60.0
+    throttle_rate: float = 0.0
+    time_scale: float = 1.0
+    max_tracked_requests: int = DEFAULT_MAX_TRACKED_REQUESTS
+
+    _attempts: "OrderedDict[str, int]" = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_id": self.model_id, "seed": self.seed}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        latency, throttled, response = self._plan_response(messages, kwargs.get("tools"))
+        time.sleep(latency)
+        return self._finish(throttled, response)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        latency, throttled, response = self._plan_response(messages, kwargs.get("tools"))
+        await asyncio.sleep(latency)
+        return self._finish(throttled, response)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        latency, throttled, response = self._plan_response(messages, kwargs.get("tools"))
+        if throttled:
+            await asyncio.sleep(latency)
+            self._finish(throttled, response)
+
+        chunks = _to_stream_chunks(response)
+        for chunk in chunks:
+            await asyncio.sleep(latency / len(chunks))
+            yield ChatGenerationChunk(message=chunk)
+
+    def _plan_response(
+        self,
+        messages: List[BaseMessage],
+        tools: Optional[List[Dict[str, Any]]]
+    ) -> Tuple[float, bool, Optional[AIMessage]]:
+        # Make every random decision up front, before any await, so the outcome depends only on
+        # the request and how many times it has been tried
+        rng = self._rng_for(messages)
+
+        if rng.random() < self.throttle_rate:
+            return THROTTLE_LATENCY_SECONDS * self.time_scale, True, None
+
+        if rng.random() < self.tail_probability:
+            latency = self.tail_latency_seconds
+        else:
+            latency = self.latency_median_seconds * math.exp(rng.gauss(0.0, self.latency_sigma))
+
+        return latency * self.time_scale, False, self._build_response(messages, tools, rng)
+
+    def _rng_for(self, messages: List[BaseMessage]) -> random.Random:
+        digest = hashlib.sha256(
+            json.dumps([message.content for message in messages], default=str).encode("utf-8")
+        ).hexdigest()
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+            self._attempts.move_to_end(digest)
+            # Bounded, so long benchmark runs over millions of distinct prompts don't grow forever
+            while len(self._attempts) > self.max_tracked_requests:
+                self._attempts.popitem(last=False)
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+
+    def _build_response(
+        self,
+        messages: List[BaseMessage],
+        tools: Optional[List[Dict[str, Any]]],
+        rng: random.Random
+    ) -> AIMessage:
+        tool_name = self._select_tool(tools)
+        input_tokens = estimate_tokens(messages)
+
+        if tool_name is None:
+            content = "I don't have a tool to call for this request."
+            output_tokens = len(content) // CHARS_PER_TOKEN
+            tool_calls = []
+        else:
+            args = self.tool_args_factories[tool_name](messages, rng)
+            content = ""
+            output_tokens = len(json.dumps(args)) // CHARS_PER_TOKEN + TOOL_CALL_OVERHEAD_TOKENS
+            tool_calls = [{"name": tool_name, "args": args, "id": f"tooluse_{rng.getrandbits(64):016x}"}]
+
+        return AIMessage(
+            content=content,
+            tool_calls=tool_calls,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
+            },
+            response_metadata={
+                "model_id": self.model_id,
+                "stopReason": "tool_use" if tool_calls else "end_turn",
+                "ResponseMetadata": {"RetryAttempts": 0}
+            }
+        )
+
+    def _select_tool(self, tools: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+        # Call the first bound tool we know how to fake; without bound tools, the first factory
+        if not tools:
+            return next(iter(self.tool_args_factories), None)
+        for tool in tools:
+            name = tool.get("function", {}).get("name")
+            if name in self.tool_args_factories:
+                return name
+        return None
+
+    def _finish(self, throttled: bool, response: Optional[AIMessage]) -> ChatResult:
+        if throttled:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Too many requests, please wait before trying again."}},
+                "Converse"
+            )
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+
+def _to_stream_chunks(response: AIMessage) -> List[AIMessageChunk]:
+    # Split the tool-call arguments into fixed-size pieces the way a provider streams them;
+    # usage and stop reason arrive with the last piece
+    if not response.tool_calls:
+        pieces = [AIMessageChunk(content=response.content)]
+    else:
+        tool_call = response.tool_calls[-1]
+        arguments = json.dumps(tool_call["args"])
+        pieces = [
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[{
+                    "name": tool_call["name"] if offset == 0 else None,
+                    "args": arguments[offset:offset + STREAM_CHUNK_CHARS],
+                    "id": tool_call["id"] if offset == 0 else None,
+                    "index": 0
+                }]
+            )
+            for offset in range(0, len(arguments), STREAM_CHUNK_CHARS)
+        ]
+    pieces.append(AIMessageChunk(
+        content="",
+        usage_metadata=response.usage_metadata,
+        response_metadata=response.response_metadata
+    ))
+    return pieces
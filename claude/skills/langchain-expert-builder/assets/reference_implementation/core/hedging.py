@@ -0,0 +1,131 @@
+"""
+Hedged requests for LLM tail-latency reduction.
+
+PATTERN DEMONSTRATED: Budgeted request hedging ("The Tail at Scale")
+
+A handful of provider calls hang for far longer than the rest, sometimes close to the full
+read_timeout. Waiting them out dominates p99 latency. Hedging sends a duplicate of any call
+that is still outstanding after a typical-slow latency, then keeps whichever copy finishes
+first and cancels the other.
+
+KEY CONCEPTS:
+- Hedge delay: The configured percentile (e.g. p95) of recently observed latencies; nothing is
+  hedged until min_samples latencies have been observed
+- Hedge budget: Every request earns max_hedge_ratio of a hedge token and every hedge spends a
+  whole one, so hedges can never exceed e.g. 5% of requests
+- Throttle guard: A throttling signal empties the budget, so hedging can't amplify load while
+  the provider is already pushing back
+- First success wins: If one copy fails, the other is still awaited before giving up
+
+WHEN NOT TO USE:
+- Non-idempotent calls (LLM inference is safe to duplicate; side-effecting tools are not)
+- When every call is slow (hedging only helps when slowness is occasional and uncorrelated)
+"""
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+MAX_BUDGET_TOKENS = 10.0  # Cap on saved-up hedges, so a long quiet period can't fund a hedge storm
+
+
+class HedgingPolicy:
+    """
+    Decides when to hedge an LLM call and runs the primary/hedge race.
+
+    Usage:
+        hedging = HedgingPolicy(latency_percentile=0.95, max_hedge_ratio=0.05)
+        expert = Expert(..., inference_config=InferenceConfig(hedging=hedging))
+    """
+
+    def __init__(
+        self,
+        latency_percentile: float = 0.95,
+        max_hedge_ratio: float = 0.05,
+        min_samples: int = 20,
+        window_size: int = 500,
+        min_delay_seconds: float = 1.0
+    ):
+        if not 0 < latency_percentile < 1:
+            raise ValueError("latency_percentile must be in (0, 1)")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be in [0, 1]")
+        self.latency_percentile = latency_percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+        self.requests = 0
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._budget = 0.0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if there isn't enough latency history yet."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.latency_percentile))
+        return max(self.min_delay_seconds, ordered[index])
+
+    def record_latency(self, latency_seconds: float):
+        self._latencies.append(latency_seconds)
+
+    def on_throttle(self):
+        """Forfeit any saved-up hedges; the provider is already overloaded."""
+        self._budget = 0.0
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `call`, hedging it with a second invocation if it is slow and the budget allows.
+
+        Args:
+            call: Zero-argument callable performing one attempt (may be invoked twice)
+
+        Returns:
+            The result of whichever attempt succeeded first
+        """
+        self.requests += 1
+        self._budget = min(MAX_BUDGET_TOKENS, self._budget + self.max_hedge_ratio)
+
+        start = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        attempts = [primary]
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+
+            if not primary.done() and delay is not None and self._budget >= 1:
+                self._budget -= 1
+                self.hedges_issued += 1
+                logger.debug(f"Hedging LLM call still outstanding after {delay:.2f}s")
+                attempts.append(asyncio.ensure_future(call()))
+
+            result, winner = await self._first_success(attempts)
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+        if winner is not primary:
+            self.hedges_won += 1
+        self.record_latency(time.monotonic() - start)
+        return result
+
+    async def _first_success(self, attempts):
+        pending = set(attempts)
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt.result(), attempt
+                last_error = attempt.exception()
+        raise last_error
@@ -1,20 +1,37 @@
 """
 Inference orchestration for LangChain-based multi-expert systems.
 
-Provides async batch inference infrastructure with synchronous wrapper.
+Provides async batch inference infrastructure (aperform_inference) that runs on the caller's
+event loop, plus a synchronous wrapper (perform_inference) that runs on a shared, long-lived
+background loop.
 """
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
-from typing import List
+import threading
+import time
+from typing import Any, AsyncIterator, Coroutine, List, Optional, Tuple, TypeVar
 
 from langchain_core.language_models import LanguageModelInput
 from langchain_core.messages import BaseMessage
 from langchain_core.runnables import Runnable
 
+from core.adaptive_concurrency import get_retry_attempts, is_throttling_error
+from core.caching import ResponseCache, compute_request_key
+from core.cassette import Cassette
+from core.deduplication import InflightDeduplicator
+from core.hedging import HedgingPolicy
+from core.prompt_caching import PromptCacheMetrics, PromptCacheUsage
+from core.rate_limiting import RateLimiter
+from core.scheduling import PRIORITY_DEFAULT, InferenceScheduler
+from core.streaming import StreamingGuard
+from core.telemetry import InferenceObservation, MetricLabels, MetricsSink, resolve_labels
+
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 @dataclass
 class InferenceRequest:
@@ -24,15 +41,18 @@ class InferenceRequest:
     Attributes:
         task_id: Unique identifier for the task
         context: List of LangChain messages (conversation history)
+        priority: Scheduling priority when an InferenceScheduler is in use (lower is served first)
     """
     task_id: str
     context: List[BaseMessage]
+    priority: int = PRIORITY_DEFAULT
 
     def to_json(self) -> dict:
         """Serialize for logging/debugging."""
         return {
             "task_id": self.task_id,
-            "context": [turn.to_json() for turn in self.context]
+            "context": [turn.to_json() for turn in self.context],
+            "priority": self.priority
         }
 
 
@@ -41,24 +61,89 @@ class InferenceResult:
     """
     Output from the inference engine.
 
+    Carries either a response or an error, never both. A failed request does not fail the rest
+    of its batch; check `succeeded` (or `error`) before using `response`.
+
     Attributes:
         task_id: Unique identifier for the task
-        response: LLM's response (typically AIMessage with tool_calls)
+        response: LLM's response (typically AIMessage with tool_calls), None if the request failed
+        error: The exception that ended the request (including InferenceTimeoutError), None on success
+        cache_key: Key of the response-cache entry holding the response, None if no cache is set;
+            a caller that rejects the response evicts it so retries reach the LLM
     """
     task_id: str
-    response: BaseMessage
+    response: Optional[BaseMessage] = None
+    error: Optional[Exception] = None
+    cache_key: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
 
     def to_json(self) -> dict:
         """Serialize for logging/debugging."""
         return {
             "task_id": self.task_id,
-            "response": self.response.to_json()
+            "response": self.response.to_json() if self.response else None,
+            "error": repr(self.error) if self.error else None
         }
 
 
+class InferenceTimeoutError(TimeoutError):
+    """Raised when a single LLM call exceeds InferenceConfig.request_timeout."""
+    pass
+
+
+@dataclass
+class InferenceConfig:
+    """
+    Optional controls applied to every request that passes through the inference engine.
+
+    The defaults reproduce plain, unbounded parallel ainvoke() calls. Instances are typically
+    long-lived and shared (e.g. one per Expert, or one scheduler shared by all Experts that
+    draw on the same model quota).
+
+    Attributes:
+        scheduler: Caps in-flight requests and orders them by priority (None = unbounded)
+        rate_limiter: Paces requests to stay under TPM/RPM budgets (None = unpaced)
+        request_timeout: Seconds each LLM call may take before it is cancelled and reported as an
+            InferenceTimeoutError (None = no deadline). Time spent queued for a scheduler slot or
+            paced by the rate limiter doesn't count against it.
+        cache: Serves repeated requests from a content-addressed response cache (None = no
+            caching). Only enable for deterministic (temperature 0) experts.
+        deduplicator: Collapses concurrent identical requests into one upstream call whose
+            response is fanned out to every waiter (None = no deduplication)
+        prompt_cache_metrics: Accumulates provider prompt-cache read/creation token counts from
+            each fresh (non-ResponseCache) response (None = not tracked)
+        hedging: Sends a duplicate of calls that are slower than a recent-latency percentile and
+            keeps whichever finishes first, within a bounded extra-request budget (None = off)
+        metrics: Receives an InferenceObservation (latency, tokens, retries, throttling) for
+            every request, and a ToolCallObservation for every response invoke_expert() processes
+            (None = no telemetry)
+        metric_labels: Expert/model/phase labels attached to those observations; an empty model
+            label is filled in from the LLM's model ID
+        cassette: Records provider responses to disk and/or replays them without network calls
+            (None = always call the provider)
+        stream_guard: Streams each response and cancels it as soon as the partial tool call
+            fails a check, reporting a StreamAbortedError (None = plain ainvoke())
+    """
+    scheduler: Optional[InferenceScheduler] = None
+    rate_limiter: Optional[RateLimiter] = None
+    request_timeout: Optional[float] = None
+    cache: Optional[ResponseCache] = None
+    deduplicator: Optional[InflightDeduplicator] = None
+    prompt_cache_metrics: Optional[PromptCacheMetrics] = None
+    hedging: Optional[HedgingPolicy] = None
+    metrics: Optional[MetricsSink] = None
+    metric_labels: MetricLabels = field(default_factory=MetricLabels)
+    cassette: Optional[Cassette] = None
+    stream_guard: Optional[StreamingGuard] = None
+
+
 def perform_inference(
     llm: Runnable[LanguageModelInput, BaseMessage],
-    batched_tasks: List[InferenceRequest]
+    batched_tasks: List[InferenceRequest],
+    config: Optional[InferenceConfig] = None
 ) -> List[InferenceResult]:
     """
     Perform LLM inference on a batch of tasks (synchronous wrapper).
@@ -66,26 +151,34 @@ def perform_inference(
     Args:
         llm: LangChain Runnable (LLM client, typically with tools bound)
         batched_tasks: List of inference requests to process
+        config: Optional controls (scheduling, rate limiting, etc.) applied to each request
 
     Returns:
-        List of inference results (same order as input)
+        List of inference results (same order as input); failed requests carry an error
+        instead of a response
 
-    Note: This wraps async inference in asyncio.run() for easier synchronous usage.
-    Current usage: invoke_expert() passes single-task batches.
-    Future scaling: Can batch multiple tasks for parallel inference.
+    Note: This is a thin shim that submits aperform_inference() to a long-lived background
+    event loop and blocks until it completes. Every synchronous call shares the same loop,
+    so the LLM client's connection pool is reused across calls instead of being rebuilt by
+    a fresh asyncio.run() each time. Callers already running inside an event loop (e.g.
+    FastAPI handlers) should await aperform_inference() directly.
     """
-    return asyncio.run(_perform_async_inference(llm, batched_tasks))
+    return run_on_background_loop(aperform_inference(llm, batched_tasks, config))
 
 
-async def _perform_async_inference(
+async def aperform_inference(
     llm: Runnable[LanguageModelInput, BaseMessage],
-    batched_tasks: List[InferenceRequest]
+    batched_tasks: List[InferenceRequest],
+    config: Optional[InferenceConfig] = None
 ) -> List[InferenceResult]:
     """
-    Perform async batch inference with parallel execution.
+    Perform async batch inference with parallel execution on the caller's event loop.
 
     Uses asyncio.gather() to run all inference calls concurrently.
-    This provides throughput benefits when processing multiple tasks.
+    This provides throughput benefits when processing multiple tasks. When the config has a
+    scheduler, each call first waits for an in-flight slot, so large batches drain at a steady
+    rate instead of all hitting the provider (and its throttling) at once. When it has a rate
+    limiter, each call is additionally paced to stay under the TPM/RPM budgets.
 
     Implementation note:
     Ideally, we'd use provider-native batch APIs (e.g., Bedrock's batch inference),
@@ -95,18 +188,318 @@ async def _perform_async_inference(
     Args:
         llm: LangChain Runnable (LLM client)
         batched_tasks: List of inference requests
+        config: Optional controls (scheduling, rate limiting, etc.) applied to each request
 
     Returns:
-        List of inference results matching input order
+        List of inference results matching input order. Each request fails independently: an
+        exception or timeout in one request is captured in that request's result, and the rest
+        of the batch (already paid for) is still returned.
+    """
+    config = config or InferenceConfig()
+
+    # Execute all invocations in parallel (subject to the scheduler's in-flight limit)
+    return list(await asyncio.gather(
+        *[_perform_single_inference(llm, task, config) for task in batched_tasks]
+    ))
+
+
+async def aperform_inference_as_completed(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    batched_tasks: List[InferenceRequest],
+    config: Optional[InferenceConfig] = None
+) -> AsyncIterator[InferenceResult]:
     """
-    # Create async invocation for each task
-    async_responses = [llm.ainvoke(task.context) for task in batched_tasks]
+    Perform async batch inference, yielding each result as soon as its request finishes.
+
+    Unlike aperform_inference(), which waits for the slowest request in the batch, this lets
+    downstream work (tool execution, validation, the next phase) start on early finishers
+    while the long tail is still in flight. Results arrive in completion order, so use each
+    result's task_id to match it back to its request.
+
+    If the consumer stops iterating early (break, exception, or aclose()), every request that
+    hasn't finished yet is cancelled.
 
-    # Execute all invocations in parallel
-    responses = await asyncio.gather(*async_responses)
+    Args:
+        llm: LangChain Runnable (LLM client)
+        batched_tasks: List of inference requests
+        config: Optional controls (scheduling, rate limiting, etc.) applied to each request
 
-    # Package results
-    return [
-        InferenceResult(task_id=task.task_id, response=response)
-        for task, response in zip(batched_tasks, responses)
+    Yields:
+        Inference results in completion order
+    """
+    config = config or InferenceConfig()
+
+    pending = [
+        asyncio.ensure_future(_perform_single_inference(llm, task, config))
+        for task in batched_tasks
     ]
+    try:
+        for next_completed in asyncio.as_completed(pending):
+            yield await next_completed
+    finally:
+        for future in pending:
+            if not future.done():
+                future.cancel()
+
+
+def run_on_background_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the shared background event loop, blocking the caller.
+
+    This is the bridge used by the synchronous wrappers (perform_inference, invoke_expert).
+    It is safe to call from any thread, including one that is itself running an event loop,
+    because the coroutine executes on a separate, dedicated loop thread.
+
+    It must not be called from the background loop's own thread (e.g. from a callback or a
+    coroutine running on it): the coroutine could only run on the thread that would be blocked
+    waiting for it. Await the async API (ainvoke_expert(), aperform_inference(), ...) there instead.
+
+    Args:
+        coroutine: The coroutine to execute
+
+    Returns:
+        The coroutine's result (exceptions are re-raised in the calling thread)
+
+    Raises:
+        RuntimeError: If called from the background loop's thread
+    """
+    loop = _get_background_loop()
+    if _running_loop() is loop:
+        coroutine.close()  # Never awaited; close it to avoid a "coroutine was never awaited" warning
+        raise RuntimeError(
+            "Synchronous inference wrappers can't be called from the background inference loop's "
+            "thread (it would deadlock); await the async API (e.g. ainvoke_expert()) instead"
+        )
+    future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+    return future.result()
+
+
+@dataclass
+class _RequestTrace:
+    # Timing/throttling facts gathered along the call chain for one request's telemetry
+    started: float = field(default_factory=time.monotonic)
+    service_started: Optional[float] = None  # Stays None if another request made the upstream call
+    throttled: bool = False
+
+
+async def _perform_single_inference(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig
+) -> InferenceResult:
+    trace = _RequestTrace()
+    request_key = None
+    if config.cache is not None or config.deduplicator is not None:
+        request_key = compute_request_key(llm, request.context)
+
+    if config.cache is not None:
+        cached_response = config.cache.get(request_key)
+        if cached_response is not None:
+            logger.debug(f"Response cache hit for task {request.task_id}")
+            result = InferenceResult(task_id=request.task_id, response=cached_response, cache_key=request_key)
+            _record_observation(llm, request, config, trace, result, cache_hit=True)
+            return result
+
+    # Exceptions are captured per request so one bad call can't sink the whole batch.  Cancellation
+    # (a BaseException) still propagates so callers can abandon work.
+    try:
+        if config.deduplicator is None:
+            response = await _schedule_llm_call(llm, request, config, trace)
+        else:
+            response = await config.deduplicator.run(
+                request_key,
+                lambda: _schedule_llm_call(llm, request, config, trace)
+            )
+    except Exception as e:
+        logger.warning(f"Inference failed for task {request.task_id}: {e!r}")
+        result = InferenceResult(task_id=request.task_id, error=e)
+        _record_observation(llm, request, config, trace, result)
+        return result
+
+    cache_key = None
+    if config.cache is not None:
+        config.cache.put(request_key, response)
+        cache_key = request_key
+
+    result = InferenceResult(task_id=request.task_id, response=response, cache_key=cache_key)
+    _record_observation(llm, request, config, trace, result)
+    return result
+
+
+async def _schedule_llm_call(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig,
+    trace: _RequestTrace
+) -> BaseMessage:
+    if config.scheduler is None:
+        return await _invoke_llm(llm, request, config, trace)
+
+    async with config.scheduler.slot(request.priority):
+        return await _invoke_llm(llm, request, config, trace)
+
+
+async def _invoke_llm(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig,
+    trace: _RequestTrace
+) -> BaseMessage:
+    # Report each call's outcome back so the adaptive concurrency window and the hedging budget
+    # can react to throttling
+    try:
+        if config.hedging is None:
+            response, service_seconds = await _invoke_llm_attempt(llm, request, config, trace)
+        else:
+            response, service_seconds = await config.hedging.run(
+                lambda: _invoke_llm_attempt(llm, request, config, trace)
+            )
+    except Exception as e:
+        if is_throttling_error(e):
+            trace.throttled = True
+            _record_throttle(config)
+        raise
+
+    retry_attempts = get_retry_attempts(response)
+    if retry_attempts > 0 and config.hedging is not None:
+        config.hedging.on_throttle()
+    if config.scheduler is not None:
+        # The winning attempt's service time: rate-limiter pacing and the hedge delay are not
+        # provider latency, and counting them would shrink the window while pacing works
+        config.scheduler.record_success(service_seconds, retry_attempts)
+
+    return response
+
+
+def _record_throttle(config: InferenceConfig):
+    if config.scheduler is not None:
+        config.scheduler.record_throttle()
+    if config.hedging is not None:
+        config.hedging.on_throttle()
+
+
+async def _invoke_llm_attempt(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig,
+    trace: _RequestTrace
+) -> Tuple[BaseMessage, float]:
+    # A single call to the provider; with hedging enabled this may run twice for one request.
+    # Returns the response and its service time (from after rate limiting to the response)
+    if config.rate_limiter is None:
+        _mark_service_started(trace)
+        start = time.monotonic()
+        response = await _ainvoke_with_timeout(llm, request, config)
+        service_seconds = time.monotonic() - start
+    else:
+        reserved_tokens = await config.rate_limiter.acquire(request.context)
+        _mark_service_started(trace)
+        start = time.monotonic()
+        response = await _ainvoke_with_timeout(llm, request, config)
+        service_seconds = time.monotonic() - start
+        config.rate_limiter.record_usage(reserved_tokens, response)
+
+    if config.prompt_cache_metrics is not None:
+        config.prompt_cache_metrics.record(response)
+
+    return response, service_seconds
+
+
+def _mark_service_started(trace: _RequestTrace):
+    if trace.service_started is None:
+        trace.service_started = time.monotonic()
+
+
+def _record_observation(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig,
+    trace: _RequestTrace,
+    result: InferenceResult,
+    cache_hit: bool = False
+):
+    if config.metrics is None:
+        return
+
+    now = time.monotonic()
+    deduplicated = config.deduplicator is not None and not cache_hit and trace.service_started is None
+    observation = InferenceObservation(
+        labels=resolve_labels(config.metric_labels, llm),
+        task_id=request.task_id,
+        succeeded=result.succeeded,
+        queue_wait_seconds=(trace.service_started or now) - trace.started,
+        service_seconds=now - trace.service_started if trace.service_started is not None else 0.0,
+        throttled=trace.throttled,
+        cache_hit=cache_hit,
+        deduplicated=deduplicated,
+        error_type=type(result.error).__name__ if result.error is not None else None
+    )
+
+    # Only the request that actually made the upstream call reports its usage, so tokens served
+    # from the response cache or shared by a deduplicated call aren't double counted
+    if result.response is not None and not cache_hit and not deduplicated:
+        usage = getattr(result.response, "usage_metadata", None) or {}
+        observation.input_tokens = usage.get("input_tokens", 0)
+        observation.output_tokens = usage.get("output_tokens", 0)
+        observation.cache_read_tokens = PromptCacheUsage.from_response(result.response).cache_read_tokens
+        observation.retries = get_retry_attempts(result.response)
+        observation.throttled = observation.throttled or observation.retries > 0
+
+    config.metrics.record_inference(observation)
+
+
+async def _ainvoke_with_timeout(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig
+) -> BaseMessage:
+    if config.request_timeout is None:
+        return await _ainvoke(llm, request, config)
+
+    try:
+        return await asyncio.wait_for(_ainvoke(llm, request, config), timeout=config.request_timeout)
+    except asyncio.TimeoutError:
+        raise InferenceTimeoutError(
+            f"LLM call for task {request.task_id} exceeded {config.request_timeout}s"
+        )
+
+
+async def _ainvoke(
+    llm: Runnable[LanguageModelInput, BaseMessage],
+    request: InferenceRequest,
+    config: InferenceConfig
+) -> BaseMessage:
+    if config.cassette is not None:
+        return await config.cassette.ainvoke(llm, request.context)
+    if config.stream_guard is not None:
+        return await config.stream_guard.ainvoke(llm, request.context)
+    return await llm.ainvoke(request.context)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    # Lazily start a single daemon thread that runs an event loop forever.  Keeping the loop alive
+    # between calls is the whole point: async LLM clients cache their HTTP sessions per loop, so a
+    # fresh loop per call would throw the connection pool away every time.
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="inference-background-loop",
+                daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+        return _background_loop
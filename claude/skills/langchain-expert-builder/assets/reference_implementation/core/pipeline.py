@@ -0,0 +1,411 @@
+"""
+Multi-phase Expert pipelines with per-item streaming between phases.
+
+PATTERN DEMONSTRATED: Pipelined DAG execution instead of phase-by-phase batch barriers
+
+A multi-expert workflow is usually run one phase at a time: every mapping task, then every
+transform task. Each phase boundary is a barrier, so the whole dataset waits for the slowest
+call of every phase, and total wall time is the sum of those slowest calls. A Pipeline declares
+the phases as a DAG of (Expert, task factory) steps and runs each input item through the DAG
+on its own: as soon as an item's mapping finishes, its transform task is built and submitted,
+while other items' mappings are still in flight. Wall time approaches the slowest single chain.
+
+KEY CONCEPTS:
+- PipelinePhase: An Expert, a make_task(item, upstream_tasks) factory, the phases it depends
+  on, and optional validation/retry settings
+- Per-phase concurrency: max_concurrency caps how many of a phase's tasks are in flight, so one
+  phase can't starve another that shares the same model quota
+- Failure isolation: If a phase fails for an item, only that item's dependent phases are
+  skipped (recorded as a PipelineDependencyError); other items carry on
+- Streaming results: arun_as_completed() yields each item's result as soon as its whole chain
+  is done
+- Bounded memory: astream() reads items lazily and connects phases through bounded queues
+  (core.backpressure), so a slow downstream phase throttles upstream ones instead of letting
+  finished upstream Tasks pile up; queue depth and wait times show where the bottleneck is
+
+Usage:
+    pipeline = Pipeline([
+        PipelinePhase("mapping", mapping_expert, make_mapping_task, max_concurrency=20),
+        PipelinePhase("transform", transform_expert, make_transform_task, depends_on=["mapping"],
+                      max_concurrency=50, validator=TransformTaskValidator(), max_attempts=3),
+    ])
+    results = await pipeline.arun(jobs)
+
+See json_transformer_expert/pipeline_def.py for the reference implementation's pipeline.
+"""
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
+
+from core.backpressure import BoundedQueue
+from core.base_validator import BaseValidator
+from core.experts import (
+    Expert,
+    ExpertInvocationOutcome,
+    ainvoke_expert,
+    ainvoke_expert_with_validation,
+)
+from core.inference import run_on_background_loop
+from core.scheduling import PRIORITY_DEFAULT
+from core.tasks import Task
+
+
+logger = logging.getLogger(__name__)
+
+TaskFactory = Callable[[Any, Dict[str, Task]], Task]
+
+DEFAULT_QUEUE_SIZE = 100  # Items buffered in front of each phase in astream()
+DEFAULT_STREAM_WORKERS = 16  # Workers for phases without max_concurrency in astream()
+_RESULTS_QUEUE = "results"
+_END_OF_STREAM = object()
+
+
+class PipelineDependencyError(Exception):
+    """Recorded as a phase's error when it was skipped because a phase it depends on failed."""
+    pass
+
+
+@dataclass
+class PipelinePhase:
+    """
+    One step of a Pipeline.
+
+    Attributes:
+        name: Unique phase name (used in depends_on and in results)
+        expert: The Expert that performs this phase's tasks
+        make_task: Builds this phase's Task from the input item and the item's finished upstream
+            Tasks (keyed by phase name)
+        depends_on: Names of the phases whose Tasks make_task needs
+        max_concurrency: Cap on this phase's in-flight tasks across all items (None = unbounded)
+        validator: If set, failed validations are fed back to the Expert (see
+            invoke_expert_with_validation()) and a task that never passes fails the phase
+        max_attempts: Invocation limit per task when a validator is set
+        priority: Scheduling priority for this phase's calls
+    """
+    name: str
+    expert: Expert
+    make_task: TaskFactory
+    depends_on: List[str] = field(default_factory=list)
+    max_concurrency: Optional[int] = None
+    validator: Optional[BaseValidator] = None
+    max_attempts: int = 3
+    priority: int = PRIORITY_DEFAULT
+
+
+@dataclass
+class PipelineItemResult:
+    """
+    Everything one input item produced.
+
+    Attributes:
+        item: The input item
+        tasks: The item's Task for each phase that built one
+        outcomes: The invocation outcome of each phase that ran
+        errors: Why each phase that never ran didn't (PipelineDependencyError, or the exception
+            its make_task raised)
+    """
+    item: Any
+    tasks: Dict[str, Task] = field(default_factory=dict)
+    outcomes: Dict[str, ExpertInvocationOutcome] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors and all(outcome.succeeded for outcome in self.outcomes.values())
+
+    def phase_succeeded(self, phase_name: str) -> bool:
+        outcome = self.outcomes.get(phase_name)
+        return outcome is not None and outcome.succeeded
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for logging/debugging."""
+        return {
+            "succeeded": self.succeeded,
+            "outcomes": {name: outcome.to_json() for name, outcome in self.outcomes.items()},
+            "errors": {name: repr(error) for name, error in self.errors.items()} or None
+        }
+
+
+class Pipeline:
+    """
+    Runs input items through a DAG of PipelinePhases, each item advancing independently.
+    """
+
+    def __init__(self, phases: List[PipelinePhase]):
+        self.phases = _topological_order(phases)
+        self.completed: Dict[str, int] = {phase.name: 0 for phase in self.phases}
+        self.failed: Dict[str, int] = {phase.name: 0 for phase in self.phases}
+        self.queues: Dict[str, BoundedQueue] = {}  # Set by astream()
+
+    def run(self, items: List[Any]) -> List[PipelineItemResult]:
+        """Run the pipeline (synchronous wrapper around arun())."""
+        return run_on_background_loop(self.arun(items))
+
+    async def arun(self, items: List[Any]) -> List[PipelineItemResult]:
+        """
+        Run every item through the pipeline.
+
+        Args:
+            items: Input items, passed to each root phase's make_task
+
+        Returns:
+            One PipelineItemResult per item, in the same order as the input
+        """
+        semaphores = self._make_semaphores()
+        return list(await asyncio.gather(*[self._run_item(item, semaphores) for item in items]))
+
+    async def arun_as_completed(self, items: List[Any]) -> AsyncIterator[PipelineItemResult]:
+        """
+        Run every item through the pipeline, yielding each item's result when its chain finishes.
+
+        If the consumer stops iterating early, items still in progress are cancelled.
+
+        Args:
+            items: Input items, passed to each root phase's make_task
+
+        Yields:
+            One PipelineItemResult per item, in completion order
+        """
+        semaphores = self._make_semaphores()
+        pending = [asyncio.ensure_future(self._run_item(item, semaphores)) for item in items]
+        try:
+            for next_completed in asyncio.as_completed(pending):
+                yield await next_completed
+        finally:
+            for future in pending:
+                if not future.done():
+                    future.cancel()
+
+    async def astream(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        queue_size: int = DEFAULT_QUEUE_SIZE
+    ) -> AsyncIterator[PipelineItemResult]:
+        """
+        Stream items through the pipeline with bounded memory, yielding results as they finish.
+
+        Unlike arun(), which starts every item at once and returns one list, this reads items
+        lazily and connects the phases through BoundedQueues of queue_size. Each phase runs
+        max_concurrency workers (DEFAULT_STREAM_WORKERS if unset) that take items from the
+        phase's queue and hand them on to dependent phases' queues. When a downstream phase
+        falls behind, its queue fills, upstream workers block handing items on, and eventually
+        reading from `items` pauses; so the number of items held in memory is bounded by queue
+        sizes and worker counts, not by the dataset size. Results are also queued, so a slow
+        consumer applies backpressure too.
+
+        Queue depth and wait statistics are available from to_json() during and after the run.
+
+        Args:
+            items: Input items (any iterable or async iterable, e.g. a generator over a file)
+            queue_size: Capacity of each phase's input queue and of the result queue
+
+        Yields:
+            One PipelineItemResult per item, in completion order
+        """
+        self.queues = {phase.name: BoundedQueue(phase.name, queue_size) for phase in self.phases}
+        results: BoundedQueue = BoundedQueue(_RESULTS_QUEUE, queue_size)
+        self.queues[_RESULTS_QUEUE] = results
+        dependents = {
+            phase.name: [other for other in self.phases if phase.name in other.depends_on]
+            for phase in self.phases
+        }
+        progress = _StreamProgress()
+
+        async def finish_phase(state: _ItemState, phase: PipelinePhase):
+            state.finished_phases += 1
+            for dependent in dependents[phase.name]:
+                state.waiting_on[dependent.name] -= 1
+                if state.waiting_on[dependent.name] > 0:
+                    continue
+                failed_dependencies = [
+                    name for name in dependent.depends_on if not state.result.phase_succeeded(name)
+                ]
+                if failed_dependencies:
+                    state.result.errors[dependent.name] = PipelineDependencyError(
+                        f"Skipped because {', '.join(failed_dependencies)} failed"
+                    )
+                    await finish_phase(state, dependent)
+                else:
+                    await self.queues[dependent.name].put(state)
+            if state.finished_phases == len(self.phases):
+                await results.put(state.result)
+
+        async def feed():
+            try:
+                async for item in _iterate(items):
+                    state = _ItemState(
+                        result=PipelineItemResult(item=item),
+                        waiting_on={phase.name: len(phase.depends_on) for phase in self.phases}
+                    )
+                    progress.started += 1
+                    for phase in self.phases:
+                        if not phase.depends_on:
+                            await self.queues[phase.name].put(state)
+            except Exception as e:
+                await results.put(_StreamFailure(e))  # e.g. the input iterator raised
+                return
+            progress.feeding = False
+            if progress.yielded == progress.started:
+                await results.put(_END_OF_STREAM)  # Wake the consumer if it's already waiting
+
+        async def work(phase: PipelinePhase):
+            queue = self.queues[phase.name]
+            while True:
+                state = await queue.get()
+                try:
+                    await self._run_phase(phase, state.result.item, state.result)
+                    await finish_phase(state, phase)
+                except Exception as e:
+                    # Phase failures are captured per item; anything escaping is a bug worth surfacing
+                    await results.put(_StreamFailure(e))
+                    return
+
+        background = [asyncio.ensure_future(feed())]
+        for phase in self.phases:
+            background.extend(
+                asyncio.ensure_future(work(phase))
+                for _ in range(phase.max_concurrency or DEFAULT_STREAM_WORKERS)
+            )
+        try:
+            while progress.feeding or progress.yielded < progress.started:
+                next_result = await results.get()
+                if next_result is _END_OF_STREAM:
+                    continue
+                if isinstance(next_result, _StreamFailure):
+                    raise next_result.error
+                progress.yielded += 1
+                yield next_result
+        finally:
+            for future in background:
+                future.cancel()
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize per-phase statistics (and queue statistics after astream()) for logging/debugging."""
+        stats: Dict[str, Any] = {
+            phase.name: {"completed": self.completed[phase.name], "failed": self.failed[phase.name]}
+            for phase in self.phases
+        }
+        if self.queues:
+            stats["queues"] = {name: queue.to_json() for name, queue in self.queues.items()}
+        return stats
+
+    def _make_semaphores(self) -> Dict[str, Optional[asyncio.Semaphore]]:
+        # Created per run, on the running loop
+        return {
+            phase.name: asyncio.Semaphore(phase.max_concurrency) if phase.max_concurrency else None
+            for phase in self.phases
+        }
+
+    async def _run_item(self, item: Any, semaphores: Dict[str, Optional[asyncio.Semaphore]]) -> PipelineItemResult:
+        result = PipelineItemResult(item=item)
+        finished: Dict[str, asyncio.Future] = {}
+
+        async def run_phase(phase: PipelinePhase):
+            await asyncio.gather(*[finished[name] for name in phase.depends_on])
+            failed_dependencies = [name for name in phase.depends_on if not result.phase_succeeded(name)]
+            if failed_dependencies:
+                result.errors[phase.name] = PipelineDependencyError(
+                    f"Skipped because {', '.join(failed_dependencies)} failed"
+                )
+                return
+
+            semaphore = semaphores[phase.name]
+            if semaphore is None:
+                await self._run_phase(phase, item, result)
+            else:
+                async with semaphore:
+                    await self._run_phase(phase, item, result)
+
+        # Phases are in topological order, so every dependency's future exists before it is awaited
+        for phase in self.phases:
+            finished[phase.name] = asyncio.ensure_future(run_phase(phase))
+        await asyncio.gather(*finished.values())
+        return result
+
+    async def _run_phase(self, phase: PipelinePhase, item: Any, result: PipelineItemResult):
+        await self._perform_phase(phase, item, result)
+        if result.phase_succeeded(phase.name):
+            self.completed[phase.name] += 1
+        else:
+            self.failed[phase.name] += 1
+
+    async def _perform_phase(self, phase: PipelinePhase, item: Any, result: PipelineItemResult):
+        upstream = {name: result.tasks[name] for name in phase.depends_on}
+        try:
+            task = phase.make_task(item, upstream)
+        except Exception as e:
+            logger.warning(f"Pipeline phase {phase.name} could not build its task: {e!r}")
+            result.errors[phase.name] = e
+            return
+        result.tasks[phase.name] = task
+
+        if phase.validator is not None:
+            result.outcomes[phase.name] = await ainvoke_expert_with_validation(
+                phase.expert, task, phase.validator, phase.max_attempts, phase.priority
+            )
+            return
+        try:
+            await ainvoke_expert(phase.expert, task, phase.priority)
+            result.outcomes[phase.name] = ExpertInvocationOutcome(task=task)
+        except Exception as e:
+            logger.warning(f"Pipeline phase {phase.name} failed for task {task.task_id}: {e!r}")
+            result.outcomes[phase.name] = ExpertInvocationOutcome(task=task, error=e)
+
+
+@dataclass
+class _ItemState:
+    # One item's progress through astream(): its result so far and, per phase, how many of the
+    # phase's dependencies are still unfinished
+    result: PipelineItemResult
+    waiting_on: Dict[str, int]
+    finished_phases: int = 0
+
+
+@dataclass
+class _StreamProgress:
+    feeding: bool = True
+    started: int = 0
+    yielded: int = 0
+
+
+@dataclass
+class _StreamFailure:
+    error: Exception
+
+
+async def _iterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _topological_order(phases: List[PipelinePhase]) -> List[PipelinePhase]:
+    by_name = {phase.name: phase for phase in phases}
+    if len(by_name) != len(phases):
+        raise ValueError("Pipeline phase names must be unique")
+    for phase in phases:
+        unknown = [name for name in phase.depends_on if name not in by_name]
+        if unknown:
+            raise ValueError(f"Pipeline phase {phase.name} depends on unknown phase(s): {unknown}")
+
+    ordered: List[PipelinePhase] = []
+    state: Dict[str, str] = {}  # name -> "visiting" | "done"
+
+    def visit(phase: PipelinePhase):
+        if state.get(phase.name) == "done":
+            return
+        if state.get(phase.name) == "visiting":
+            raise ValueError(f"Pipeline phases form a cycle through {phase.name}")
+        state[phase.name] = "visiting"
+        for name in phase.depends_on:
+            visit(by_name[name])
+        state[phase.name] = "done"
+        ordered.append(phase)
+
+    for phase in phases:
+        visit(phase)
+    return ordered
@@ -0,0 +1,138 @@
+"""
+Provider prompt-prefix caching support.
+
+PATTERN DEMONSTRATED: Static-first prompts with explicit cache points
+
+Every task for a given Expert starts with the same role, goal and guidelines, followed by
+task-specific data. Providers can cache a prompt prefix between calls and bill cached tokens
+at a steep discount (and skip re-processing them, which cuts time-to-first-token), but only
+if the prefix is byte-identical and explicitly marked.
+
+KEY CONCEPTS:
+- Templates are split into a static prefix (no placeholders) and a dynamic suffix
+- build_system_message() emits the prefix, a provider-specific cache marker, then the suffix
+- PromptCacheMetrics reads the provider-reported cache_read / cache_creation input token
+  counts so you can verify the cache is actually being hit
+
+NOTE: Providers only cache prefixes above a minimum size (1,024 tokens for most Claude
+models). Short example prompts won't trigger caching; real-world guideline blocks usually do.
+"""
+from dataclasses import dataclass
+from enum import Enum
+import logging
+import threading
+from typing import Any, Dict
+
+from langchain_core.messages import BaseMessage, SystemMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCacheStyle(Enum):
+    """How to mark the end of the cacheable prefix for a given provider."""
+    NONE = "none"  # Plain string prompt, no cache marker
+    BEDROCK = "bedrock"  # Converse API: a separate {"cachePoint": ...} content block
+    ANTHROPIC = "anthropic"  # Messages API: cache_control on the prefix text block
+
+
+def build_system_message(
+    static_prefix: str,
+    dynamic_suffix: str,
+    cache_style: PromptCacheStyle = PromptCacheStyle.NONE
+) -> SystemMessage:
+    """
+    Build a SystemMessage whose static prefix is marked as cacheable for the given provider.
+
+    Args:
+        static_prefix: Content identical across every task for this Expert (role, guidelines, ...)
+        dynamic_suffix: Task-specific content (input data, schemas, prior results, ...)
+        cache_style: Provider-specific cache marker to insert after the prefix
+
+    Returns:
+        SystemMessage with either plain string content (NONE) or content blocks
+    """
+    if cache_style == PromptCacheStyle.NONE:
+        return SystemMessage(content=static_prefix + dynamic_suffix)
+
+    if cache_style == PromptCacheStyle.BEDROCK:
+        return SystemMessage(content=[
+            {"type": "text", "text": static_prefix},
+            {"cachePoint": {"type": "default"}},
+            {"type": "text", "text": dynamic_suffix}
+        ])
+
+    if cache_style == PromptCacheStyle.ANTHROPIC:
+        return SystemMessage(content=[
+            {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": dynamic_suffix}
+        ])
+
+    raise ValueError(f"Unsupported prompt cache style: {cache_style}")
+
+
+@dataclass
+class PromptCacheUsage:
+    """
+    Prompt-cache token counts reported for a single LLM response.
+
+    Attributes:
+        input_tokens: Total input tokens (including cached ones)
+        cache_read_tokens: Input tokens served from the provider's prompt cache
+        cache_creation_tokens: Input tokens written to the provider's prompt cache
+    """
+    input_tokens: int
+    cache_read_tokens: int
+    cache_creation_tokens: int
+
+    @classmethod
+    def from_response(cls, response: BaseMessage) -> 'PromptCacheUsage':
+        usage = getattr(response, "usage_metadata", None) or {}
+        details = usage.get("input_token_details") or {}
+        return cls(
+            input_tokens=usage.get("input_tokens", 0),
+            cache_read_tokens=details.get("cache_read", 0),
+            cache_creation_tokens=details.get("cache_creation", 0)
+        )
+
+
+class PromptCacheMetrics:
+    """
+    Accumulates prompt-cache token counts across LLM calls.
+
+    Usage:
+        metrics = PromptCacheMetrics()
+        expert = Expert(..., inference_config=InferenceConfig(prompt_cache_metrics=metrics))
+        ...
+        logger.info(f"Prompt cache: {metrics.to_json()}")
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of all input tokens that were served from the prompt cache."""
+        return self.cache_read_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def record(self, response: BaseMessage):
+        usage = PromptCacheUsage.from_response(response)
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += usage.input_tokens
+            self.cache_read_tokens += usage.cache_read_tokens
+            self.cache_creation_tokens += usage.cache_creation_tokens
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for logging/debugging."""
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "hit_ratio": round(self.hit_ratio, 4)
+        }
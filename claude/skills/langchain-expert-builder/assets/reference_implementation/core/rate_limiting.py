@@ -0,0 +1,213 @@
+"""
+Token-per-minute and request-per-minute budgeting for LLM calls.
+
+PATTERN DEMONSTRATED: Client-side pacing against provider quotas
+
+Providers like Bedrock enforce per-model quotas in both tokens per minute (TPM) and requests
+per minute (RPM). If the client has no notion of either, the first sign of the limit is a
+wave of ThrottlingExceptions followed by long retry back-offs. The RateLimiter paces calls so
+the configured budgets are never exceeded in the first place.
+
+KEY CONCEPTS:
+- Two token buckets: one for requests, one for tokens; a call proceeds when both can pay
+- Estimate-then-reconcile: Input tokens are estimated from the context before sending; the
+  actual usage reported in the response's usage_metadata (input + output) is debited afterwards
+- Debt: Reconciliation may push the token bucket negative, which delays subsequent calls
+  until the overspend has been repaid
+- Headroom: Budgets are scaled down slightly so we stay just under the quota rather than on it
+
+DESIGN CHOICE: FIFO pacing behind an asyncio.Lock
+- Rationale: Requests are admitted in arrival order, so a large request can't be starved by
+  a stream of small ones that always fit in the bucket first
+- Trade-off: Pacing is serialized, but pacing waits are cheap compared to LLM latency
+
+NOTE: Like InferenceScheduler, a RateLimiter is bound to the event loop it is first used on.
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage
+
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4  # Rough average for English text and JSON across common tokenizers
+MESSAGE_OVERHEAD_TOKENS = 4  # Role markers and separators the provider adds per message
+DEFAULT_HEADROOM = 0.9  # Target 90% of the quota to absorb estimation error and clock skew
+
+
+def estimate_tokens(context: List[BaseMessage]) -> int:
+    """
+    Estimate the input token count of a conversation without calling a tokenizer.
+
+    Args:
+        context: The messages that will be sent to the LLM
+
+    Returns:
+        Approximate number of input tokens
+    """
+    total_chars = 0
+    for message in context:
+        total_chars += len(str(message.content))
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            total_chars += len(str(tool_call.get("args", "")))
+    return total_chars // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS * len(context)
+
+
+def get_actual_tokens(response: BaseMessage) -> Optional[int]:
+    """
+    Get the total (input + output) tokens reported by the provider for a response.
+
+    Returns:
+        The token count, or None if the provider didn't report usage
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return None
+    return usage.get("total_tokens", usage.get("input_tokens", 0) + usage.get("output_tokens", 0))
+
+
+class TokenBucket:
+    """
+    A token bucket refilled continuously at a per-minute rate, holding at most one minute of budget.
+
+    The balance may go negative via debit(), representing spend that must be repaid by refill.
+    """
+
+    def __init__(self, per_minute: float):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.capacity = per_minute
+        self._refill_per_second = per_minute / 60.0
+        self._balance = per_minute
+        self._last_refill = time.monotonic()
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+    def seconds_until_available(self, amount: float) -> float:
+        """How long until `amount` can be consumed (0 if it can be consumed now)."""
+        self._refill()
+        # A single request larger than the bucket could never fit; treat it as needing a full bucket
+        amount = min(amount, self.capacity)
+        shortfall = amount - self._balance
+        return max(0.0, shortfall / self._refill_per_second)
+
+    def consume(self, amount: float) -> float:
+        """
+        Take `amount` from the balance, capped at one full bucket.
+
+        Returns:
+            The amount actually taken (what a later debit() should be reconciled against)
+        """
+        self._refill()
+        consumed = min(amount, self.capacity)
+        self._balance -= consumed
+        return consumed
+
+    def debit(self, amount: float):
+        """Adjust the balance after the fact (positive = overspend, negative = refund)."""
+        self._refill()
+        self._balance = min(self.capacity, self._balance - amount)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._balance = min(self.capacity, self._balance + (now - self._last_refill) * self._refill_per_second)
+        self._last_refill = now
+
+
+class RateLimiter:
+    """
+    Paces LLM calls to stay under token-per-minute and request-per-minute budgets.
+
+    Usage:
+        limiter = RateLimiter(tokens_per_minute=400_000, requests_per_minute=200)
+
+        reserved_tokens = await limiter.acquire(context)
+        response = await llm.ainvoke(context)
+        limiter.record_usage(reserved_tokens, response)
+
+    Either budget may be None to leave that dimension unlimited.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        headroom: float = DEFAULT_HEADROOM
+    ):
+        if not 0 < headroom <= 1:
+            raise ValueError("headroom must be in (0, 1]")
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._token_bucket = TokenBucket(tokens_per_minute * headroom) if tokens_per_minute else None
+        self._request_bucket = TokenBucket(requests_per_minute * headroom) if requests_per_minute else None
+        self._lock = asyncio.Lock()
+
+    @property
+    def remaining_fraction(self) -> float:
+        """Fraction (0-1) of the tighter of the two budgets currently available."""
+        fractions = [
+            max(0.0, bucket.balance) / bucket.capacity
+            for bucket in (self._token_bucket, self._request_bucket)
+            if bucket is not None
+        ]
+        return min(fractions) if fractions else 1.0
+
+    async def acquire(self, context: List[BaseMessage]) -> float:
+        """
+        Wait until the request fits within both budgets, then reserve its share.
+
+        Args:
+            context: The messages about to be sent to the LLM
+
+        Returns:
+            The token count actually reserved (pass to record_usage()): the estimate, capped at
+            the token bucket's capacity
+        """
+        estimated_tokens = estimate_tokens(context)
+
+        async with self._lock:
+            while True:
+                wait_seconds = 0.0
+                if self._request_bucket is not None:
+                    wait_seconds = max(wait_seconds, self._request_bucket.seconds_until_available(1))
+                if self._token_bucket is not None:
+                    wait_seconds = max(wait_seconds, self._token_bucket.seconds_until_available(estimated_tokens))
+
+                if wait_seconds <= 0:
+                    break
+
+                logger.debug(f"Rate limiter pacing request for {wait_seconds:.2f}s")
+                await asyncio.sleep(wait_seconds)
+
+            if self._request_bucket is not None:
+                self._request_bucket.consume(1)
+            reserved_tokens = estimated_tokens
+            if self._token_bucket is not None:
+                reserved_tokens = self._token_bucket.consume(estimated_tokens)
+
+        return reserved_tokens
+
+    def record_usage(self, reserved_tokens: float, response: BaseMessage):
+        """
+        Reconcile the token budget with the provider-reported usage of a completed call.
+
+        Args:
+            reserved_tokens: The value returned by acquire() for this call
+            response: The LLM response (its usage_metadata is read if present)
+        """
+        if self._token_bucket is None:
+            return
+
+        actual_tokens = get_actual_tokens(response)
+        if actual_tokens is None:
+            return
+
+        # Settle against what was actually charged: a request larger than the bucket was only
+        # charged one full bucket, so settling against its estimate would refund tokens never spent
+        self._token_bucket.debit(actual_tokens - reserved_tokens)
@@ -0,0 +1,251 @@
+"""
+Health-weighted routing of LLM calls across equivalent backends.
+
+PATTERN DEMONSTRATED: Client-side load balancing with outlier ejection
+
+Expert.llm is normally one Runnable bound to one model in one region, so throughput is capped
+by that one quota. When the same (or an equivalent) model is available in several regions or
+under several model IDs, LLMRouter spreads calls across all of them, so aggregate throughput
+becomes the sum of the quotas.
+
+KEY CONCEPTS:
+- Weighted choice: Each call goes to a backend chosen at random with probability proportional
+  to weight / (EWMA latency x (1 + in-flight calls)), scaled down by the backend's recent error
+  rate and, if it has a RateLimiter, by its remaining quota
+- Per-backend pacing: A backend's RateLimiter paces only that backend's calls, so each
+  regional TPM/RPM budget is respected independently
+- Error classification: Only transient errors (throttling, timeouts, connection failures, 5xx;
+  see is_transient_error()) count against a backend and fail over. Other errors (a context
+  that is too long, validation errors, other 4xx) are the request's fault and are raised at once
+- Ejection: A throttled backend, or one with eject_after_failures consecutive failures, is
+  taken out of rotation for an exponentially growing cooldown
+- Recovery: When the cooldown expires the backend gets one probe call at a time; a success
+  restores it, a failure re-ejects it with a longer cooldown
+- Failover: A call that failed transiently is retried on a different backend, up to
+  max_attempts in total
+- Never empty: If every backend is ejected, calls go to the one closest to recovering
+
+Usage:
+    router = LLMRouter([
+        RouterBackend("us-west-2", west_llm.bind_tools(tools), rate_limiter=RateLimiter(400_000, 200)),
+        RouterBackend("us-east-1", east_llm.bind_tools(tools), rate_limiter=RateLimiter(400_000, 200)),
+    ])
+    expert = Expert(llm=router, ...)
+
+NOTE: Backends must be interchangeable. Bind the same tools to each, and use the same prompt
+conventions, because any backend may serve any request.
+"""
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from core.adaptive_concurrency import is_throttling_error, is_transient_error
+from core.caching import describe_llm
+from core.rate_limiting import RateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+LATENCY_EWMA_ALPHA = 0.2  # Weight of each new latency sample; reacts within ~5 calls
+ERROR_EWMA_ALPHA = 0.1  # Weight of each new success/failure sample in the error rate
+DEFAULT_LATENCY_SECONDS = 1.0  # Assumed latency for backends with no samples yet and nothing to compare with
+MIN_HEALTH_FACTOR = 0.05  # Floor on error/quota scaling so a degraded backend still gets occasional traffic
+
+
+class RouterBackend:
+    """
+    One routable LLM endpoint plus its observed health.
+
+    Attributes:
+        name: Label for logs and stats (e.g. region or model ID)
+        llm: The Runnable to call (typically a chat model with tools bound)
+        rate_limiter: Optional pacing for this backend's own TPM/RPM quota
+        weight: Static preference multiplier (e.g. 2.0 for a backend with twice the quota)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        rate_limiter: Optional[RateLimiter] = None,
+        weight: float = 1.0
+    ):
+        self.name = name
+        self.llm = llm
+        self.rate_limiter = rate_limiter
+        self.weight = weight
+        self.latency_ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0  # Consecutive ejections; drives the exponential cooldown
+        self.ejected_until = 0.0
+        self.on_probation = False
+
+    def is_available(self, now: float) -> bool:
+        if now < self.ejected_until:
+            return False
+        # After a cooldown, allow a single probe call at a time until one succeeds
+        return not (self.on_probation and self.in_flight > 0)
+
+    def routing_weight(self, default_latency: float) -> float:
+        latency = self.latency_ewma if self.latency_ewma is not None else default_latency
+        health = max(MIN_HEALTH_FACTOR, 1.0 - self.error_rate)
+        quota = 1.0 if self.rate_limiter is None else max(MIN_HEALTH_FACTOR, self.rate_limiter.remaining_fraction)
+        return self.weight * health * quota / (max(latency, 1e-3) * (1 + self.in_flight))
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize health for logging/debugging."""
+        return {
+            "name": self.name,
+            "latency_ewma": round(self.latency_ewma, 4) if self.latency_ewma is not None else None,
+            "error_rate": round(self.error_rate, 4),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejected": self.ejected_until > time.monotonic(),
+            "on_probation": self.on_probation
+        }
+
+
+class LLMRouter(Runnable[LanguageModelInput, BaseMessage]):
+    """
+    Runnable that spreads invoke()/ainvoke() calls across equivalent backends by observed health.
+
+    Drop-in replacement for Expert.llm. Cache/deduplication keys are derived from the first
+    backend, since all backends are expected to answer the same request the same way.
+    """
+
+    def __init__(
+        self,
+        backends: List[RouterBackend],
+        eject_after_failures: int = 5,
+        base_ejection_seconds: float = 10.0,
+        max_ejection_seconds: float = 300.0,
+        max_attempts: int = 2,
+        seed: Optional[int] = None
+    ):
+        if not backends:
+            raise ValueError("LLMRouter needs at least one backend")
+        if len({backend.name for backend in backends}) != len(backends):
+            raise ValueError("LLMRouter backend names must be unique")
+        self.backends = backends
+        self.eject_after_failures = eject_after_failures
+        self.base_ejection_seconds = base_ejection_seconds
+        self.max_ejection_seconds = max_ejection_seconds
+        self.max_attempts = max_attempts
+        self._rng = random.Random(seed)
+
+    def get_llm_string(self) -> str:
+        """Model configuration used for cache keys (see core.caching.compute_request_key())."""
+        return describe_llm(self.backends[0].llm)
+
+    def invoke(self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any) -> BaseMessage:
+        # Synchronous path: same routing and health tracking, but no RateLimiter pacing
+        # (RateLimiter is asyncio-based)
+        tried: Set[str] = set()
+        while True:
+            backend = self._choose(tried)
+            tried.add(backend.name)
+            start = self._on_start(backend)
+            try:
+                response = backend.llm.invoke(input, config, **kwargs)
+            except Exception as e:
+                if not is_transient_error(e):
+                    raise  # The request itself is bad; every backend would reject it
+                self._on_failure(backend, e)
+                if not self._should_failover(tried):
+                    raise
+                continue
+            finally:
+                backend.in_flight -= 1
+            self._on_success(backend, time.monotonic() - start)
+            return response
+
+    async def ainvoke(self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any) -> BaseMessage:
+        tried: Set[str] = set()
+        while True:
+            backend = self._choose(tried)
+            tried.add(backend.name)
+            start = self._on_start(backend)
+            try:
+                if backend.rate_limiter is None:
+                    response = await backend.llm.ainvoke(input, config, **kwargs)
+                else:
+                    reserved_tokens = await backend.rate_limiter.acquire(input)
+                    start = time.monotonic()  # Pacing delay isn't backend latency
+                    response = await backend.llm.ainvoke(input, config, **kwargs)
+                    backend.rate_limiter.record_usage(reserved_tokens, response)
+            except Exception as e:
+                if not is_transient_error(e):
+                    raise  # The request itself is bad; every backend would reject it
+                self._on_failure(backend, e)
+                if not self._should_failover(tried):
+                    raise
+                continue
+            finally:
+                backend.in_flight -= 1
+            self._on_success(backend, time.monotonic() - start)
+            return response
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """Serialize per-backend health for logging/debugging."""
+        return [backend.to_json() for backend in self.backends]
+
+    def _choose(self, tried: Set[str]) -> RouterBackend:
+        now = time.monotonic()
+        untried = [backend for backend in self.backends if backend.name not in tried] or self.backends
+        candidates = [backend for backend in untried if backend.is_available(now)]
+        if not candidates:
+            # Everything is ejected; rather than failing outright, use the backend closest to recovering
+            return min(untried, key=lambda backend: backend.ejected_until)
+
+        known_latencies = [backend.latency_ewma for backend in self.backends if backend.latency_ewma is not None]
+        default_latency = sum(known_latencies) / len(known_latencies) if known_latencies else DEFAULT_LATENCY_SECONDS
+        weights = [backend.routing_weight(default_latency) for backend in candidates]
+        return self._rng.choices(candidates, weights=weights)[0]
+
+    def _should_failover(self, tried: Set[str]) -> bool:
+        return len(tried) < min(self.max_attempts, len(self.backends))
+
+    def _on_start(self, backend: RouterBackend) -> float:
+        backend.in_flight += 1
+        backend.requests += 1
+        return time.monotonic()
+
+    def _on_success(self, backend: RouterBackend, latency: float):
+        if backend.latency_ewma is None:
+            backend.latency_ewma = latency
+        else:
+            backend.latency_ewma += LATENCY_EWMA_ALPHA * (latency - backend.latency_ewma)
+        backend.error_rate *= 1 - ERROR_EWMA_ALPHA
+        backend.consecutive_failures = 0
+        if backend.on_probation:
+            logger.info(f"Router backend {backend.name} recovered")
+            backend.on_probation = False
+            backend.ejections = 0
+
+    def _on_failure(self, backend: RouterBackend, error: Exception):
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        backend.error_rate += ERROR_EWMA_ALPHA * (1.0 - backend.error_rate)
+        logger.debug(f"Router backend {backend.name} failed: {error!r}")
+
+        if is_throttling_error(error) or backend.on_probation \
+                or backend.consecutive_failures >= self.eject_after_failures:
+            self._eject(backend)
+
+    def _eject(self, backend: RouterBackend):
+        backend.ejections += 1
+        cooldown = min(self.max_ejection_seconds, self.base_ejection_seconds * 2 ** (backend.ejections - 1))
+        backend.ejected_until = time.monotonic() + cooldown
+        backend.on_probation = True
+        backend.consecutive_failures = 0
+        logger.warning(f"Ejected router backend {backend.name} for {cooldown:.0f}s")
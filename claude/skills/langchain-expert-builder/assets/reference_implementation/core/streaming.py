@@ -0,0 +1,173 @@
+"""
+Streaming inference with early abort on invalid partial tool calls.
+
+PATTERN DEMONSTRATED: Fail-fast validation of structured output while it is being generated
+
+A tool call such as GenerateTransformCode can run to thousands of output tokens, and with
+ainvoke() a broken one is only discovered after all of them have been generated (and paid
+for). With a StreamingGuard in the InferenceConfig, the inference engine calls astream()
+instead, accumulates the tool-call argument text as chunks arrive, periodically parses it
+with parse_partial_json, and runs cheap checks on the partial arguments. The first check to
+object closes the stream, which cancels the generation, and the request fails with a
+StreamAbortedError.
+
+KEY CONCEPTS:
+- Partial checks: Callables (tool_name, partial_args) -> reason or None. partial_args is the
+  best-effort parse (parse_partial_json) of the JSON so far, so the last string value may be
+  cut off mid-way; checks must only reject what can no longer become valid
+- Invalid JSON: Arguments that can't be parsed even as a prefix abort the stream by default
+- check_interval_chars: Checks run after every this-many new argument characters (and once at
+  the end), bounding parse/check cost on long outputs
+- An abort is an ordinary per-request failure: it surfaces as the InferenceResult error, so
+  invoke_expert() raises it and validation retry loops treat it like any other failed attempt
+
+TRADE-OFF: LangChain builds (and partially parses) one AIMessageChunk per streamed chunk,
+which costs a few milliseconds of CPU per response on top of ainvoke(). Enable the guard for
+Experts with long structured outputs, where an early abort saves seconds.
+
+Usage:
+    guard = StreamingGuard(checks=[check_partial_transform_code])
+    expert.inference_config.stream_guard = guard
+
+NOTE: When a Cassette is configured it serves the request instead (recorded responses are
+complete), so partial checks don't run on replays.
+"""
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessageChunk, BaseMessage, message_chunk_to_message
+from langchain_core.messages.ai import add_ai_message_chunks
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_partial_json
+
+
+logger = logging.getLogger(__name__)
+
+PartialToolCallCheck = Callable[[str, Dict[str, Any]], Optional[str]]
+
+DEFAULT_CHECK_INTERVAL_CHARS = 200  # Re-parse and check after this many new argument characters
+
+
+class StreamAbortedError(Exception):
+    """Raised when a partial tool call fails a StreamingGuard check and generation is cancelled."""
+    pass
+
+
+class StreamingGuard:
+    """
+    Streams LLM responses and aborts them as soon as a partial tool call fails a check.
+
+    Attributes:
+        checks: Partial tool-call checks, run in order
+        abort_on_invalid_json: Abort when the arguments can't be parsed as a JSON prefix
+        check_interval_chars: New argument characters between check runs
+    """
+
+    def __init__(
+        self,
+        checks: Optional[List[PartialToolCallCheck]] = None,
+        abort_on_invalid_json: bool = True,
+        check_interval_chars: int = DEFAULT_CHECK_INTERVAL_CHARS
+    ):
+        self.checks = checks or []
+        self.abort_on_invalid_json = abort_on_invalid_json
+        self.check_interval_chars = check_interval_chars
+        self.streams = 0
+        self.aborts = 0
+        self.aborted_argument_chars = 0  # Argument characters generated before each abort
+
+    async def ainvoke(
+        self,
+        llm: Runnable[LanguageModelInput, BaseMessage],
+        context: List[BaseMessage]
+    ) -> BaseMessage:
+        """
+        Stream a response from the LLM, checking partial tool calls as they arrive.
+
+        Args:
+            llm: The LangChain Runnable to stream from
+            context: The conversation to send
+
+        Returns:
+            The complete response, as the equivalent non-chunk message
+
+        Raises:
+            StreamAbortedError: If a check rejected the partial tool call
+        """
+        self.streams += 1
+        chunks: List[BaseMessage] = []
+        arguments: Dict[int, _PartialToolCall] = {}
+        argument_chars = 0
+        checked_chars = 0
+
+        stream = llm.astream(context)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                # Accumulate argument text ourselves: adding AIMessageChunks together re-parses
+                # all arguments so far on every chunk, which is quadratic in the output length
+                for tool_call_chunk in getattr(chunk, "tool_call_chunks", []):
+                    partial = arguments.setdefault(tool_call_chunk.get("index") or 0, _PartialToolCall())
+                    partial.add(tool_call_chunk)
+                    argument_chars += len(tool_call_chunk.get("args") or "")
+                if argument_chars - checked_chars >= self.check_interval_chars:
+                    checked_chars = argument_chars
+                    self._check(arguments.values(), argument_chars, final=False)
+            if not chunks:
+                raise StreamAbortedError("LLM stream ended without producing a message")
+            self._check(arguments.values(), argument_chars, final=True)
+        finally:
+            # Closing the stream early cancels the underlying generation
+            await stream.aclose()
+
+        if all(isinstance(chunk, AIMessageChunk) for chunk in chunks):
+            return message_chunk_to_message(add_ai_message_chunks(*chunks))
+        return chunks[-1]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize guard statistics for logging/debugging."""
+        return {
+            "streams": self.streams,
+            "aborts": self.aborts,
+            "aborted_argument_chars": self.aborted_argument_chars
+        }
+
+    def _check(self, tool_calls: Iterable["_PartialToolCall"], argument_chars: int, final: bool):
+        reason = None
+        for tool_call in tool_calls:
+            parsed_args = parse_partial_json(tool_call.args) if tool_call.args else {}
+            if parsed_args is None:
+                if self.abort_on_invalid_json:
+                    reason = f"tool call arguments are not valid JSON: {tool_call.args!r:.200}"
+                    break
+                continue
+            for check in self.checks:
+                reason = check(tool_call.name, parsed_args)
+                if reason is not None:
+                    break
+            if reason is not None:
+                break
+
+        if reason is None:
+            return
+        self.aborts += 1
+        self.aborted_argument_chars += argument_chars
+        stage = "completed" if final else "partial"
+        logger.info(f"Aborting LLM stream on {stage} tool call: {reason}")
+        raise StreamAbortedError(reason)
+
+
+class _PartialToolCall:
+    # Name and argument text of one tool call, gathered from its streamed chunks
+    def __init__(self):
+        self.name = ""
+        self._pieces: List[str] = []
+
+    @property
+    def args(self) -> str:
+        return "".join(self._pieces)
+
+    def add(self, tool_call_chunk: Dict[str, Any]):
+        self.name += tool_call_chunk.get("name") or ""
+        self._pieces.append(tool_call_chunk.get("args") or "")
@@ -0,0 +1,388 @@
+"""
+SQLite-backed repository of Tasks for very large jobs.
+
+PATTERN DEMONSTRATED: Persistent task queue with indexed status queries and leases
+
+Keeping millions of Tasks (each with its conversation context) in memory doesn't scale, and
+neither does answering "which tasks still have no mapping report?" by loading all of them. A
+TaskRepository stores each Task's to_json() in one SQLite row, next to the indexed columns
+those questions filter on: phase, status and validation outcome. Workers lease batches of
+pending Tasks, invoke them, and write the outcomes back; queries page through the table by key,
+so memory stays flat however many rows there are.
+
+KEY CONCEPTS:
+- Status: PENDING (no work item yet, or a failed invocation to retry), LEASED (claimed by a
+  worker), COMPLETED (work item that passed validation, or no validator ran), FAILED (work item
+  that failed validation, or out of attempts)
+- Leases: lease() claims up to N pending Tasks for lease_seconds in one write transaction, so
+  concurrent workers (threads or processes) never get the same Task. A lease that expires
+  (worker crashed) makes its Tasks claimable again, until they have been leased max_attempts
+  times
+- Stale writes: record_outcomes() only updates rows still leased by this repository's
+  worker_id, so a worker whose lease expired can't overwrite the new holder's result
+- Keyset pagination: iter_tasks() fetches page_size rows at a time with "task_id > last seen",
+  which stays fast on the millionth page (unlike OFFSET)
+- Indexes: (phase, status, task_id) and (phase, validation_passed, task_id) serve both the
+  filters and the task_id ordering of every query that names a phase
+- Task types must implement Task.from_json() to be read back
+
+DESIGN CHOICE: SQLite in WAL mode
+- Rationale: No server to run, and WAL lets readers (reports, iter_tasks()) work while workers
+  write. Lease transactions start with BEGIN IMMEDIATE, which serializes claims across processes
+- Trade-off: One writer at a time; lease and record in batches so each transaction covers many
+  Tasks
+
+Usage:
+    repository = TaskRepository("jobs/transform.sqlite", task_types={"mapping": MappingTask})
+    repository.add(build_tasks(), phase="mapping")
+
+    while tasks := repository.lease("mapping", limit=100):
+        outcomes = invoke_experts(expert, tasks)
+        repository.record_outcomes(outcomes)
+
+    for task in repository.iter_tasks("mapping", validation_passed=False):
+        inspect(task)
+"""
+from enum import Enum
+from itertools import islice
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+import uuid
+
+from core.experts import ExpertInvocationOutcome
+from core.tasks import Task
+from core.validation_report import ValidationReport
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 600.0  # How long a worker may hold leased Tasks before they are reclaimed
+DEFAULT_PAGE_SIZE = 500        # Rows fetched per keyset page in iter_tasks()
+WRITE_BATCH_SIZE = 1000        # Rows per INSERT batch in add()
+
+
+class TaskStatus(Enum):
+    PENDING = "pending"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class TaskRepository:
+    """
+    Persistent, indexed store of Tasks with leasing for workers.
+
+    Thread-safe: the same repository may be used from the background inference loop and other
+    threads. Separate processes should each open their own TaskRepository on the same file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        task_types: Dict[str, Type[Task]],
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = 3,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            task_types: Task class of each phase, used to rebuild rows with from_json()
+            lease_seconds: How long leased Tasks stay claimed without a recorded outcome
+            max_attempts: Leases per Task before a Task whose invocations keep raising is FAILED
+            worker_id: Lease owner name (default: a random ID per repository)
+        """
+        self.path = path
+        self.task_types = task_types
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or uuid.uuid4().hex
+        self._lock = threading.Lock()
+        # Autocommit mode; transactions are opened explicitly so leases can use BEGIN IMMEDIATE
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=30000")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "task_id TEXT PRIMARY KEY, phase TEXT NOT NULL, status TEXT NOT NULL, "
+            "validation_passed INTEGER, attempts INTEGER NOT NULL DEFAULT 0, "
+            "lease_owner TEXT, lease_expires_at REAL, updated_at REAL NOT NULL, "
+            "error TEXT, validation_report TEXT, payload TEXT NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS tasks_phase_status ON tasks (phase, status, task_id)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS tasks_phase_validation ON tasks (phase, validation_passed, task_id)"
+        )
+
+    def add(self, tasks: Iterable[Task], phase: str) -> int:
+        """
+        Insert Tasks as PENDING. Tasks whose task_id is already stored are left untouched, so
+        re-adding a whole input set after a restart is safe.
+
+        Args:
+            tasks: Tasks to insert; consumed lazily, in batches
+            phase: Phase the Tasks belong to (a key of task_types)
+
+        Returns:
+            Number of Tasks inserted
+        """
+        self._task_type(phase)
+        inserted = 0
+        tasks = iter(tasks)
+        while batch := list(islice(tasks, WRITE_BATCH_SIZE)):
+            now = time.time()
+            rows = [
+                (task.task_id, phase, TaskStatus.PENDING.value, now, json.dumps(task.to_json()))
+                for task in batch
+            ]
+            with self._lock, self._transaction():
+                before = self._connection.total_changes
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO tasks (task_id, phase, status, updated_at, payload) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                inserted += self._connection.total_changes - before
+        return inserted
+
+    def lease(self, phase: str, limit: int) -> List[Task]:
+        """
+        Claim up to limit Tasks of a phase: ones whose lease has expired, then PENDING ones.
+
+        Expired leases of Tasks that have already been leased max_attempts times are marked
+        FAILED instead of being claimed.
+
+        Args:
+            phase: Phase to take Tasks from
+            limit: Largest number of Tasks to claim
+
+        Returns:
+            The claimed Tasks; an empty list once the phase has nothing left to claim
+        """
+        task_type = self._task_type(phase)
+        now = time.time()
+        with self._lock, self._transaction(immediate=True):
+            # An expired lease that used up the attempts is a Task that keeps crashing or hanging
+            # its worker: fail it rather than hand it out again
+            exhausted = self._connection.execute(
+                "UPDATE tasks SET status = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE phase = ? AND status = ? AND lease_expires_at < ? AND attempts >= ?",
+                (
+                    TaskStatus.FAILED.value, "Lease expired on the final attempt", now,
+                    phase, TaskStatus.LEASED.value, now, self.max_attempts
+                )
+            ).rowcount
+            # Expired leases first, so a crashed worker's Tasks aren't left until the end of the run
+            rows = self._connection.execute(
+                "SELECT task_id, payload FROM tasks "
+                "WHERE phase = ? AND status = ? AND lease_expires_at < ? LIMIT ?",
+                (phase, TaskStatus.LEASED.value, now, limit)
+            ).fetchall()
+            if len(rows) < limit:
+                rows += self._connection.execute(
+                    "SELECT task_id, payload FROM tasks WHERE phase = ? AND status = ? LIMIT ?",
+                    (phase, TaskStatus.PENDING.value, limit - len(rows))
+                ).fetchall()
+            self._connection.executemany(
+                "UPDATE tasks SET status = ?, lease_owner = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE task_id = ?",
+                [
+                    (TaskStatus.LEASED.value, self.worker_id, now + self.lease_seconds, now, task_id)
+                    for task_id, _ in rows
+                ]
+            )
+
+        if exhausted:
+            logger.warning(f"Failed {exhausted} {phase} task(s) whose lease expired on the final attempt")
+        logger.debug(f"Leased {len(rows)} {phase} task(s) to worker {self.worker_id}")
+        return [task_type.from_json(json.loads(payload)) for _, payload in rows]
+
+    def record_outcomes(self, outcomes: Iterable[ExpertInvocationOutcome]) -> int:
+        """
+        Write leased Tasks back with their invocation outcomes, in one transaction.
+
+        A Task with a work item becomes COMPLETED (no validator ran, or it passed) or FAILED
+        (validation failed). A Task whose invocation raised goes back to PENDING for another
+        lease, or becomes FAILED once it has been leased max_attempts times.
+
+        Args:
+            outcomes: Outcomes of Tasks leased by this repository
+
+        Returns:
+            Number of Tasks updated; outcomes for Tasks no longer leased by this worker (the
+            lease expired and was reclaimed) are skipped
+        """
+        now = time.time()
+        rows = [self._outcome_row(outcome, now) for outcome in outcomes]
+        with self._lock, self._transaction():
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "UPDATE tasks SET "
+                "status = CASE WHEN ? IS NOT NULL THEN ? WHEN attempts >= ? THEN ? ELSE ? END, "
+                "validation_passed = ?, error = ?, validation_report = ?, payload = ?, "
+                "lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_owner = ?",
+                rows
+            )
+            updated = self._connection.total_changes - before
+
+        if updated < len(rows):
+            logger.warning(f"Skipped {len(rows) - updated} outcome(s) whose lease was no longer held by {self.worker_id}")
+        return updated
+
+    def requeue_failed(self, phase: str) -> int:
+        """
+        Make a phase's FAILED Tasks PENDING again with a fresh attempt budget (e.g. after
+        fixing a prompt). Their stored context, including validation feedback, is kept.
+
+        Returns:
+            Number of Tasks requeued
+        """
+        with self._lock, self._transaction():
+            cursor = self._connection.execute(
+                "UPDATE tasks SET status = ?, attempts = 0, updated_at = ? WHERE phase = ? AND status = ?",
+                (TaskStatus.PENDING.value, time.time(), phase, TaskStatus.FAILED.value)
+            )
+        return cursor.rowcount
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Load one Task by ID, or None if it isn't stored."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT phase, payload FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        phase, payload = row
+        return self._task_type(phase).from_json(json.loads(payload))
+
+    def iter_tasks(
+        self,
+        phase: str,
+        status: Optional[TaskStatus] = None,
+        validation_passed: Optional[bool] = None,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[Task]:
+        """
+        Iterate over a phase's Tasks in task_id order, page_size rows at a time.
+
+        Only one page is held in memory; rows written while iterating may or may not be seen.
+
+        Args:
+            phase: Phase to read
+            status: Only Tasks with this status
+            validation_passed: Only Tasks whose latest validation passed (True) or failed (False)
+            page_size: Rows fetched per query
+
+        Yields:
+            Tasks rebuilt with from_json()
+        """
+        task_type = self._task_type(phase)
+        where, parameters = self._filters(phase, status, validation_passed)
+        last_task_id = ""
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT task_id, payload FROM tasks WHERE {where} AND task_id > ? ORDER BY task_id LIMIT ?",
+                    (*parameters, last_task_id, page_size)
+                ).fetchall()
+            for _, payload in rows:
+                yield task_type.from_json(json.loads(payload))
+            if len(rows) < page_size:
+                return
+            last_task_id = rows[-1][0]
+
+    def count(
+        self,
+        phase: str,
+        status: Optional[TaskStatus] = None,
+        validation_passed: Optional[bool] = None
+    ) -> int:
+        """Number of a phase's Tasks matching the filters (see iter_tasks())."""
+        where, parameters = self._filters(phase, status, validation_passed)
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", parameters).fetchone()[0]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize per-phase status counts for logging/debugging."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT phase, status, COUNT(*) FROM tasks GROUP BY phase, status"
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for phase, status, count in rows:
+            counts.setdefault(phase, {})[status] = count
+        return {
+            "path": self.path,
+            "worker_id": self.worker_id,
+            "counts": counts
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _task_type(self, phase: str) -> Type[Task]:
+        if phase not in self.task_types:
+            raise ValueError(f"No Task type registered for phase {phase!r}")
+        return self.task_types[phase]
+
+    def _filters(
+        self,
+        phase: str,
+        status: Optional[TaskStatus],
+        validation_passed: Optional[bool]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        clauses = ["phase = ?"]
+        parameters: List[Any] = [phase]
+        if status is not None:
+            clauses.append("status = ?")
+            parameters.append(status.value)
+        if validation_passed is not None:
+            clauses.append("validation_passed = ?")
+            parameters.append(int(validation_passed))
+        return " AND ".join(clauses), tuple(parameters)
+
+    def _outcome_row(self, outcome: ExpertInvocationOutcome, now: float) -> Tuple[Any, ...]:
+        task = outcome.task
+        report: Optional[ValidationReport] = outcome.validation_report
+        if outcome.error is not None:
+            # Invocation raised: retry on a later lease unless attempts are used up. Checked
+            # before the work item, which a requeued or rebuilt Task may already carry
+            settled_status = None
+        elif report is None or report.passed:
+            settled_status = TaskStatus.COMPLETED.value
+        else:
+            settled_status = TaskStatus.FAILED.value
+
+        return (
+            settled_status, settled_status, self.max_attempts, TaskStatus.FAILED.value, TaskStatus.PENDING.value,
+            None if report is None else int(report.passed),
+            repr(outcome.error) if outcome.error else None,
+            json.dumps(report.to_json()) if report else None,
+            json.dumps(task.to_json()),
+            now,
+            task.task_id, TaskStatus.LEASED.value, self.worker_id
+        )
+
+    def _transaction(self, immediate: bool = False) -> "_Transaction":
+        return _Transaction(self._connection, immediate)
+
+
+class _Transaction:
+    # BEGIN ... COMMIT (ROLLBACK on error) on an autocommit-mode connection
+    def __init__(self, connection: sqlite3.Connection, immediate: bool):
+        self._connection = connection
+        self._immediate = immediate
+
+    def __enter__(self):
+        self._connection.execute("BEGIN IMMEDIATE" if self._immediate else "BEGIN")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
@@ -12,9 +12,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import logging
 from typing import Any, Dict, List
+import warnings
 
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.load import load
 from langchain_core.messages import BaseMessage
 from core.inference import InferenceRequest
+from core.scheduling import PRIORITY_DEFAULT
 
 
 logger = logging.getLogger(__name__)
@@ -87,17 +91,55 @@ class Task(ABC):
         """
         pass
 
-    def to_inference_task(self) -> InferenceRequest:
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> 'Task':
+        """
+        Rebuild a Task from its to_json() output (used to resume from checkpoints).
+
+        Concrete Task subclasses that support checkpoint/resume override this; use
+        context_from_json() for the context.
+
+        Args:
+            json_data: A dictionary produced by to_json()
+
+        Returns:
+            The rebuilt Task
+        """
+        raise NotImplementedError(f"{cls.__name__} does not implement from_json()")
+
+    def to_inference_task(self, priority: int = PRIORITY_DEFAULT) -> InferenceRequest:
         """
         Convert Task to InferenceRequest for LLM invocation.
 
         This method wraps the Task's conversation context into an InferenceRequest,
         which is the input to the inference engine.
 
+        Args:
+            priority: Scheduling priority for the request (lower is served first)
+
         Returns:
             InferenceRequest containing task_id and context
         """
         return InferenceRequest(
             task_id=self.task_id,
-            context=self.context
+            context=self.context,
+            priority=priority
         )
+
+
+def context_from_json(turns: List[Dict[str, Any]]) -> List[BaseMessage]:
+    """
+    Rebuild a Task context serialized by to_json() ([turn.to_json() for turn in context]).
+
+    Only LangChain message classes are revived, so checkpoint files can't instantiate
+    arbitrary objects.
+
+    Args:
+        turns: Serialized messages
+
+    Returns:
+        The messages, in order
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LangChainBetaWarning)
+        return [load(turn, allowed_objects="messages") for turn in turns]
@@ -0,0 +1,369 @@
+"""
+Telemetry for expert inference: latency, token usage, retries/throttles and tool-call outcomes.
+
+PATTERN DEMONSTRATED: Pluggable metrics sinks behind a narrow hook interface
+
+The inference engine and invoke_expert() emit one observation per LLM request and one per
+tool call. Where those observations go is up to the MetricsSink you plug into
+InferenceConfig.metrics:
+
+- InMemoryMetricsSink: Aggregates (counters + latency histograms) per label set, for tests,
+  benchmarks and ad-hoc inspection
+- PrometheusMetricsSink: The in-memory aggregates rendered in Prometheus text exposition format
+- JsonlMetricsSink: One JSON line per observation, for offline analysis
+- CompositeMetricsSink: Fan out to several sinks at once
+
+KEY CONCEPTS:
+- Labels: Every observation carries MetricLabels (expert, model, phase) from the Expert's
+  InferenceConfig, so capacity can be sized per Expert/model/phase
+- Queue wait vs service time: Time spent waiting for a scheduler slot or rate-limiter pacing is
+  reported separately from time spent in the provider call
+- Deduplicated and response-cache-served requests are recorded, but with zero tokens so
+  usage isn't double counted
+
+DESIGN CHOICE: Sinks subclass MetricsSink and override only what they need
+- Rationale: Same shape as BaseValidator; new backends (StatsD, CloudWatch) are one class each
+- Trade-off: Hooks run inline on the event loop, so sinks must be fast and non-blocking
+"""
+from dataclasses import asdict, dataclass, field, replace
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableBinding
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans sub-second cache/fake responses up to the 120s Bedrock read_timeout
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+@dataclass(frozen=True)
+class MetricLabels:
+    """
+    Dimensions attached to every observation.
+
+    Attributes:
+        expert: Which Expert made the call (e.g. "mapping", "transform")
+        model: Which model served it (e.g. "us.anthropic.claude-3-7-sonnet-20250219-v1:0")
+        phase: Which workflow phase the call belongs to (e.g. "mapping", "transform", "retry")
+    """
+    expert: str = ""
+    model: str = ""
+    phase: str = ""
+
+
+@dataclass
+class InferenceObservation:
+    """
+    Telemetry for a single inference request.
+
+    Attributes:
+        labels: Expert/model/phase dimensions
+        task_id: The request's task ID
+        succeeded: Whether the request produced a response
+        queue_wait_seconds: Time waiting for a scheduler slot and rate-limiter pacing
+        service_seconds: Time spent in the provider call(s)
+        input_tokens / output_tokens / cache_read_tokens: Provider-reported usage
+        retries: SDK-level retries reported by the provider
+        throttled: Whether throttling was observed (error or retries)
+        cache_hit: Served from the ResponseCache without calling the provider
+        deduplicated: Served by another request's in-flight call
+        error_type: Exception class name if the request failed
+    """
+    labels: MetricLabels
+    task_id: str
+    succeeded: bool
+    queue_wait_seconds: float = 0.0
+    service_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    retries: int = 0
+    throttled: bool = False
+    cache_hit: bool = False
+    deduplicated: bool = False
+    error_type: Optional[str] = None
+
+
+@dataclass
+class ToolCallObservation:
+    """
+    Telemetry for processing one LLM response into a work item (tool-call check + tool execution).
+
+    Attributes:
+        labels: Expert/model/phase dimensions
+        task_id: The task's ID
+        succeeded: Whether a tool call was present and the tool accepted its arguments
+        error_type: Exception class name if processing failed
+    """
+    labels: MetricLabels
+    task_id: str
+    succeeded: bool
+    error_type: Optional[str] = None
+
+
+def resolve_labels(labels: MetricLabels, llm: Runnable) -> MetricLabels:
+    """
+    Fill in an empty model label from the LLM's model ID.
+
+    Args:
+        labels: Labels from the InferenceConfig
+        llm: The Runnable the request was sent to (bound or unbound chat model)
+
+    Returns:
+        The labels, with `model` set if it was empty
+    """
+    if labels.model:
+        return labels
+    return replace(labels, model=_model_name(llm))
+
+
+def _model_name(llm: Runnable) -> str:
+    while isinstance(llm, RunnableBinding):
+        llm = llm.bound
+    for attribute in ("model_id", "model", "model_name"):
+        value = getattr(llm, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+    return llm.get_name()
+
+
+class MetricsSink:
+    """
+    Base class for telemetry backends. Override the hooks you care about; the defaults do nothing.
+
+    Hooks are called inline from the inference event loop, so implementations must be cheap.
+    """
+
+    def record_inference(self, observation: InferenceObservation):
+        pass
+
+    def record_tool_call(self, observation: ToolCallObservation):
+        pass
+
+
+class CompositeMetricsSink(MetricsSink):
+    """Forwards every observation to each of several sinks."""
+
+    def __init__(self, sinks: List[MetricsSink]):
+        self.sinks = sinks
+
+    def record_inference(self, observation: InferenceObservation):
+        for sink in self.sinks:
+            sink.record_inference(observation)
+
+    def record_tool_call(self, observation: ToolCallObservation):
+        for sink in self.sinks:
+            sink.record_tool_call(observation)
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)  # Per-bucket, plus a final +Inf bucket
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.total += value
+        self.count += 1
+        for index, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1  # +Inf bucket
+
+    def cumulative_counts(self) -> List[int]:
+        cumulative, running = [], 0
+        for bucket_count in self.counts:
+            running += bucket_count
+            cumulative.append(running)
+        return cumulative
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile (upper bound of the bucket containing it)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for upper_bound, cumulative in zip(self.buckets + (float("inf"),), self.cumulative_counts()):
+            if cumulative >= target:
+                return upper_bound
+        return float("inf")
+
+
+@dataclass
+class LabelAggregate:
+    """All aggregates for one MetricLabels combination."""
+    requests: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    deduplicated: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    retries: int = 0
+    throttles: int = 0
+    tool_calls: int = 0
+    tool_call_failures: int = 0
+    queue_wait: Histogram = field(default_factory=Histogram)
+    service_time: Histogram = field(default_factory=Histogram)
+
+    @property
+    def tool_call_success_rate(self) -> float:
+        return 1.0 - self.tool_call_failures / self.tool_calls if self.tool_calls else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "cache_hits": self.cache_hits,
+            "deduplicated": self.deduplicated,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "tool_calls": self.tool_calls,
+            "tool_call_success_rate": round(self.tool_call_success_rate, 4),
+            "queue_wait_p50": self.queue_wait.quantile(0.5),
+            "queue_wait_p99": self.queue_wait.quantile(0.99),
+            "service_time_p50": self.service_time.quantile(0.5),
+            "service_time_p99": self.service_time.quantile(0.99)
+        }
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Aggregates observations in memory, keyed by MetricLabels."""
+
+    def __init__(self):
+        self.aggregates: Dict[MetricLabels, LabelAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record_inference(self, observation: InferenceObservation):
+        with self._lock:
+            aggregate = self.aggregates.setdefault(observation.labels, LabelAggregate())
+            aggregate.requests += 1
+            aggregate.failures += 0 if observation.succeeded else 1
+            aggregate.cache_hits += 1 if observation.cache_hit else 0
+            aggregate.deduplicated += 1 if observation.deduplicated else 0
+            aggregate.input_tokens += observation.input_tokens
+            aggregate.output_tokens += observation.output_tokens
+            aggregate.cache_read_tokens += observation.cache_read_tokens
+            aggregate.retries += observation.retries
+            aggregate.throttles += 1 if observation.throttled else 0
+            aggregate.queue_wait.observe(observation.queue_wait_seconds)
+            if not observation.cache_hit and not observation.deduplicated:
+                aggregate.service_time.observe(observation.service_seconds)
+
+    def record_tool_call(self, observation: ToolCallObservation):
+        with self._lock:
+            aggregate = self.aggregates.setdefault(observation.labels, LabelAggregate())
+            aggregate.tool_calls += 1
+            aggregate.tool_call_failures += 0 if observation.succeeded else 1
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """Serialize all aggregates for logging/debugging."""
+        with self._lock:
+            return [
+                {"labels": asdict(labels), **aggregate.to_json()}
+                for labels, aggregate in self.aggregates.items()
+            ]
+
+
+class PrometheusMetricsSink(InMemoryMetricsSink):
+    """
+    In-memory aggregates exposed in Prometheus text exposition format.
+
+    Usage:
+        sink = PrometheusMetricsSink()
+        ...
+        # In your /metrics HTTP handler:
+        return Response(sink.render(), media_type="text/plain; version=0.0.4")
+    """
+
+    COUNTERS = (
+        ("llm_inference_requests_total", "Inference requests", "requests"),
+        ("llm_inference_failures_total", "Inference requests that ended in an error", "failures"),
+        ("llm_response_cache_hits_total", "Requests served from the response cache", "cache_hits"),
+        ("llm_deduplicated_requests_total", "Requests served by another in-flight request", "deduplicated"),
+        ("llm_input_tokens_total", "Provider-reported input tokens", "input_tokens"),
+        ("llm_output_tokens_total", "Provider-reported output tokens", "output_tokens"),
+        ("llm_cache_read_tokens_total", "Input tokens served from the provider prompt cache", "cache_read_tokens"),
+        ("llm_retries_total", "SDK-level retries reported by the provider", "retries"),
+        ("llm_throttles_total", "Requests that observed throttling", "throttles"),
+        ("llm_tool_calls_total", "Responses processed into work items", "tool_calls"),
+        ("llm_tool_call_failures_total", "Responses with a missing or rejected tool call", "tool_call_failures"),
+    )
+    HISTOGRAMS = (
+        ("llm_queue_wait_seconds", "Time waiting for a scheduler slot or rate-limiter pacing", "queue_wait"),
+        ("llm_service_seconds", "Time spent in provider calls", "service_time"),
+    )
+
+    def render(self) -> str:
+        with self._lock:
+            items = list(self.aggregates.items())
+
+        lines = []
+        for metric_name, help_text, attribute in self.COUNTERS:
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} counter")
+            for labels, aggregate in items:
+                lines.append(f"{metric_name}{{{_format_labels(labels)}}} {getattr(aggregate, attribute)}")
+
+        for metric_name, help_text, attribute in self.HISTOGRAMS:
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} histogram")
+            for labels, aggregate in items:
+                histogram: Histogram = getattr(aggregate, attribute)
+                label_text = _format_labels(labels)
+                bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+                for bound, cumulative in zip(bounds, histogram.cumulative_counts()):
+                    lines.append(f'{metric_name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+                lines.append(f"{metric_name}_sum{{{label_text}}} {histogram.total}")
+                lines.append(f"{metric_name}_count{{{label_text}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: MetricLabels) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{name}="{escape(value)}"' for name, value in asdict(labels).items())
+
+
+class JsonlMetricsSink(MetricsSink):
+    """
+    Appends one JSON line per observation to a file.
+
+    Each line has a "kind" ("inference" or "tool_call"), a wall-clock "timestamp", and the
+    observation's fields.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8", buffering=1)  # Line-buffered
+        self._lock = threading.Lock()
+
+    def record_inference(self, observation: InferenceObservation):
+        self._write("inference", asdict(observation))
+
+    def record_tool_call(self, observation: ToolCallObservation):
+        self._write("tool_call", asdict(observation))
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def _write(self, kind: str, payload: Dict[str, Any]):
+        line = json.dumps({"kind": kind, "timestamp": time.time(), **payload})
+        with self._lock:
+            self._file.write(line + "\n")
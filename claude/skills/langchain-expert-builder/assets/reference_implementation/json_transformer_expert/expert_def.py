@@ -11,6 +11,7 @@ TODO: Replace the LLM configuration with your actual provider setup.
 import logging
 
 from core.experts import Expert
+from core.prompt_caching import PromptCacheStyle
 from json_transformer_expert.tool_def import (
     get_mapping_tool_bundle,
     get_transform_tool_bundle
@@ -75,7 +76,8 @@ def get_mapping_expert() -> Expert:
     #
     # return Expert(
     #     llm=llm_w_tools,
-    #     system_prompt_factory=get_mapping_system_prompt_factory(),
+    #     # Mark the static prompt prefix as cacheable by Bedrock (see core/prompt_caching.py)
+    #     system_prompt_factory=get_mapping_system_prompt_factory(PromptCacheStyle.BEDROCK),
     #     tools=tool_bundle
     # )
 
@@ -128,10 +130,18 @@ def get_transform_expert() -> Expert:
     # # Bind tools to LLM (forces structured output)
     # llm_w_tools = llm.bind_tools(tool_bundle.to_list())
     #
+    # # temp=0 makes responses reproducible, so identical contexts can be served from cache
+    # # (the mapping expert runs at temp=1 and deliberately does NOT enable caching)
+    # from core.caching import ResponseCache
+    # from core.inference import InferenceConfig
+    #
     # return Expert(
     #     llm=llm_w_tools,
-    #     system_prompt_factory=get_transform_system_prompt_factory(),
-    #     tools=tool_bundle
+    #     system_prompt_factory=get_transform_system_prompt_factory(PromptCacheStyle.BEDROCK),
+    #     tools=tool_bundle,
+    #     inference_config=InferenceConfig(
+    #         cache=ResponseCache(disk_path="transform_expert_cache.sqlite", ttl_seconds=7 * 24 * 3600)
+    #     )
     # )
 
     raise NotImplementedError(
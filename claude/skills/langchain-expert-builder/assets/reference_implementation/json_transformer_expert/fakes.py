@@ -0,0 +1,176 @@
+"""
+Fake LLM wiring for the JSON Transformer Experts.
+
+PATTERN DEMONSTRATED: Domain-aware tool argument factories for core.fake_llm.FakeChatModel
+
+The factories read the same XML-tagged sections the real model sees in the system prompt and
+produce arguments a competent model might: the mapping factory maps every leaf of
+<source_json> onto the same path, and the transform factory turns <field_mappings> into a
+transform() function that passes TransformCodeValidator. This keeps the rest of the workflow
+(tool execution, validation, the next phase) exercising real code paths under load.
+
+Usage:
+    mapping_expert = get_fake_mapping_expert(latency_median_seconds=6.0, throttle_rate=0.02)
+    transform_expert = get_fake_transform_expert(time_scale=0.01, invalid_code_rate=0.1)
+"""
+import json
+import random
+import re
+from typing import Any, Dict, List
+
+from langchain_core.messages import BaseMessage
+
+from core.experts import Expert
+from core.fake_llm import FakeChatModel
+from json_transformer_expert.prompting.generation import (
+    get_mapping_system_prompt_factory,
+    get_transform_system_prompt_factory
+)
+from json_transformer_expert.tool_def import get_mapping_tool_bundle, get_transform_tool_bundle
+
+
+def fake_mapping_report_args(context: List[BaseMessage], rng: random.Random) -> Dict[str, Any]:
+    """CreateMappingReport arguments mapping every leaf of the prompt's source JSON to the same path."""
+    source = _parse_json(_extract_section(context, "source_json"), default={})
+    leaf_paths = _leaf_paths(source)
+    return {
+        "mappings": [
+            {
+                "source_path": path,
+                "target_path": path,
+                "rationale": f"The source field '{path}' carries the same value as the target field."
+            }
+            for path in leaf_paths
+        ],
+        "data_type_analysis": rng.choice([
+            "Structured event record",
+            "Nested entity document",
+            "Flat key/value payload"
+        ])
+    }
+
+
+def make_fake_transform_code_args(invalid_code_rate: float = 0.0):
+    """
+    Build a GenerateTransformCode argument factory.
+
+    Args:
+        invalid_code_rate: Chance that the generated code has a syntax error (to exercise
+            validation and retry paths)
+
+    Returns:
+        Factory implementing the prompt's <field_mappings> as a transform() function
+    """
+    def factory(context: List[BaseMessage], rng: random.Random) -> Dict[str, Any]:
+        mappings = _parse_json(_extract_section(context, "field_mappings"), default=[])
+        lines = [
+            "def transform(source_json_str: str) -> dict:",
+            "    source = json.loads(source_json_str)",
+            "    output = {}",
+        ]
+        for mapping in mappings:
+            lines.append(
+                f"    _set_path(output, {mapping['target_path']!r}, _get_path(source, {mapping['source_path']!r}))"
+            )
+        lines.append("    return output")
+        transform_logic = "\n".join(lines)
+
+        if rng.random() < invalid_code_rate:
+            transform_logic = transform_logic.replace("def transform(", "def transform(:", 1)
+
+        return {
+            "dependency_setup": _DEPENDENCY_SETUP,
+            "transform_logic": transform_logic,
+            "rationale": f"Copies {len(mappings)} mapped field(s) from source to target paths."
+        }
+
+    return factory
+
+
+fake_transform_code_args = make_fake_transform_code_args()
+
+
+def get_fake_mapping_expert(**fake_llm_kwargs) -> Expert:
+    """
+    Create a mapping Expert backed by FakeChatModel.
+
+    Args:
+        **fake_llm_kwargs: FakeChatModel settings (latency_median_seconds, throttle_rate, seed, ...)
+    """
+    tool_bundle = get_mapping_tool_bundle()
+    llm = FakeChatModel(
+        tool_args_factories={"CreateMappingReport": fake_mapping_report_args},
+        **fake_llm_kwargs
+    )
+    return Expert(
+        llm=llm.bind_tools(tool_bundle.to_list()),
+        system_prompt_factory=get_mapping_system_prompt_factory(),
+        tools=tool_bundle
+    )
+
+
+def get_fake_transform_expert(invalid_code_rate: float = 0.0, **fake_llm_kwargs) -> Expert:
+    """
+    Create a transform Expert backed by FakeChatModel.
+
+    Args:
+        invalid_code_rate: Chance that generated code fails to parse
+        **fake_llm_kwargs: FakeChatModel settings (latency_median_seconds, throttle_rate, seed, ...)
+    """
+    tool_bundle = get_transform_tool_bundle()
+    llm = FakeChatModel(
+        tool_args_factories={"GenerateTransformCode": make_fake_transform_code_args(invalid_code_rate)},
+        **fake_llm_kwargs
+    )
+    return Expert(
+        llm=llm.bind_tools(tool_bundle.to_list()),
+        system_prompt_factory=get_transform_system_prompt_factory(),
+        tools=tool_bundle
+    )
+
+
+_DEPENDENCY_SETUP = '''import json
+
+
+def _get_path(data, path):
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _set_path(data, path, value):
+    keys = path.split(".")
+    for key in keys[:-1]:
+        data = data.setdefault(key, {})
+    data[keys[-1]] = value'''
+
+
+def _extract_section(context: List[BaseMessage], tag: str) -> str:
+    # Search the whole conversation text (content blocks included) for <tag>...</tag>
+    for message in context:
+        content = message.content
+        text = content if isinstance(content, str) else " ".join(
+            block.get("text", "") for block in content if isinstance(block, dict)
+        )
+        match = re.search(rf"<{tag}>\s*(.*?)\s*</{tag}>", text, re.DOTALL)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def _parse_json(text: str, default: Any) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return default
+
+
+def _leaf_paths(data: Any, prefix: str = "") -> List[str]:
+    if not isinstance(data, dict) or not data:
+        return [prefix] if prefix else []
+    paths = []
+    for key, value in data.items():
+        paths.extend(_leaf_paths(value, f"{prefix}.{key}" if prefix else str(key)))
+    return paths
@@ -44,6 +44,14 @@ class FieldMapping:
             "rationale": self.rationale
         }
 
+    @classmethod
+    def from_json(cls, json_data: Dict[str, str]) -> 'FieldMapping':
+        return cls(
+            source_path=json_data["source_path"],
+            target_path=json_data["target_path"],
+            rationale=json_data["rationale"]
+        )
+
 
 @dataclass
 class MappingReport:
@@ -63,6 +71,13 @@ class MappingReport:
             "data_type_analysis": self.data_type_analysis
         }
 
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> 'MappingReport':
+        return cls(
+            mappings=[FieldMapping.from_json(m) for m in json_data["mappings"]],
+            data_type_analysis=json_data["data_type_analysis"]
+        )
+
 
 @dataclass
 class TransformCode:
@@ -84,3 +99,11 @@ class TransformCode:
             "transform_logic": self.transform_logic,
             "rationale": self.rationale
         }
+
+    @classmethod
+    def from_json(cls, json_data: Dict[str, str]) -> 'TransformCode':
+        return cls(
+            dependency_setup=json_data["dependency_setup"],
+            transform_logic=json_data["transform_logic"],
+            rationale=json_data["rationale"]
+        )
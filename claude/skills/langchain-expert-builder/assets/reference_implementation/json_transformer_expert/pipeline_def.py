@@ -0,0 +1,176 @@
+"""
+Pipeline definition for the JSON Transformer workflow.
+
+PATTERN DEMONSTRATED: Declaring a multi-phase workflow as a core.pipeline.Pipeline
+
+The mapping → transform workflow as a two-phase DAG. Each TransformJob's TransformTask is built
+from its own finished MappingTask and submitted immediately, so transforms for early jobs run
+while mappings for later jobs are still in flight.
+
+KEY CONCEPTS:
+- Task factories carry the workflow's glue code: the transform task takes the mapping report
+  produced upstream (progressive detail loading, see prompting/generation.py)
+- Each phase gets its own concurrency cap, sized to its Expert's model quota
+- The transform phase validates generated code and feeds failures back for self-correction
+
+Usage:
+    pipeline = get_json_transformer_pipeline(get_mapping_expert(), get_transform_expert())
+    results = pipeline.run([TransformJob("orders", source_json, target_schema), ...])
+    for result in results:
+        if result.succeeded:
+            transform_code = result.tasks[TRANSFORM_PHASE].transform_code
+
+    # Large datasets: read jobs lazily and stream them through bounded queues
+    async for result in pipeline.astream(read_transform_jobs("jobs.jsonl"), queue_size=100):
+        save(result)
+
+    # Or keep tasks in a persistent repository that workers lease batches from
+    repository = get_json_transformer_task_repository("jobs/transform.sqlite")
+    repository.add(build_mapping_tasks(), phase=MAPPING_PHASE)
+    missing_reports = repository.iter_tasks(MAPPING_PHASE, status=TaskStatus.PENDING)
+"""
+from dataclasses import dataclass
+import json
+from typing import Dict, Iterator
+
+from langchain_core.messages import HumanMessage
+
+from core.experts import Expert
+from core.pipeline import Pipeline, PipelinePhase
+from core.task_repository import DEFAULT_LEASE_SECONDS, TaskRepository
+from core.tasks import Task
+from json_transformer_expert.task_def import MappingTask, TransformTask
+from json_transformer_expert.validators import TransformTaskValidator
+
+
+MAPPING_PHASE = "mapping"
+TRANSFORM_PHASE = "transform"
+
+
+@dataclass
+class TransformJob:
+    """
+    One input to the JSON Transformer pipeline.
+
+    Attributes:
+        job_id: Unique identifier; phase task IDs are derived from it
+        source_json: The source JSON to transform (as string)
+        target_schema: Description of the target schema structure
+    """
+    job_id: str
+    source_json: str
+    target_schema: str
+
+
+def read_transform_jobs(path: str) -> Iterator[TransformJob]:
+    """
+    Lazily read TransformJobs from a JSONL file, one job per line.
+
+    Each line holds "job_id", "target_schema" and "source_json" (a JSON string, or the source
+    document itself). Lines are read only as the pipeline asks for more work, so memory use
+    doesn't grow with the file size.
+
+    Args:
+        path: JSONL file to read
+
+    Yields:
+        One TransformJob per non-empty line
+    """
+    with open(path, encoding="utf-8") as jobs_file:
+        for line in jobs_file:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            source_json = job["source_json"]
+            yield TransformJob(
+                job_id=str(job["job_id"]),
+                source_json=source_json if isinstance(source_json, str) else json.dumps(source_json),
+                target_schema=job["target_schema"]
+            )
+
+
+def get_json_transformer_pipeline(
+    mapping_expert: Expert,
+    transform_expert: Expert,
+    mapping_concurrency: int = 20,
+    transform_concurrency: int = 20,
+    transform_max_attempts: int = 3
+) -> Pipeline:
+    """
+    Create the mapping → transform Pipeline.
+
+    Args:
+        mapping_expert: Expert for the mapping phase (see expert_def.get_mapping_expert())
+        transform_expert: Expert for the transform phase (see expert_def.get_transform_expert())
+        mapping_concurrency: Cap on in-flight mapping tasks
+        transform_concurrency: Cap on in-flight transform tasks
+        transform_max_attempts: Attempts per transform, with validation feedback between them
+
+    Returns:
+        Pipeline whose items are TransformJobs
+    """
+    def make_mapping_task(job: TransformJob, upstream: Dict[str, Task]) -> MappingTask:
+        return MappingTask(
+            task_id=f"{job.job_id}/{MAPPING_PHASE}",
+            context=[
+                mapping_expert.system_prompt_factory(job.source_json, job.target_schema),
+                HumanMessage(content="Create the mapping report for this source JSON and target schema.")
+            ],
+            source_json=job.source_json,
+            target_schema=job.target_schema
+        )
+
+    def make_transform_task(job: TransformJob, upstream: Dict[str, Task]) -> TransformTask:
+        mappings = [mapping.to_json() for mapping in upstream[MAPPING_PHASE].mapping_report.mappings]
+        return TransformTask(
+            task_id=f"{job.job_id}/{TRANSFORM_PHASE}",
+            context=[
+                transform_expert.system_prompt_factory(job.source_json, job.target_schema, mappings),
+                HumanMessage(content="Generate the transform code for these field mappings.")
+            ],
+            source_json=job.source_json,
+            target_schema=job.target_schema,
+            mappings=mappings
+        )
+
+    return Pipeline([
+        PipelinePhase(
+            name=MAPPING_PHASE,
+            expert=mapping_expert,
+            make_task=make_mapping_task,
+            max_concurrency=mapping_concurrency
+        ),
+        PipelinePhase(
+            name=TRANSFORM_PHASE,
+            expert=transform_expert,
+            make_task=make_transform_task,
+            depends_on=[MAPPING_PHASE],
+            max_concurrency=transform_concurrency,
+            validator=TransformTaskValidator(),
+            max_attempts=transform_max_attempts
+        ),
+    ])
+
+
+def get_json_transformer_task_repository(
+    path: str,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    max_attempts: int = 3
+) -> TaskRepository:
+    """
+    Open a TaskRepository holding this workflow's MappingTasks and TransformTasks.
+
+    Args:
+        path: SQLite database file (created if missing)
+        lease_seconds: How long leased Tasks stay claimed without a recorded outcome
+        max_attempts: Leases per Task before one whose invocations keep raising is FAILED
+
+    Returns:
+        TaskRepository with phases MAPPING_PHASE and TRANSFORM_PHASE
+    """
+    return TaskRepository(
+        path,
+        task_types={MAPPING_PHASE: MappingTask, TRANSFORM_PHASE: TransformTask},
+        lease_seconds=lease_seconds,
+        max_attempts=max_attempts
+    )
@@ -19,6 +19,11 @@ KEY CONCEPTS:
 - Progressive detail: Later phases use results from earlier phases to filter context
 - SystemMessage wraps the formatted prompt string
 
+PROMPT-PREFIX CACHING:
+- Factories take a PromptCacheStyle and emit the static template prefix, a provider cache
+  marker, then the formatted per-task suffix
+- Pass the style matching the Expert's LLM provider (see expert_def.py)
+
 WHY FACTORY PATTERN?
 - Separates prompt logic from Expert creation
 - Easy to test prompt generation independently
@@ -30,33 +35,45 @@ from typing import Callable, List
 
 from langchain_core.messages import SystemMessage
 
+from core.prompt_caching import PromptCacheStyle, build_system_message
 from json_transformer_expert.prompting.templates import (
-    mapping_prompt_template,
-    transform_prompt_template
+    mapping_prompt_prefix,
+    mapping_prompt_suffix,
+    transform_prompt_prefix,
+    transform_prompt_suffix
 )
 
 
-def get_mapping_system_prompt_factory() -> Callable[[str, str], SystemMessage]:
+def get_mapping_system_prompt_factory(
+    cache_style: PromptCacheStyle = PromptCacheStyle.NONE
+) -> Callable[[str, str], SystemMessage]:
     """
     Create factory for mapping phase system prompts.
 
     The factory takes source_json and target_schema at invocation time.
 
+    Args:
+        cache_style: Provider prompt-cache marker placed after the static template prefix
+
     Returns:
         Factory function: (source_json, target_schema) -> SystemMessage
     """
     def factory(source_json: str, target_schema: str) -> SystemMessage:
-        return SystemMessage(
-            content=mapping_prompt_template.format(
+        return build_system_message(
+            static_prefix=mapping_prompt_prefix,
+            dynamic_suffix=mapping_prompt_suffix.format(
                 source_json=source_json,
                 target_schema=target_schema
-            )
+            ),
+            cache_style=cache_style
         )
 
     return factory
 
 
-def get_transform_system_prompt_factory() -> Callable[[str, str, List[dict]], SystemMessage]:
+def get_transform_system_prompt_factory(
+    cache_style: PromptCacheStyle = PromptCacheStyle.NONE
+) -> Callable[[str, str, List[dict]], SystemMessage]:
     """
     Create factory for transform phase system prompts.
 
@@ -65,6 +82,9 @@ def get_transform_system_prompt_factory() -> Callable[[str, str, List[dict]], Sy
     - Filters target_schema to only include mapped paths
     - Reduces token count and focuses LLM on relevant schema subset
 
+    Args:
+        cache_style: Provider prompt-cache marker placed after the static template prefix
+
     Returns:
         Factory function: (source_json, target_schema, field_mappings) -> SystemMessage
     """
@@ -78,12 +98,14 @@ def get_transform_system_prompt_factory() -> Callable[[str, str, List[dict]], Sy
         # target_schema_filtered = filter_schema(target_schema, mapped_paths)
         target_schema_filtered = f"{target_schema}\n\n(In production: Filter to only include paths from mappings)"
 
-        return SystemMessage(
-            content=transform_prompt_template.format(
+        return build_system_message(
+            static_prefix=transform_prompt_prefix,
+            dynamic_suffix=transform_prompt_suffix.format(
                 source_json=source_json,
                 target_schema_filtered=target_schema_filtered,
                 field_mappings=json.dumps(field_mappings, indent=2)
-            )
+            ),
+            cache_style=cache_style
         )
 
     return factory
@@ -16,6 +16,9 @@ KEY CONCEPTS:
 - Use imperative language for instructions
 - Keep templates focused on single task
 - Placeholders match factory function parameters
+- Static content first: each template is split into a placeholder-free PREFIX (role, goal,
+  guidelines, call to action) and a SUFFIX holding the per-task data, so the prefix is
+  byte-identical across tasks and can be cached by the provider (see core/prompt_caching.py)
 
 TEMPLATE BEST PRACTICES:
 - Start with role/goal: "You are an AI assistant specialized in..."
@@ -29,7 +32,8 @@ TEMPLATE BEST PRACTICES:
 # MAPPING PHASE TEMPLATE
 # ============================================================================
 
-mapping_prompt_template = """You are an AI assistant specialized in analyzing JSON data structures and identifying field mappings.
+# Static prefix: identical for every mapping task (no placeholders), so it can be prompt-cached
+mapping_prompt_prefix = """You are an AI assistant specialized in analyzing JSON data structures and identifying field mappings.
 
 Your goal is to identify all meaningful field mappings between a source JSON document and a target schema.
 
@@ -41,6 +45,11 @@ Your goal is to identify all meaningful field mappings between a source JSON doc
 - Be thorough - don't skip fields that have valid mappings
 </guidelines>
 
+Analyze the source JSON and target schema below, then create a comprehensive mapping report.
+"""
+
+# Dynamic suffix: per-task data
+mapping_prompt_suffix = """
 <source_json>
 {source_json}
 </source_json>
@@ -48,16 +57,17 @@ Your goal is to identify all meaningful field mappings between a source JSON doc
 <target_schema>
 {target_schema}
 </target_schema>
-
-Analyze the source JSON and target schema, then create a comprehensive mapping report.
 """
 
+mapping_prompt_template = mapping_prompt_prefix + mapping_prompt_suffix
+
 
 # ============================================================================
 # TRANSFORM PHASE TEMPLATE
 # ============================================================================
 
-transform_prompt_template = """You are an AI assistant specialized in generating Python code for JSON transformations.
+# Static prefix: identical for every transform task (no placeholders), so it can be prompt-cached
+transform_prompt_prefix = """You are an AI assistant specialized in generating Python code for JSON transformations.
 
 Your goal is to generate clean, executable Python code that transforms source JSON to match a target schema.
 
@@ -70,6 +80,11 @@ Your goal is to generate clean, executable Python code that transforms source JS
 - Follow the identified field mappings exactly
 </guidelines>
 
+Generate Python transformation code that implements the field mappings below.
+"""
+
+# Dynamic suffix: per-task data
+transform_prompt_suffix = """
 <source_json>
 {source_json}
 </source_json>
@@ -82,6 +97,6 @@ The target schema has been filtered to include only the fields you identified in
 <field_mappings>
 {field_mappings}
 </field_mappings>
-
-Generate Python transformation code that implements these mappings.
 """
+
+transform_prompt_template = transform_prompt_prefix + transform_prompt_suffix
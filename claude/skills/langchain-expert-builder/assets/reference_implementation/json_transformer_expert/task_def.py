@@ -11,7 +11,8 @@ KEY CONCEPTS:
 - Tasks encapsulate inputs + work item (result)
 - set_work_item() enforces type safety at runtime with isinstance() check
 - get_tool_name() must match the StructuredTool name exactly
-- to_json() enables serialization for debugging/persistence
+- to_json() enables serialization for debugging/persistence; from_json() rebuilds a Task from
+  it (e.g. when resuming from core.checkpointing)
 
 WHEN TO USE THIS PATTERN:
 - Multi-phase workflows where each phase has distinct inputs/outputs
@@ -23,7 +24,7 @@ from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import BaseMessage
 
-from core.tasks import Task
+from core.tasks import Task, context_from_json
 from json_transformer_expert.models import MappingReport, TransformCode
 
 
@@ -63,6 +64,17 @@ class MappingTask(Task):
             "mapping_report": self.mapping_report.to_json() if self.mapping_report else None
         }
 
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> 'MappingTask':
+        mapping_report = json_data.get("mapping_report")
+        return cls(
+            task_id=json_data["task_id"],
+            context=context_from_json(json_data["context"]),
+            source_json=json_data["source_json"],
+            target_schema=json_data["target_schema"],
+            mapping_report=MappingReport.from_json(mapping_report) if mapping_report else None
+        )
+
 
 @dataclass
 class TransformTask(Task):
@@ -102,3 +114,15 @@ class TransformTask(Task):
             "context": [turn.to_json() for turn in self.context],
             "transform_code": self.transform_code.to_json() if self.transform_code else None
         }
+
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> 'TransformTask':
+        transform_code = json_data.get("transform_code")
+        return cls(
+            task_id=json_data["task_id"],
+            context=context_from_json(json_data["context"]),
+            source_json=json_data["source_json"],
+            target_schema=json_data["target_schema"],
+            mappings=json_data["mappings"],
+            transform_code=TransformCode.from_json(transform_code) if transform_code else None
+        )
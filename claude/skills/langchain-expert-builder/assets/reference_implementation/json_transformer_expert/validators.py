@@ -29,10 +29,12 @@ DESIGN CHOICE: Why custom exceptions?
 """
 import logging
 from types import ModuleType
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
+from core.base_validator import BaseValidator
 from core.validation_report import ValidationReport
 from json_transformer_expert.models import TransformCode
+from json_transformer_expert.task_def import TransformTask
 
 
 logger = logging.getLogger(__name__)
@@ -190,3 +192,51 @@ class TransformCodeValidator:
         # (See reference_implementation patterns for recursive validation pattern)
 
         report.output = output
+
+
+class TransformTaskValidator(BaseValidator):
+    """
+    BaseValidator adapter for TransformCodeValidator.
+
+    Lets transform-phase orchestration (e.g. core.cascade.CascadeExpert) validate a
+    TransformTask's work item without knowing how TransformCodeValidator is constructed.
+    """
+
+    def validate(self, result: TransformCode, task: TransformTask) -> ValidationReport:
+        return TransformCodeValidator(task.source_json, result).validate()
+
+
+def check_partial_transform_code(tool_name: str, partial_args: Dict[str, Any]) -> Optional[str]:
+    """
+    Early-abort check for a streaming GenerateTransformCode call (see core.streaming.StreamingGuard).
+
+    Works on partial arguments, so it only rejects output that can no longer become valid: a
+    transform() header that is complete but not valid Python. A missing transform() is left to
+    TransformCodeValidator, since imports, helpers and docstrings may come first at any length.
+
+    Args:
+        tool_name: Name of the tool being called
+        partial_args: Best-effort parse of the arguments generated so far
+
+    Returns:
+        Reason to abort, or None to keep streaming
+    """
+    transform_logic = partial_args.get("transform_logic")
+    if tool_name != "GenerateTransformCode" or not isinstance(transform_logic, str):
+        return None
+
+    start = transform_logic.find("def transform(")
+    if start < 0:
+        return None
+
+    end = transform_logic.find("\n", start)
+    if end < 0:
+        return None  # Header still being generated
+    header = transform_logic[start:end].rstrip()
+    if not header.endswith(":"):
+        return None  # Multi-line signature; leave it to full validation
+    try:
+        compile(f"{header}\n    pass\n", "<transform header>", "exec")
+    except SyntaxError as e:
+        return f"transform() header is not valid Python: {header!r} ({e.msg})"
+    return None